@@ -1,6 +1,10 @@
 """API routes for 2FA authentication with user signup and admin management."""
 
+import asyncio
+import base64
+import binascii
 import hmac
+import json
 import logging
 import re
 import secrets
@@ -8,23 +12,43 @@ import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 
-import bcrypt
 import jwt
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 from pydantic import BaseModel, EmailStr, Field, field_validator
-from sqlalchemy import select, or_, func
+from sqlalchemy import Float, delete, select, or_, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.config import get_settings
-from app.database import get_async_session, User, VerificationToken, ProfileStatus, Group, UserGroup
-from app.email import EmailClient
-from app.ldap import LDAPClient
+from app.database import (
+    get_async_session,
+    get_pool_stats,
+    trigram_search_enabled,
+    User,
+    VerificationToken,
+    ProfileStatus,
+    Group,
+    UserGroup,
+)
+from app.ldap import AsyncLDAPClient, LDAPClient
 from app.mfa import TOTPManager
-from app.redis import get_otp_client, RedisOTPClient
+from app.outbox import (
+    enqueue_admin_notification,
+    enqueue_verification_email,
+    enqueue_verification_sms,
+    enqueue_welcome_email,
+    get_outbox_dispatcher,
+)
+from app.redis import OTPVerifyResult, get_async_otp_client
 from app.redis.client import InMemoryOTPStorage
+from app.security import (
+    PasswordHashingOverloadedError,
+    hash_password,
+    verify_password,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +65,12 @@ class MFAMethod(str, Enum):
     SMS = "sms"
 
 
+class AdminBatchAction(str, Enum):
+    """Actions applied by the admin batch endpoint."""
+    ACTIVATE = "activate"
+    REJECT = "reject"
+
+
 # In-memory fallback storage for SMS verification codes (used when Redis is disabled)
 # Structure: {username: {"code": "...", "expires_at": timestamp, "phone_number": "..."}}
 # Note: When Redis is enabled, codes are stored in Redis with automatic TTL expiration
@@ -57,6 +87,12 @@ class HealthResponse(BaseModel):
     sms_enabled: bool = Field(..., description="Whether SMS 2FA is enabled")
 
 
+class PoolStatsResponse(BaseModel):
+    """Connection pool statistics response model."""
+    status: str = Field(..., description="Health status")
+    pools: list[dict] = Field(..., description="Per-pool statistics")
+
+
 class SignupRequest(BaseModel):
     """User signup request model."""
     username: str = Field(..., min_length=3, max_length=64, description="Username")
@@ -204,9 +240,15 @@ class UserMFAStatusResponse(BaseModel):
 
 # Admin models
 class AdminUserListResponse(BaseModel):
-    """Admin user list response."""
+    """Admin user list response (one page)."""
     users: list[dict] = Field(..., description="List of users")
-    total: int = Field(..., description="Total count")
+    total: int = Field(..., description="Number of users in this page")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page (None on the last page)")
+
+
+class AdminUserCountResponse(BaseModel):
+    """Admin user count response."""
+    total: int = Field(..., description="Number of matching users")
 
 
 class AdminActivateRequest(BaseModel):
@@ -222,6 +264,28 @@ class AdminActivateResponse(BaseModel):
     message: str = Field(..., description="Response message")
 
 
+class AdminBatchRequest(BaseModel):
+    """Batch user activation/rejection request."""
+    action: AdminBatchAction = Field(..., description="Action to apply (activate or reject)")
+    user_ids: list[str] = Field(..., min_length=1, max_length=100, description="IDs of the users")
+    group_ids: list[str] = Field(default_factory=list, description="Group IDs to assign to activated users")
+
+
+class AdminBatchResult(BaseModel):
+    """Outcome of a batch action for one user."""
+    user_id: str = Field(..., description="User ID")
+    username: Optional[str] = Field(None, description="Username")
+    success: bool = Field(..., description="Whether the action succeeded")
+    message: str = Field(..., description="Result message")
+
+
+class AdminBatchResponse(BaseModel):
+    """Batch user activation/rejection response."""
+    succeeded: int = Field(..., description="Number of users the action succeeded for")
+    failed: int = Field(..., description="Number of users the action failed for")
+    results: list[AdminBatchResult] = Field(..., description="Per-user results")
+
+
 # Profile Models
 class ProfileResponse(BaseModel):
     """User profile response model."""
@@ -346,14 +410,28 @@ def _mask_email(email: str) -> str:
     return f"{masked}@{domain}"
 
 
-def _hash_password(password: str) -> str:
-    """Hash password using bcrypt."""
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+async def _hash_password(password: str) -> str:
+    """Hash password using bcrypt off the event loop."""
+    try:
+        return await hash_password(password)
+    except PasswordHashingOverloadedError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service is busy. Please try again shortly.",
+            headers={"Retry-After": "1"},
+        )
 
 
-def _verify_password(password: str, hashed: str) -> bool:
-    """Verify password against hash."""
-    return bcrypt.checkpw(password.encode(), hashed.encode())
+async def _verify_password(password: str, hashed: str) -> bool:
+    """Verify password against hash off the event loop."""
+    try:
+        return await verify_password(password, hashed)
+    except PasswordHashingOverloadedError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service is busy. Please try again shortly.",
+            headers={"Retry-After": "1"},
+        )
 
 
 def _get_sms_client():
@@ -419,6 +497,238 @@ async def _create_verification_token(
     return token
 
 
+# ============================================================================
+# Admin User List Helpers
+# ============================================================================
+
+# Sortable user columns; non-unique columns are tie-broken by id so that
+# every (sort value, id) key is distinct. "relevance" (with a search term)
+# ranks matches by trigram similarity instead.
+_USER_SORT_COLUMNS = {
+    "created_at": User.created_at,
+    "username": User.username,
+    "email": User.email,
+    "first_name": User.first_name,
+    "status": User.status,
+}
+_UNIQUE_USER_SORT_COLUMNS = {"username", "email"}
+
+# Columns matched by the admin search term (each has a trigram index)
+_USER_SEARCH_COLUMNS = (User.username, User.email, User.first_name, User.last_name)
+_GROUP_SEARCH_COLUMNS = (Group.name, Group.description)
+
+
+def _search_rank(search: str, *columns):
+    """Rank rows by the best pg_trgm word similarity of the search term."""
+    return func.greatest(
+        *(func.word_similarity(search, column) for column in columns),
+        type_=Float,
+    )
+
+
+def _resolve_user_sort(sort_by: Optional[str], search: Optional[str]) -> str:
+    """Validate a user sort field, falling back to created_at."""
+    if sort_by == "relevance":
+        return sort_by if search and trigram_search_enabled() else "created_at"
+    return sort_by if sort_by in _USER_SORT_COLUMNS else "created_at"
+
+
+def _user_sort_keys(sort_by: str, search: Optional[str] = None) -> list:
+    """Get the keyset expressions for a sort field."""
+    if sort_by == "relevance":
+        return [_search_rank(search, *_USER_SEARCH_COLUMNS), User.id]
+    keys = [_USER_SORT_COLUMNS[sort_by]]
+    if sort_by not in _UNIQUE_USER_SORT_COLUMNS:
+        keys.append(User.id)
+    return keys
+
+
+def _encode_user_cursor(sort_by: str, values: Sequence) -> str:
+    """Encode the keyset position after a row as an opaque cursor."""
+    encoded = []
+    for value in values:
+        if isinstance(value, datetime):
+            encoded.append(value.isoformat())
+        elif isinstance(value, float):
+            encoded.append(value)
+        else:
+            encoded.append(str(value))
+    raw = json.dumps([sort_by, encoded]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_user_cursor(cursor: str, sort_by: str, keys: list) -> list:
+    """Decode a cursor into keyset values for a sort field."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort_by, values = json.loads(raw)
+        if cursor_sort_by != sort_by or len(values) != len(keys):
+            raise ValueError("Cursor does not match sort field")
+        decoded = []
+        for key, value in zip(keys, values):
+            python_type = key.type.python_type
+            if python_type is datetime:
+                decoded.append(datetime.fromisoformat(value))
+            else:
+                decoded.append(python_type(value))
+        return decoded
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def _filter_users(
+    query,
+    status_filter: Optional[str] = None,
+    search: Optional[str] = None,
+    group_filter: Optional[str] = None,
+):
+    """Apply the admin user list filters to a query."""
+    if status_filter:
+        query = query.where(User.status == status_filter)
+
+    # Membership is checked with EXISTS on the (user_id, group_id) primary
+    # key; an unparseable group ID leaves the list unfiltered
+    if group_filter:
+        try:
+            group_uuid = uuid.UUID(group_filter)
+        except ValueError:
+            group_uuid = None
+        if group_uuid is not None:
+            query = query.where(
+                select(UserGroup.user_id)
+                .where(UserGroup.user_id == User.id, UserGroup.group_id == group_uuid)
+                .exists()
+            )
+
+    # Substring matches are served by the trigram GIN indexes
+    if search:
+        search_term = f"%{search}%"
+        query = query.where(
+            or_(*(column.ilike(search_term) for column in _USER_SEARCH_COLUMNS))
+        )
+    return query
+
+
+def _paginate_users(
+    query,
+    sort_by: str,
+    sort_order: str,
+    cursor: Optional[str],
+    limit: Optional[int],
+    search: Optional[str] = None,
+):
+    """
+    Apply keyset ordering, the cursor position and the page size to a query.
+
+    The sort key values are selected after the user so that the next cursor
+    can be built from the last row, and one row more than the page size is
+    fetched so that :func:`_split_user_page` can tell whether another page
+    follows. Relevance is always ordered best match first.
+
+    Returns:
+        Tuple of (query, page_size)
+    """
+    settings = get_settings()
+    page_size = min(limit or settings.admin_users_page_size, settings.admin_users_max_page_size)
+    keys = _user_sort_keys(sort_by, search)
+    descending = sort_by == "relevance" or sort_order != "asc"
+
+    if cursor:
+        position = tuple_(*keys)
+        values = tuple_(*_decode_user_cursor(cursor, sort_by, keys))
+        query = query.where(position < values if descending else position > values)
+
+    query = query.add_columns(*(key.label(f"sort_key_{i}") for i, key in enumerate(keys)))
+    query = query.order_by(*(key.desc() if descending else key.asc() for key in keys))
+    return query.limit(page_size + 1), page_size
+
+
+def _split_user_page(rows: Sequence, sort_by: str, page_size: int) -> tuple[list[User], Optional[str]]:
+    """Trim the extra row fetched by _paginate_users and build the next cursor."""
+    users = [row[0] for row in rows[:page_size]]
+    if len(rows) <= page_size:
+        return users, None
+    return users, _encode_user_cursor(sort_by, tuple(rows[page_size - 1])[1:])
+
+
+# ============================================================================
+# User-Group Assignment Helpers
+# ============================================================================
+
+def _parse_uuids(values: list[str]) -> list[uuid.UUID]:
+    """Parse UUID strings, skipping (and logging) invalid ones."""
+    parsed = []
+    for value in values:
+        try:
+            parsed.append(uuid.UUID(value))
+        except ValueError:
+            logger.warning("Invalid group ID format: %s", value)
+    return parsed
+
+
+async def _get_groups_by_ids(session: AsyncSession, group_ids: list[str]) -> list[Group]:
+    """Resolve group IDs with a single IN query; unknown IDs are skipped."""
+    group_uuids = _parse_uuids(group_ids)
+    if not group_uuids:
+        return []
+    result = await session.execute(select(Group).where(Group.id.in_(group_uuids)))
+    return list(result.scalars().all())
+
+
+async def _insert_user_groups(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    group_ids: list[uuid.UUID],
+    assigned_by: str,
+) -> set[uuid.UUID]:
+    """
+    Insert user-group assignments in one statement, skipping existing ones.
+
+    Returns:
+        IDs of the groups that were newly assigned
+    """
+    if not group_ids:
+        return set()
+    result = await session.execute(
+        pg_insert(UserGroup)
+        .values([
+            {"user_id": user_id, "group_id": group_id, "assigned_by": assigned_by}
+            for group_id in group_ids
+        ])
+        .on_conflict_do_nothing(index_elements=[UserGroup.user_id, UserGroup.group_id])
+        .returning(UserGroup.group_id)
+    )
+    return set(result.scalars().all())
+
+
+async def _list_user_groups(session: AsyncSession, user_id: uuid.UUID) -> list[dict]:
+    """Get a user's group assignments for a response."""
+    result = await session.execute(
+        select(UserGroup, Group.name)
+        .join(Group, Group.id == UserGroup.group_id)
+        .where(UserGroup.user_id == user_id)
+    )
+    return [
+        {
+            "id": str(ug.group_id),
+            "name": name,
+            "assigned_at": ug.assigned_at.isoformat() if ug.assigned_at else "",
+            "assigned_by": ug.assigned_by,
+        }
+        for ug, name in result.all()
+    ]
+
+
+def _log_ldap_membership_failures(username: str, results: dict[str, tuple[bool, str]]) -> None:
+    """Log the groups an LDAP membership change failed for."""
+    for group_dn, (success, msg) in results.items():
+        if not success:
+            logger.warning("LDAP group change for %s on %s failed: %s", username, group_dn, msg)
+
+
 # ============================================================================
 # JWT Helper Functions
 # ============================================================================
@@ -510,34 +820,6 @@ async def _require_admin(
     return current
 
 
-async def _send_admin_notification(user: User) -> None:
-    """Send notification email to admins about new user signup."""
-    try:
-        ldap_client = LDAPClient()
-        admin_emails = ldap_client.get_admin_emails()
-
-        if not admin_emails:
-            logger.warning("No admin emails found for notification")
-            return
-
-        email_client = EmailClient()
-        new_user_data = {
-            "username": user.username,
-            "full_name": user.full_name,
-            "email": user.email,
-            "phone": user.full_phone_number,
-            "signup_time": user.created_at.isoformat() if user.created_at else datetime.now(timezone.utc).isoformat(),
-        }
-
-        success, msg = email_client.send_admin_notification_email(admin_emails, new_user_data)
-        if success:
-            logger.info("Admin notification sent for new user %s", user.username)
-        else:
-            logger.error("Failed to send admin notification: %s", msg)
-    except Exception as e:
-        logger.error("Error sending admin notification: %s", e)
-
-
 # ============================================================================
 # Health Check
 # ============================================================================
@@ -553,6 +835,15 @@ async def health_check() -> HealthResponse:
     )
 
 
+@router.get("/healthz/pools", response_model=PoolStatsResponse)
+async def pool_stats() -> PoolStatsResponse:
+    """Connection pool statistics for monitoring."""
+    return PoolStatsResponse(
+        status="healthy",
+        pools=[*LDAPClient().pool_stats(), get_pool_stats()],
+    )
+
+
 # ============================================================================
 # Signup Endpoints
 # ============================================================================
@@ -611,7 +902,7 @@ async def signup(
         last_name=request.last_name,
         phone_country_code=request.phone_country_code,
         phone_number=request.phone_number,
-        password_hash=_hash_password(request.password),
+        password_hash=await _hash_password(request.password),
         mfa_method=request.mfa_method.value,
         totp_secret=totp_secret,
         status=ProfileStatus.PENDING.value,
@@ -620,43 +911,29 @@ async def signup(
     await session.flush()
 
     email_sent = False
-    phone_sent = False
 
-    # Send email verification
+    # Queue email verification (delivered by the outbox dispatcher after commit)
     if settings.enable_email_verification:
-        try:
-            email_token = await _create_verification_token(
-                session, user.id, "email",
-                settings.email_verification_expiry_hours
-            )
-            email_client = EmailClient()
-            success, _ = email_client.send_verification_email(
-                to_email=user.email,
-                token=email_token,
-                username=user.username,
-                first_name=user.first_name,
-            )
-            email_sent = success
-        except Exception as e:
-            logger.error("Failed to send verification email: %s", e)
-
-    # Send phone verification
-    try:
-        phone_token = await _create_verification_token(
-            session, user.id, "phone",
-            expiry_hours=1,  # Phone codes expire faster
+        email_token = await _create_verification_token(
+            session, user.id, "email",
+            settings.email_verification_expiry_hours
         )
-        sms_client = _get_sms_client()
-        full_phone = f"{user.phone_country_code}{user.phone_number}"
-        success, _, _ = sms_client.send_verification_code(full_phone, phone_token)
-        phone_sent = success
-    except Exception as e:
-        logger.error("Failed to send verification SMS: %s", e)
+        enqueue_verification_email(session, user, email_token)
+        email_sent = True
 
-    await session.commit()
+    # Queue phone verification
+    phone_token = await _create_verification_token(
+        session, user.id, "phone",
+        expiry_hours=1,  # Phone codes expire faster
+    )
+    enqueue_verification_sms(session, user, phone_token)
+    phone_sent = True
 
-    # Send admin notification asynchronously (don't block response)
-    await _send_admin_notification(user)
+    # Queue admin notification (coalesced into a digest by the dispatcher)
+    enqueue_admin_notification(session, user)
+
+    await session.commit()
+    get_outbox_dispatcher().wake()
 
     logger.info("User %s signed up successfully", user.username)
 
@@ -845,20 +1122,9 @@ async def resend_verification(
             session, user.id, "email",
             settings.email_verification_expiry_hours
         )
-        email_client = EmailClient()
-        success, msg = email_client.send_verification_email(
-            to_email=user.email,
-            token=token,
-            username=user.username,
-            first_name=user.first_name,
-        )
+        enqueue_verification_email(session, user, token)
         await session.commit()
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=msg,
-            )
+        get_outbox_dispatcher().wake()
 
         return VerificationResponse(
             success=True,
@@ -877,16 +1143,9 @@ async def resend_verification(
         token = await _create_verification_token(
             session, user.id, "phone", expiry_hours=1
         )
-        sms_client = _get_sms_client()
-        full_phone = f"{user.phone_country_code}{user.phone_number}"
-        success, msg, _ = sms_client.send_verification_code(full_phone, token)
+        enqueue_verification_sms(session, user, token)
         await session.commit()
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=msg,
-            )
+        get_outbox_dispatcher().wake()
 
         return VerificationResponse(
             success=True,
@@ -999,7 +1258,7 @@ async def enroll(
         )
 
     # Verify password
-    if not _verify_password(request.password, user.password_hash):
+    if not await _verify_password(request.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid password",
@@ -1124,8 +1383,8 @@ async def login(
         )
 
     # Only ACTIVE users can login - verify against LDAP
-    ldap_client = LDAPClient()
-    auth_success, auth_message = ldap_client.authenticate(
+    ldap_client = AsyncLDAPClient()
+    auth_success, auth_message = await ldap_client.authenticate(
         request.username, request.password
     )
 
@@ -1154,23 +1413,37 @@ async def login(
 
     elif user.mfa_method == "sms":
         # Verify SMS code (from Redis or in-memory fallback)
-        otp_client = get_otp_client()
+        otp_client = get_async_otp_client()
         sms_code_data = None
 
         if otp_client.is_enabled and otp_client.is_connected:
-            # Use Redis for OTP retrieval
-            sms_code_data = otp_client.get_code(request.username)
+            # Verify and consume the code atomically in Redis
+            result = await otp_client.verify_and_consume(
+                request.username, request.verification_code
+            )
 
-            if not sms_code_data:
+            if result == OTPVerifyResult.NOT_FOUND:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="No verification code sent. Please request a code first.",
                 )
 
-            # Redis handles TTL expiration automatically, but we still get None if expired
-            if not hmac.compare_digest(
-                request.verification_code, sms_code_data["code"]
-            ):
+            if result == OTPVerifyResult.TOO_MANY_ATTEMPTS:
+                logger.warning(
+                    "Login failed for %s: Too many invalid SMS codes", request.username
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Too many invalid attempts. Please request a new code.",
+                )
+
+            if result == OTPVerifyResult.ERROR:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Failed to verify code. Please try again.",
+                )
+
+            if result != OTPVerifyResult.VALID:
                 logger.warning(
                     f"Login failed for {request.username}: Invalid SMS code"
                 )
@@ -1178,9 +1451,6 @@ async def login(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid verification code",
                 )
-
-            # Delete code after successful verification
-            otp_client.delete_code(request.username)
         else:
             # Fallback to in-memory storage
             sms_code_data = InMemoryOTPStorage.get_code(request.username)
@@ -1212,7 +1482,7 @@ async def login(
             InMemoryOTPStorage.delete_code(request.username)
 
     # Check if user is admin
-    is_admin = ldap_client.is_admin(request.username)
+    is_admin = await ldap_client.is_admin(request.username)
 
     # Generate JWT token
     token = _create_jwt_token(
@@ -1262,8 +1532,8 @@ async def send_sms_code(
 
     # For active users, verify against LDAP
     if user.status == ProfileStatus.ACTIVE.value:
-        ldap_client = LDAPClient()
-        auth_success, _ = ldap_client.authenticate(request.username, request.password)
+        ldap_client = AsyncLDAPClient()
+        auth_success, _ = await ldap_client.authenticate(request.username, request.password)
         if not auth_success:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1271,7 +1541,7 @@ async def send_sms_code(
             )
     else:
         # For non-active users, verify against stored password
-        if not _verify_password(request.password, user.password_hash):
+        if not await _verify_password(request.password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid username or password",
@@ -1298,10 +1568,10 @@ async def send_sms_code(
         )
 
     # Store code for verification (Redis or in-memory fallback)
-    otp_client = get_otp_client()
+    otp_client = get_async_otp_client()
     if otp_client.is_enabled and otp_client.is_connected:
         # Use Redis for OTP storage
-        stored = otp_client.store_code(
+        stored = await otp_client.store_code(
             username=request.username,
             code=code,
             phone_number=user.full_phone_number,
@@ -1370,32 +1640,32 @@ async def admin_list_users(
     admin_username: str,
     admin_password: str,
     status_filter: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size"),
     session: AsyncSession = Depends(get_async_session),
 ) -> AdminUserListResponse:
-    """List users (admin only)."""
+    """List users, newest first, one page at a time (admin only)."""
     # Verify admin credentials
-    ldap_client = LDAPClient()
-    auth_success, _ = ldap_client.authenticate(admin_username, admin_password)
+    ldap_client = AsyncLDAPClient()
+    auth_success, _ = await ldap_client.authenticate(admin_username, admin_password)
     if not auth_success:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid admin credentials",
         )
 
-    if not ldap_client.is_admin(admin_username):
+    if not await ldap_client.is_admin(admin_username):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required",
         )
 
     # Build query
-    query = select(User)
-    if status_filter:
-        query = query.where(User.status == status_filter)
-    query = query.order_by(User.created_at.desc())
+    query = _filter_users(select(User), status_filter=status_filter)
+    query, page_size = _paginate_users(query, "created_at", "desc", cursor, limit)
 
     result = await session.execute(query)
-    users = result.scalars().all()
+    users, next_cursor = _split_user_page(result.all(), "created_at", page_size)
 
     user_list = [
         {
@@ -1416,7 +1686,7 @@ async def admin_list_users(
         for u in users
     ]
 
-    return AdminUserListResponse(users=user_list, total=len(user_list))
+    return AdminUserListResponse(users=user_list, total=len(user_list), next_cursor=next_cursor)
 
 
 @router.post(
@@ -1438,6 +1708,7 @@ async def admin_activate_user(
     # Use JWT authentication if token provided, otherwise fall back to legacy admin credentials
     current = None
     admin_username = None
+    ldap_client = AsyncLDAPClient()
 
     if authorization and authorization.startswith("Bearer "):
         try:
@@ -1461,8 +1732,7 @@ async def admin_activate_user(
                 detail="Authentication required. Provide JWT token or admin credentials.",
             )
 
-        ldap_client = LDAPClient()
-        auth_success, _ = ldap_client.authenticate(
+        auth_success, _ = await ldap_client.authenticate(
             request.admin_username, request.admin_password
         )
         if not auth_success:
@@ -1471,7 +1741,7 @@ async def admin_activate_user(
                 detail="Invalid admin credentials",
             )
 
-        if not ldap_client.is_admin(request.admin_username):
+        if not await ldap_client.is_admin(request.admin_username):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Admin privileges required",
@@ -1509,7 +1779,7 @@ async def admin_activate_user(
 
     temp_password = secrets.token_urlsafe(16)
 
-    success, message = ldap_client.create_user(
+    success, message = await ldap_client.create_user(
         username=user.username,
         password=temp_password,
         first_name=user.first_name,
@@ -1540,7 +1810,7 @@ async def admin_activate_user(
                 continue
 
             # Add to LDAP group
-            success, msg = ldap_client.add_user_to_group(user.username, group.ldap_dn)
+            success, msg = await ldap_client.add_user_to_group(user.username, group.ldap_dn)
             if not success:
                 logger.warning("Failed to add %s to LDAP group %s: %s", user.username, group.name, msg)
             else:
@@ -1558,20 +1828,13 @@ async def admin_activate_user(
     user.activated_at = datetime.now(timezone.utc)
     user.activated_by = admin_username
     # Update password hash to match the temp password (user will use this until LDAP password reset)
-    user.password_hash = _hash_password(temp_password)
+    user.password_hash = await _hash_password(temp_password)
 
-    await session.commit()
+    # Queue welcome email
+    enqueue_welcome_email(session, user)
 
-    # Send welcome email
-    try:
-        email_client = EmailClient()
-        email_client.send_welcome_email(
-            to_email=user.email,
-            username=user.username,
-            first_name=user.first_name,
-        )
-    except Exception as e:
-        logger.error("Failed to send welcome email: %s", e)
+    await session.commit()
+    get_outbox_dispatcher().wake()
 
     logger.info("User %s activated by %s", user.username, admin_username)
 
@@ -1597,8 +1860,8 @@ async def admin_reject_user(
 ) -> AdminActivateResponse:
     """Reject and delete a user."""
     # Verify admin credentials
-    ldap_client = LDAPClient()
-    auth_success, _ = ldap_client.authenticate(
+    ldap_client = AsyncLDAPClient()
+    auth_success, _ = await ldap_client.authenticate(
         request.admin_username, request.admin_password
     )
     if not auth_success:
@@ -1607,7 +1870,7 @@ async def admin_reject_user(
             detail="Invalid admin credentials",
         )
 
-    if not ldap_client.is_admin(request.admin_username):
+    if not await ldap_client.is_admin(request.admin_username):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required",
@@ -1643,6 +1906,163 @@ async def admin_reject_user(
     )
 
 
+@router.post(
+    "/admin/users/batch",
+    response_model=AdminBatchResponse,
+    responses={
+        401: {"description": "Not authenticated"},
+        403: {"description": "Not admin"},
+        503: {"description": "Password hashing overloaded"},
+    },
+)
+async def admin_batch_users(
+    request: AdminBatchRequest,
+    authorization: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+) -> AdminBatchResponse:
+    """
+    Activate or reject several users at once (admin only).
+
+    The admin is validated once. Activation creates all LDAP entries over
+    one pooled connection (one UID counter update for the whole batch),
+    commits every status change and group assignment in one transaction,
+    and queues the welcome emails. Rejection deletes the users with one
+    statement. Each user gets its own result; failures don't stop the batch.
+    """
+    settings = get_settings()
+    current = await _require_admin(authorization, session)
+    admin_username = current["username"]
+
+    results: dict[str, AdminBatchResult] = {}
+
+    def _fail(user_id: str, message: str, username: Optional[str] = None) -> None:
+        results[user_id] = AdminBatchResult(
+            user_id=user_id, username=username, success=False, message=message,
+        )
+
+    # Resolve all users with one query
+    user_uuids = {}
+    for user_id in dict.fromkeys(request.user_ids):
+        try:
+            user_uuids[user_id] = uuid.UUID(user_id)
+        except ValueError:
+            _fail(user_id, "Invalid user ID format")
+
+    users_by_id = {}
+    if user_uuids:
+        result = await session.execute(
+            select(User).where(User.id.in_(list(user_uuids.values())))
+        )
+        users_by_id = {u.id: u for u in result.scalars().all()}
+
+    candidates: dict[str, User] = {}
+    for user_id, user_uuid in user_uuids.items():
+        user = users_by_id.get(user_uuid)
+        if user is None:
+            _fail(user_id, "User not found")
+        elif request.action == AdminBatchAction.ACTIVATE and user.status != ProfileStatus.COMPLETE.value:
+            _fail(user_id, f"User cannot be activated. Current status: {user.status}", user.username)
+        elif request.action == AdminBatchAction.REJECT and user.status == ProfileStatus.ACTIVE.value:
+            _fail(user_id, "Active users must be revoked instead", user.username)
+        else:
+            candidates[user_id] = user
+
+    if request.action == AdminBatchAction.REJECT:
+        if candidates:
+            await session.execute(
+                delete(User).where(User.id.in_([u.id for u in candidates.values()]))
+            )
+            await session.commit()
+        for user_id, user in candidates.items():
+            results[user_id] = AdminBatchResult(
+                user_id=user_id,
+                username=user.username,
+                success=True,
+                message=f"User {user.username} has been rejected and removed.",
+            )
+        logger.info("%s users rejected/deleted by %s", len(candidates), admin_username)
+
+    elif candidates:
+        groups = await _get_groups_by_ids(session, request.group_ids)
+        groups_by_dn = {g.ldap_dn: g for g in groups}
+
+        # Temporary passwords (see admin_activate_user), hashed before any
+        # LDAP change so that an overloaded hasher fails the batch cleanly
+        temp_passwords = {user_id: secrets.token_urlsafe(16) for user_id in candidates}
+        # Leave half of the hashing queue to logins and signups
+        hash_slots = asyncio.Semaphore(max(1, settings.password_hash_max_queue // 2))
+
+        async def _hash_temp_password(password: str) -> str:
+            async with hash_slots:
+                return await _hash_password(password)
+
+        password_hashes = dict(zip(
+            temp_passwords,
+            await asyncio.gather(*(_hash_temp_password(p) for p in temp_passwords.values())),
+        ))
+
+        ldap_results = await AsyncLDAPClient().create_users([
+            {
+                "username": user.username,
+                "password": temp_passwords[user_id],
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "email": user.email,
+                "group_dns": list(groups_by_dn),
+            }
+            for user_id, user in candidates.items()
+        ])
+
+        now = datetime.now(timezone.utc)
+        assignments = []
+        for user_id, user in candidates.items():
+            success, message, added_dns = ldap_results.get(
+                user.username, (False, "No result from LDAP", [])
+            )
+            if not success:
+                _fail(user_id, f"Failed to create LDAP user: {message}", user.username)
+                continue
+
+            user.status = ProfileStatus.ACTIVE.value
+            user.activated_at = now
+            user.activated_by = admin_username
+            user.password_hash = password_hashes[user_id]
+            assignments.extend(
+                {"user_id": user.id, "group_id": groups_by_dn[dn].id, "assigned_by": admin_username}
+                for dn in added_dns
+            )
+            enqueue_welcome_email(session, user)
+            results[user_id] = AdminBatchResult(
+                user_id=user_id,
+                username=user.username,
+                success=True,
+                message=f"User {user.username} activated successfully. A temporary password has been set.",
+            )
+
+        if assignments:
+            await session.execute(
+                pg_insert(UserGroup)
+                .values(assignments)
+                .on_conflict_do_nothing(index_elements=[UserGroup.user_id, UserGroup.group_id])
+            )
+
+        await session.commit()
+        get_outbox_dispatcher().wake()
+
+        logger.info(
+            "%s users activated by %s",
+            sum(1 for r in results.values() if r.success), admin_username,
+        )
+
+    ordered = [results[user_id] for user_id in dict.fromkeys(request.user_ids)]
+    succeeded = sum(1 for r in ordered if r.success)
+    return AdminBatchResponse(
+        succeeded=succeeded,
+        failed=len(ordered) - succeeded,
+        results=ordered,
+    )
+
+
 # ============================================================================
 # Profile Endpoints
 # ============================================================================
@@ -1824,7 +2244,7 @@ async def update_profile(
 )
 async def admin_list_groups(
     search: Optional[str] = Query(None, description="Search term"),
-    sort_by: Optional[str] = Query("name", description="Sort field"),
+    sort_by: Optional[str] = Query("name", description="Sort field (name, created_at or relevance)"),
     sort_order: Optional[str] = Query("asc", description="Sort order"),
     authorization: Optional[str] = Header(None),
     session: AsyncSession = Depends(get_async_session),
@@ -1834,31 +2254,40 @@ async def admin_list_groups(
 
     query = select(Group)
 
-    # Apply search
+    # Apply search (served by the trigram GIN indexes)
     if search:
         search_term = f"%{search}%"
         query = query.where(
-            or_(
-                Group.name.ilike(search_term),
-                Group.description.ilike(search_term),
-            )
+            or_(*(column.ilike(search_term) for column in _GROUP_SEARCH_COLUMNS))
         )
 
     # Apply sorting
-    if sort_by == "name":
-        order_col = Group.name
-    elif sort_by == "created_at":
-        order_col = Group.created_at
+    if sort_by == "relevance" and search and trigram_search_enabled():
+        query = query.order_by(
+            _search_rank(search, *_GROUP_SEARCH_COLUMNS).desc(), Group.name.asc()
+        )
     else:
-        order_col = Group.name
+        if sort_by == "created_at":
+            order_col = Group.created_at
+        else:
+            order_col = Group.name
 
-    if sort_order == "desc":
-        query = query.order_by(order_col.desc())
-    else:
-        query = query.order_by(order_col.asc())
+        if sort_order == "desc":
+            query = query.order_by(order_col.desc())
+        else:
+            query = query.order_by(order_col.asc())
+
+    # Member counts come from one grouped aggregate over user_groups
+    member_counts = (
+        select(UserGroup.group_id, func.count().label("member_count"))
+        .group_by(UserGroup.group_id)
+        .subquery()
+    )
+    query = query.outerjoin(
+        member_counts, member_counts.c.group_id == Group.id
+    ).add_columns(func.coalesce(member_counts.c.member_count, 0))
 
-    result = await session.execute(query.options(selectinload(Group.user_groups)))
-    groups = result.scalars().all()
+    result = await session.execute(query)
 
     group_list = [
         GroupResponse(
@@ -1866,10 +2295,10 @@ async def admin_list_groups(
             name=g.name,
             description=g.description,
             ldap_dn=g.ldap_dn,
-            member_count=len(g.user_groups) if g.user_groups else 0,
+            member_count=member_count,
             created_at=g.created_at.isoformat() if g.created_at else "",
         )
-        for g in groups
+        for g, member_count in result.all()
     ]
 
     return GroupListResponse(groups=group_list, total=len(group_list))
@@ -1903,8 +2332,8 @@ async def admin_create_group(
         )
 
     # Create LDAP group
-    ldap_client = LDAPClient()
-    success, message, ldap_dn = ldap_client.create_group(
+    ldap_client = AsyncLDAPClient()
+    success, message, ldap_dn = await ldap_client.create_group(
         name=request.name,
         description=request.description or "",
     )
@@ -2022,11 +2451,7 @@ async def admin_update_group(
             detail="Invalid group ID format",
         )
 
-    result = await session.execute(
-        select(Group).where(Group.id == group_uuid).options(
-            selectinload(Group.user_groups)
-        )
-    )
+    result = await session.execute(select(Group).where(Group.id == group_uuid))
     group = result.scalar_one_or_none()
 
     if not group:
@@ -2037,8 +2462,8 @@ async def admin_update_group(
 
     # Update LDAP group
     if request.description is not None:
-        ldap_client = LDAPClient()
-        success, message = ldap_client.update_group(
+        ldap_client = AsyncLDAPClient()
+        success, message = await ldap_client.update_group(
             group_dn=group.ldap_dn,
             description=request.description,
         )
@@ -2062,6 +2487,8 @@ async def admin_update_group(
         group.description = request.description
 
     await session.commit()
+    # The flush expired the deferred (raiseload) count; load it again
+    await session.refresh(group, ["member_count"])
 
     logger.info("Group %s updated", group.name)
 
@@ -2070,7 +2497,7 @@ async def admin_update_group(
         name=group.name,
         description=group.description,
         ldap_dn=group.ldap_dn,
-        member_count=len(group.user_groups) if group.user_groups else 0,
+        member_count=group.member_count,
         created_at=group.created_at.isoformat() if group.created_at else "",
     )
 
@@ -2113,8 +2540,8 @@ async def admin_delete_group(
     ldap_dn = group.ldap_dn
 
     # Delete from LDAP
-    ldap_client = LDAPClient()
-    success, message = ldap_client.delete_group(ldap_dn)
+    ldap_client = AsyncLDAPClient()
+    success, message = await ldap_client.delete_group(ldap_dn)
     if not success:
         logger.warning("Failed to delete LDAP group: %s", message)
 
@@ -2230,63 +2657,23 @@ async def admin_assign_user_groups(
             detail="User not found",
         )
 
-    ldap_client = LDAPClient()
-
-    for group_id in request.group_ids:
-        try:
-            group_uuid = uuid.UUID(group_id)
-        except ValueError:
-            continue
-
-        # Get group
-        result = await session.execute(select(Group).where(Group.id == group_uuid))
-        group = result.scalar_one_or_none()
-        if not group:
-            continue
-
-        # Check if already assigned
-        result = await session.execute(
-            select(UserGroup).where(
-                UserGroup.user_id == user_uuid,
-                UserGroup.group_id == group_uuid,
-            )
-        )
-        if result.scalar_one_or_none():
-            continue
-
-        # Add to LDAP group (only for active users)
-        if user.status == ProfileStatus.ACTIVE.value:
-            success, msg = ldap_client.add_user_to_group(user.username, group.ldap_dn)
-            if not success:
-                logger.warning("Failed to add %s to LDAP group: %s", user.username, msg)
+    # Resolve all groups at once and insert the missing assignments
+    target_groups = await _get_groups_by_ids(session, request.group_ids)
+    added = await _insert_user_groups(
+        session, user_uuid, [g.id for g in target_groups], current["username"]
+    )
 
-        # Add database assignment
-        user_group = UserGroup(
-            user_id=user_uuid,
-            group_id=group_uuid,
-            assigned_by=current["username"],
+    # Add to LDAP groups over one connection (only for active users)
+    if user.status == ProfileStatus.ACTIVE.value and added:
+        results = await AsyncLDAPClient().add_user_to_groups(
+            user.username, [g.ldap_dn for g in target_groups if g.id in added]
         )
-        session.add(user_group)
+        _log_ldap_membership_failures(user.username, results)
 
     await session.commit()
 
     # Return updated groups
-    result = await session.execute(
-        select(UserGroup).where(UserGroup.user_id == user_uuid).options(
-            selectinload(UserGroup.group)
-        )
-    )
-    user_groups = result.scalars().all()
-
-    groups = [
-        {
-            "id": str(ug.group_id),
-            "name": ug.group.name if ug.group else "",
-            "assigned_at": ug.assigned_at.isoformat() if ug.assigned_at else "",
-            "assigned_by": ug.assigned_by,
-        }
-        for ug in user_groups
-    ]
+    groups = await _list_user_groups(session, user_uuid)
 
     logger.info("Groups assigned to user %s", user.username)
 
@@ -2332,68 +2719,47 @@ async def admin_replace_user_groups(
             detail="User not found",
         )
 
-    ldap_client = LDAPClient()
-
-    # Get current assignments
+    # Get current assignments and the requested groups
     result = await session.execute(
-        select(UserGroup).where(UserGroup.user_id == user_uuid).options(
-            selectinload(UserGroup.group)
+        select(Group.id, Group.ldap_dn)
+        .join(UserGroup, UserGroup.group_id == Group.id)
+        .where(UserGroup.user_id == user_uuid)
+    )
+    current_dns = {group_id: ldap_dn for group_id, ldap_dn in result.all()}
+    target_groups = await _get_groups_by_ids(session, request.group_ids)
+    requested_ids = {g.id for g in target_groups}
+
+    # Only the difference is changed; kept assignments retain their metadata
+    removed_ids = [group_id for group_id in current_dns if group_id not in requested_ids]
+    if removed_ids:
+        await session.execute(
+            delete(UserGroup).where(
+                UserGroup.user_id == user_uuid,
+                UserGroup.group_id.in_(removed_ids),
+            )
         )
+    added = await _insert_user_groups(
+        session, user_uuid, [g.id for g in target_groups], current["username"]
     )
-    current_assignments = result.scalars().all()
 
-    # Remove from LDAP groups (for active users)
+    # Apply the change to LDAP groups (for active users)
     if user.status == ProfileStatus.ACTIVE.value:
-        for ug in current_assignments:
-            if ug.group:
-                ldap_client.remove_user_from_group(user.username, ug.group.ldap_dn)
-
-    # Delete all current assignments
-    for ug in current_assignments:
-        await session.delete(ug)
-
-    # Add new assignments
-    for group_id in request.group_ids:
-        try:
-            group_uuid = uuid.UUID(group_id)
-        except ValueError:
-            continue
-
-        result = await session.execute(select(Group).where(Group.id == group_uuid))
-        group = result.scalar_one_or_none()
-        if not group:
-            continue
-
-        # Add to LDAP group (for active users)
-        if user.status == ProfileStatus.ACTIVE.value:
-            ldap_client.add_user_to_group(user.username, group.ldap_dn)
-
-        user_group = UserGroup(
-            user_id=user_uuid,
-            group_id=group_uuid,
-            assigned_by=current["username"],
-        )
-        session.add(user_group)
+        ldap_client = AsyncLDAPClient()
+        if removed_ids:
+            results = await ldap_client.remove_user_from_groups(
+                user.username, [current_dns[group_id] for group_id in removed_ids]
+            )
+            _log_ldap_membership_failures(user.username, results)
+        if added:
+            results = await ldap_client.add_user_to_groups(
+                user.username, [g.ldap_dn for g in target_groups if g.id in added]
+            )
+            _log_ldap_membership_failures(user.username, results)
 
     await session.commit()
 
     # Return updated groups
-    result = await session.execute(
-        select(UserGroup).where(UserGroup.user_id == user_uuid).options(
-            selectinload(UserGroup.group)
-        )
-    )
-    user_groups = result.scalars().all()
-
-    groups = [
-        {
-            "id": str(ug.group_id),
-            "name": ug.group.name if ug.group else "",
-            "assigned_at": ug.assigned_at.isoformat() if ug.assigned_at else "",
-            "assigned_by": ug.assigned_by,
-        }
-        for ug in user_groups
-    ]
+    groups = await _list_user_groups(session, user_uuid)
 
     logger.info("Groups replaced for user %s", user.username)
 
@@ -2457,8 +2823,8 @@ async def admin_remove_user_from_group(
 
     # Remove from LDAP (for active users)
     if user.status == ProfileStatus.ACTIVE.value and user_group.group:
-        ldap_client = LDAPClient()
-        ldap_client.remove_user_from_group(user.username, user_group.group.ldap_dn)
+        ldap_client = AsyncLDAPClient()
+        await ldap_client.remove_user_from_group(user.username, user_group.group.ldap_dn)
 
     group_name = user_group.group.name if user_group.group else "Unknown"
     await session.delete(user_group)
@@ -2526,19 +2892,19 @@ async def admin_revoke_user(
             detail="Only active users can be revoked",
         )
 
-    ldap_client = LDAPClient()
+    ldap_client = AsyncLDAPClient()
 
     # Remove from all LDAP groups
     for ug in user.user_groups:
         if ug.group:
-            success, msg = ldap_client.remove_user_from_group(
+            success, msg = await ldap_client.remove_user_from_group(
                 user.username, ug.group.ldap_dn
             )
             if not success:
                 logger.warning("Failed to remove %s from LDAP group: %s", user.username, msg)
 
     # Delete from LDAP
-    success, message = ldap_client.delete_user(user.username)
+    success, message = await ldap_client.delete_user(user.username)
     if not success:
         logger.warning("Failed to delete LDAP user: %s", message)
 
@@ -2572,64 +2938,39 @@ async def admin_list_users_enhanced(
     status_filter: Optional[str] = Query(None, description="Filter by status"),
     group_filter: Optional[str] = Query(None, description="Filter by group ID"),
     search: Optional[str] = Query(None, description="Search term"),
-    sort_by: Optional[str] = Query("created_at", description="Sort field"),
+    sort_by: Optional[str] = Query("created_at", description="Sort field (relevance ranks search matches)"),
     sort_order: Optional[str] = Query("desc", description="Sort order"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    limit: Optional[int] = Query(None, ge=1, description="Page size"),
     authorization: Optional[str] = Header(None),
     session: AsyncSession = Depends(get_async_session),
 ) -> AdminUserListResponse:
-    """List users with sorting, filtering, and search (admin only)."""
+    """List users with sorting, filtering, and search, one page at a time (admin only).
+
+    Pages are keyset-paginated on the sort field: pass ``next_cursor`` from
+    a response as ``cursor`` (with the same sort) to get the following page.
+    """
     await _require_admin(authorization, session)
 
+    sort_by = _resolve_user_sort(sort_by, search)
+
     query = select(User).options(
         selectinload(User.user_groups).selectinload(UserGroup.group)
     )
 
-    # Apply status filter
-    if status_filter:
-        query = query.where(User.status == status_filter)
-
-    # Apply search
-    if search:
-        search_term = f"%{search}%"
-        query = query.where(
-            or_(
-                User.username.ilike(search_term),
-                User.email.ilike(search_term),
-                User.first_name.ilike(search_term),
-                User.last_name.ilike(search_term),
-            )
-        )
-
-    # Apply sorting
-    if sort_by == "username":
-        order_col = User.username
-    elif sort_by == "email":
-        order_col = User.email
-    elif sort_by == "first_name":
-        order_col = User.first_name
-    elif sort_by == "status":
-        order_col = User.status
-    else:
-        order_col = User.created_at
+    # Apply status, group and search filters
+    query = _filter_users(
+        query,
+        status_filter=status_filter,
+        search=search,
+        group_filter=group_filter,
+    )
 
-    if sort_order == "asc":
-        query = query.order_by(order_col.asc())
-    else:
-        query = query.order_by(order_col.desc())
+    # Apply sorting and pagination
+    query, page_size = _paginate_users(query, sort_by, sort_order, cursor, limit, search=search)
 
     result = await session.execute(query)
-    users = result.scalars().all()
-
-    # Filter by group if specified
-    if group_filter:
-        try:
-            group_uuid = uuid.UUID(group_filter)
-            users = [
-                u for u in users
-                if any(ug.group_id == group_uuid for ug in u.user_groups)
-            ]
-        except ValueError:
-            pass
+    users, next_cursor = _split_user_page(result.all(), sort_by, page_size)
 
     user_list = [
         {
@@ -2654,4 +2995,30 @@ async def admin_list_users_enhanced(
         for u in users
     ]
 
-    return AdminUserListResponse(users=user_list, total=len(user_list))
+    return AdminUserListResponse(users=user_list, total=len(user_list), next_cursor=next_cursor)
+
+
+@router.get(
+    "/admin/users/count",
+    response_model=AdminUserCountResponse,
+    responses={401: {"description": "Not authenticated"}, 403: {"description": "Not admin"}},
+)
+async def admin_count_users(
+    status_filter: Optional[str] = Query(None, description="Filter by status"),
+    group_filter: Optional[str] = Query(None, description="Filter by group ID"),
+    search: Optional[str] = Query(None, description="Search term"),
+    authorization: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+) -> AdminUserCountResponse:
+    """Count users matching the user list filters (admin only)."""
+    await _require_admin(authorization, session)
+
+    query = _filter_users(
+        select(func.count()).select_from(User),
+        status_filter=status_filter,
+        search=search,
+        group_filter=group_filter,
+    )
+    total = (await session.execute(query)).scalar_one()
+
+    return AdminUserCountResponse(total=total)
@@ -0,0 +1,5 @@
+"""AWS module providing shared boto3 clients."""
+
+from app.aws.clients import get_ses_client, get_sns_client, init_aws_clients
+
+__all__ = ["get_ses_client", "get_sns_client", "init_aws_clients"]
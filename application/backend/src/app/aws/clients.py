@@ -0,0 +1,71 @@
+"""Process-wide boto3 clients for AWS SES and SNS.
+
+Creating a boto3 client resolves credentials, loads endpoint data and opens
+a new HTTPS connection pool, so clients are built once and shared. boto3
+clients are thread-safe once created.
+"""
+
+import logging
+import threading
+from typing import Any
+
+import boto3
+from botocore.config import Config
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_clients: dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _build_config() -> Config:
+    """Build the botocore config shared by all clients."""
+    settings = get_settings()
+    return Config(
+        region_name=settings.aws_region,
+        max_pool_connections=settings.aws_max_pool_connections,
+        tcp_keepalive=True,
+        connect_timeout=settings.aws_connect_timeout,
+        read_timeout=settings.aws_read_timeout,
+        retries={
+            "mode": "adaptive",
+            "total_max_attempts": settings.aws_max_attempts,
+        },
+    )
+
+
+def _get_client(service_name: str) -> Any:
+    """Get the shared client for an AWS service, creating it on first use."""
+    client = _clients.get(service_name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(service_name)
+            if client is None:
+                client = boto3.session.Session().client(
+                    service_name,
+                    config=_build_config(),
+                )
+                _clients[service_name] = client
+                logger.info("Created shared %s client", service_name.upper())
+    return client
+
+
+def get_ses_client() -> Any:
+    """Get the shared SES client."""
+    return _get_client("ses")
+
+
+def get_sns_client() -> Any:
+    """Get the shared SNS client."""
+    return _get_client("sns")
+
+
+def init_aws_clients() -> None:
+    """Create the clients for enabled features ahead of the first request."""
+    settings = get_settings()
+    if settings.enable_email_verification:
+        get_ses_client()
+    if settings.enable_sms_2fa:
+        get_sns_client()
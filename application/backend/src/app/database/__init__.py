@@ -5,8 +5,10 @@ from app.database.connection import (
     init_db,
     close_db,
     get_async_session,
+    get_pool_stats,
     AsyncSessionLocal,
 )
+from app.database.migrations import trigram_search_enabled
 from app.database.models import (
     Base,
     User,
@@ -14,6 +16,8 @@ from app.database.models import (
     ProfileStatus,
     Group,
     UserGroup,
+    OutboxMessage,
+    OutboxStatus,
 )
 
 __all__ = [
@@ -21,11 +25,15 @@ __all__ = [
     "init_db",
     "close_db",
     "get_async_session",
+    "get_pool_stats",
     "AsyncSessionLocal",
+    "trigram_search_enabled",
     "Base",
     "User",
     "VerificationToken",
     "ProfileStatus",
     "Group",
     "UserGroup",
+    "OutboxMessage",
+    "OutboxStatus",
 ]
@@ -2,16 +2,15 @@
 
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool
-
-from app.config import get_settings
+from app.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +19,36 @@ _engine = None
 AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
 
 
+def _engine_options(settings: Settings) -> dict[str, Any]:
+    """Build connection pool and asyncpg driver options for the engine.
+
+    In PgBouncer mode (transaction pooling) consecutive statements may run on
+    different server connections, so asyncpg's statement cache and
+    SQLAlchemy's prepared statement cache are disabled and every prepared
+    statement gets a unique name.
+    """
+    if settings.db_pgbouncer_mode:
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    else:
+        connect_args = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        }
+
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": connect_args,
+    }
+
+
 async def init_db() -> None:
     """Initialize database connection and create tables."""
     global _engine, AsyncSessionLocal
@@ -31,7 +60,7 @@ async def init_db() -> None:
     _engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,
-        poolclass=NullPool,  # Use NullPool for async
+        **_engine_options(settings),
     )
 
     AsyncSessionLocal = async_sessionmaker(
@@ -42,15 +71,31 @@ async def init_db() -> None:
         autoflush=False,
     )
 
-    # Create tables
-    from app.database.models import Base
+    # Create tables and indexes
+    from app.database.migrations import run_migrations
 
     async with _engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await run_migrations(conn)
 
     logger.info("Database initialized successfully")
 
 
+def get_pool_stats() -> dict:
+    """Get database connection pool statistics for monitoring."""
+    if _engine is None:
+        return {"name": "database", "initialized": False}
+
+    pool = _engine.pool
+    return {
+        "name": "database",
+        "initialized": True,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+
+
 async def close_db() -> None:
     """Close database connection."""
     global _engine, AsyncSessionLocal
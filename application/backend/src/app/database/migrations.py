@@ -0,0 +1,91 @@
+"""Idempotent schema migrations applied on startup.
+
+``create_all`` only creates missing tables, so indexes added to a model
+after its table exists are never created by it. These migrations bring an
+existing database up to the declared models and are safe to run on every
+start.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateIndex
+
+from app.config import get_settings
+from app.database.models import Base
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key serializing migrations when several replicas start at once
+_MIGRATION_LOCK_KEY = 7_243_020_001
+
+# pg_trgm GIN indexes serving admin substring search (ILIKE '%term%') and
+# similarity ranking: index name -> (table, column)
+_TRIGRAM_INDEXES = {
+    "ix_users_username_trgm": ("users", "username"),
+    "ix_users_email_trgm": ("users", "email"),
+    "ix_users_first_name_trgm": ("users", "first_name"),
+    "ix_users_last_name_trgm": ("users", "last_name"),
+    "ix_groups_name_trgm": ("groups", "name"),
+    "ix_groups_description_trgm": ("groups", "description"),
+}
+
+# Whether pg_trgm is installed and its indexes exist
+_trigram_enabled = False
+
+
+def trigram_search_enabled() -> bool:
+    """Check if trigram search (and relevance ranking) is available."""
+    return _trigram_enabled
+
+
+async def _create_trigram_indexes(conn: AsyncConnection) -> bool:
+    """Install pg_trgm and create the trigram indexes.
+
+    Returns:
+        True if the indexes exist, False if the extension is unavailable
+    """
+    try:
+        async with conn.begin_nested():
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except DBAPIError as e:
+        logger.warning(
+            "pg_trgm extension unavailable, admin search will scan tables: %s", e
+        )
+        return False
+
+    for name, (table, column) in _TRIGRAM_INDEXES.items():
+        await conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)"
+        ))
+    return True
+
+
+async def run_migrations(conn: AsyncConnection) -> None:
+    """
+    Create missing tables and indexes.
+
+    Runs in the caller's transaction; the advisory lock is released when
+    it ends.
+
+    Args:
+        conn: Connection inside an open transaction
+    """
+    global _trigram_enabled
+
+    await conn.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATION_LOCK_KEY}
+    )
+
+    await conn.run_sync(Base.metadata.create_all)
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            await conn.execute(CreateIndex(index, if_not_exists=True))
+
+    if get_settings().db_trigram_search:
+        _trigram_enabled = await _create_trigram_indexes(conn)
+
+    logger.info("Database migrations applied")
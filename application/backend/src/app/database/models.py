@@ -8,14 +8,16 @@ from typing import Optional
 from sqlalchemy import (
     Boolean,
     DateTime,
+    Integer,
     String,
     Text,
     ForeignKey,
     Index,
     func,
+    select,
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import DeclarativeBase, Mapped, column_property, mapped_column, relationship
 
 
 class Base(DeclarativeBase):
@@ -136,6 +138,11 @@ class User(Base):
     __table_args__ = (
         Index("ix_users_status_created", "status", "created_at"),
         Index("ix_users_phone", "phone_country_code", "phone_number"),
+        # Keyset pagination for each admin list sort (username and email
+        # are covered by their unique indexes)
+        Index("ix_users_created_id", "created_at", "id"),
+        Index("ix_users_first_name_id", "first_name", "id"),
+        Index("ix_users_status_id", "status", "id"),
     )
 
     @property
@@ -288,10 +295,7 @@ class Group(Base):
         cascade="all, delete-orphan",
     )
 
-    @property
-    def member_count(self) -> int:
-        """Get the number of members in this group."""
-        return len(self.user_groups) if self.user_groups else 0
+    # member_count (column property) is defined after UserGroup below
 
 
 class UserGroup(Base):
@@ -330,3 +334,70 @@ class UserGroup(Base):
         Index("ix_user_groups_user", "user_id"),
         Index("ix_user_groups_group", "group_id"),
     )
+
+
+# Number of members, counted by the database. Deferred (and raising instead
+# of lazy-loading under asyncio): load it with undefer(Group.member_count).
+Group.member_count = column_property(
+    select(func.count(UserGroup.user_id))
+    .where(UserGroup.group_id == Group.id)
+    .correlate_except(UserGroup)
+    .scalar_subquery(),
+    deferred=True,
+    raiseload=True,
+)
+
+
+class OutboxStatus(str, Enum):
+    """Delivery states of an outbox message."""
+
+    PENDING = "pending"  # Waiting for (re)delivery
+    SENT = "sent"  # Delivered successfully
+    FAILED = "failed"  # Gave up after the maximum number of attempts
+
+
+class OutboxMessage(Base):
+    """Outgoing email/SMS queued in the triggering transaction for later delivery."""
+
+    __tablename__ = "outbox_messages"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+
+    kind: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )  # e.g. "verification_email", "verification_sms"
+
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default=OutboxStatus.PENDING.value,
+        nullable=False,
+    )
+
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_outbox_messages_status_next_attempt", "status", "next_attempt_at"),
+    )
@@ -1,5 +1,6 @@
 """Email package for sending verification emails via AWS SES."""
 
 from app.email.client import EmailClient
+from app.email.templates import ensure_templates, render_template
 
-__all__ = ["EmailClient"]
+__all__ = ["EmailClient", "ensure_templates", "render_template"]
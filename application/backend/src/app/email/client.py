@@ -1,18 +1,44 @@
 """AWS SES email client for sending verification emails."""
 
+import json
 import logging
-from typing import Optional
+from typing import Any, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
+from app.aws import get_ses_client
 from app.config import Settings, get_settings
+from app.email.templates import (
+    ADMIN_DIGEST,
+    ADMIN_NOTIFICATION,
+    VERIFICATION,
+    WELCOME,
+    get_template_name,
+    render_template,
+)
 
 logger = logging.getLogger(__name__)
 
+# SES accepts at most 50 destinations per SendBulkTemplatedEmail call
+_BULK_MAX_DESTINATIONS = 50
+
+
+class BulkSendError(Exception):
+    """Some recipients of a bulk send were not reached."""
+
+    def __init__(self, failed: list[str], detail: str):
+        """Initialize with the recipients that were not reached."""
+        super().__init__(f"Bulk send failed for {len(failed)} recipients: {detail}")
+        self.failed = failed
+
 
 class EmailClient:
-    """Client for sending emails via AWS SES."""
+    """Client for sending emails via AWS SES.
+
+    With ``SES_USE_TEMPLATES`` enabled, emails are sent by SES template
+    name with only their template data; otherwise the same templates are
+    rendered locally and sent as full bodies.
+    """
 
     def __init__(self, settings: Optional[Settings] = None):
         """Initialize email client with settings."""
@@ -21,14 +47,138 @@ class EmailClient:
 
     @property
     def client(self):
-        """Get or create SES client."""
+        """Get the shared SES client."""
         if self._client is None:
-            self._client = boto3.client(
-                "ses",
-                region_name=self.settings.aws_region,
-            )
+            self._client = get_ses_client()
         return self._client
 
+    def _send_rendered(self, template: str, to_addresses: list[str], data: dict) -> str:
+        """Render a template locally and send it as one email."""
+        subject, html_body, text_body = render_template(template, data)
+        response = self.client.send_email(
+            Source=self.settings.ses_sender_email,
+            Destination={"ToAddresses": to_addresses},
+            Message={
+                "Subject": {"Data": subject, "Charset": "UTF-8"},
+                "Body": {
+                    "Text": {"Data": text_body, "Charset": "UTF-8"},
+                    "Html": {"Data": html_body, "Charset": "UTF-8"},
+                },
+            },
+        )
+        return response.get("MessageId", "unknown")
+
+    def _send_templated(self, template: str, to_addresses: list[str], data: dict) -> str:
+        """Send one email by SES template name."""
+        response = self.client.send_templated_email(
+            Source=self.settings.ses_sender_email,
+            Destination={"ToAddresses": to_addresses},
+            Template=get_template_name(template),
+            TemplateData=json.dumps(data),
+        )
+        return response.get("MessageId", "unknown")
+
+    def _send_bulk_templated(self, template: str, recipients: list[str], data: dict) -> str:
+        """Send a template to each recipient separately in bulk calls.
+
+        Every chunk is attempted; recipients that were not reached are
+        collected and reported together.
+
+        Raises:
+            BulkSendError: If some recipients were not reached
+        """
+        template_data = json.dumps(data)
+        failed: list[str] = []
+        details: list[str] = []
+        for start in range(0, len(recipients), _BULK_MAX_DESTINATIONS):
+            chunk = recipients[start:start + _BULK_MAX_DESTINATIONS]
+            try:
+                response = self.client.send_bulk_templated_email(
+                    Source=self.settings.ses_sender_email,
+                    Template=get_template_name(template),
+                    DefaultTemplateData=template_data,
+                    Destinations=[
+                        {"Destination": {"ToAddresses": [recipient]}} for recipient in chunk
+                    ],
+                )
+            except ClientError as e:
+                # Nothing was sent yet, so the caller can still fall back
+                if start == 0 and e.response.get("Error", {}).get("Code") == "TemplateDoesNotExist":
+                    raise
+                failed.extend(chunk)
+                details.append(str(e))
+                continue
+
+            statuses = response.get("Status", [])
+            for index, recipient in enumerate(chunk):
+                status = statuses[index] if index < len(statuses) else {}
+                if status.get("Status") != "Success":
+                    failed.append(recipient)
+                    details.append(f"{recipient}: {status.get('Error', status.get('Status'))}")
+
+        if failed:
+            raise BulkSendError(failed, details[0])
+        return f"bulk:{len(recipients)}"
+
+    def _send(
+        self,
+        label: str,
+        template: str,
+        to_addresses: list[str],
+        data: dict[str, Any],
+        bulk: bool = False,
+    ) -> tuple[bool, str, list[str]]:
+        """
+        Send a templated email, via SES templates when enabled.
+
+        Args:
+            label: Email description used in logs and messages
+            template: Template key
+            to_addresses: Recipient email addresses
+            data: Template data
+            bulk: Deliver a separate copy to each recipient in bulk calls
+
+        Returns:
+            Tuple of (success: bool, message: str, failed_recipients: list[str]).
+            failed_recipients is only set when a bulk send reached some
+            recipients but not these; on any other failure nobody got the email.
+        """
+        recipients = ", ".join(to_addresses) if len(to_addresses) == 1 else f"{len(to_addresses)} recipients"
+        try:
+            if not self.settings.ses_use_templates:
+                message_id = self._send_rendered(template, to_addresses, data)
+            else:
+                try:
+                    if bulk and len(to_addresses) > 1:
+                        message_id = self._send_bulk_templated(template, to_addresses, data)
+                    else:
+                        message_id = self._send_templated(template, to_addresses, data)
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") != "TemplateDoesNotExist":
+                        raise
+                    logger.warning(
+                        "SES template %s not registered, sending rendered email",
+                        get_template_name(template),
+                    )
+                    message_id = self._send_rendered(template, to_addresses, data)
+
+            logger.info("%s email sent to %s, MessageId: %s", label, recipients, message_id)
+            return True, f"{label} email sent successfully", []
+
+        except BulkSendError as e:
+            logger.error("Failed to send %s email to %s: %s", label.lower(), recipients, e)
+            return False, f"Failed to send email: {str(e)}", e.failed
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            error_message = e.response.get("Error", {}).get("Message", str(e))
+            logger.error("Failed to send %s email to %s: %s - %s", label.lower(), recipients, error_code, error_message)
+            return False, f"Failed to send email: {error_message}", []
+
+        except Exception as e:
+            logger.error("Unexpected error sending %s email to %s: %s", label.lower(), recipients, e)
+            return False, f"Failed to send email: {str(e)}", []
+
     def send_verification_email(
         self,
         to_email: str,
@@ -41,91 +191,22 @@ class EmailClient:
 
         Args:
             to_email: Recipient email address
-            token: Verification token (UUID)
+            token: Verification token
             username: User's username
             first_name: User's first name for personalization
 
         Returns:
             Tuple of (success: bool, message: str)
         """
-        verification_link = (
-            f"{self.settings.app_url}/verify-email?token={token}&username={username}"
-        )
-
-        subject = f"Verify your email - {self.settings.totp_issuer}"
-
-        html_body = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px 10px 0 0; text-align: center;">
-        <h1 style="color: white; margin: 0; font-size: 28px;">Email Verification</h1>
-    </div>
-    <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; border: 1px solid #e0e0e0; border-top: none;">
-        <p style="font-size: 16px;">Hello <strong>{first_name}</strong>,</p>
-        <p style="font-size: 16px;">Thank you for signing up! Please verify your email address by clicking the button below:</p>
-        <div style="text-align: center; margin: 30px 0;">
-            <a href="{verification_link}" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px 40px; text-decoration: none; border-radius: 5px; font-weight: bold; font-size: 16px; display: inline-block;">
-                Verify Email Address
-            </a>
-        </div>
-        <p style="font-size: 14px; color: #666;">Or copy and paste this link into your browser:</p>
-        <p style="font-size: 12px; color: #888; word-break: break-all; background: #fff; padding: 10px; border-radius: 5px; border: 1px solid #e0e0e0;">
-            {verification_link}
-        </p>
-        <p style="font-size: 14px; color: #666; margin-top: 30px;">
-            This link will expire in <strong>{self.settings.email_verification_expiry_hours} hours</strong>.
-        </p>
-        <hr style="border: none; border-top: 1px solid #e0e0e0; margin: 30px 0;">
-        <p style="font-size: 12px; color: #999; text-align: center;">
-            If you didn't create an account, you can safely ignore this email.
-        </p>
-    </div>
-</body>
-</html>
-"""
-
-        text_body = f"""
-Hello {first_name},
-
-Thank you for signing up! Please verify your email address by visiting the link below:
-
-{verification_link}
-
-This link will expire in {self.settings.email_verification_expiry_hours} hours.
-
-If you didn't create an account, you can safely ignore this email.
-"""
-
-        try:
-            response = self.client.send_email(
-                Source=self.settings.ses_sender_email,
-                Destination={"ToAddresses": [to_email]},
-                Message={
-                    "Subject": {"Data": subject, "Charset": "UTF-8"},
-                    "Body": {
-                        "Text": {"Data": text_body, "Charset": "UTF-8"},
-                        "Html": {"Data": html_body, "Charset": "UTF-8"},
-                    },
-                },
-            )
-            message_id = response.get("MessageId", "unknown")
-            logger.info("Verification email sent to %s, MessageId: %s", to_email, message_id)
-            return True, f"Verification email sent successfully"
-
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error("Failed to send email to %s: %s - %s", to_email, error_code, error_message)
-            return False, f"Failed to send email: {error_message}"
-
-        except Exception as e:
-            logger.error("Unexpected error sending email to %s: %s", to_email, e)
-            return False, f"Failed to send email: {str(e)}"
+        success, message, _ = self._send("Verification", VERIFICATION, [to_email], {
+            "first_name": first_name,
+            "verification_link": (
+                f"{self.settings.app_url}/verify-email?token={token}&username={username}"
+            ),
+            "expiry_hours": self.settings.email_verification_expiry_hours,
+            "issuer": self.settings.totp_issuer,
+        })
+        return success, message
 
     def send_welcome_email(
         self,
@@ -144,90 +225,34 @@ If you didn't create an account, you can safely ignore this email.
         Returns:
             Tuple of (success: bool, message: str)
         """
-        login_link = f"{self.settings.app_url}"
-
-        subject = f"Your account has been activated - {self.settings.totp_issuer}"
-
-        html_body = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-    <div style="background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 30px; border-radius: 10px 10px 0 0; text-align: center;">
-        <h1 style="color: white; margin: 0; font-size: 28px;">Account Activated!</h1>
-    </div>
-    <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; border: 1px solid #e0e0e0; border-top: none;">
-        <p style="font-size: 16px;">Hello <strong>{first_name}</strong>,</p>
-        <p style="font-size: 16px;">Great news! Your account has been approved and activated by an administrator.</p>
-        <p style="font-size: 16px;">You can now log in using your username <strong>{username}</strong> and the password you created during signup.</p>
-        <div style="text-align: center; margin: 30px 0;">
-            <a href="{login_link}" style="background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); color: white; padding: 15px 40px; text-decoration: none; border-radius: 5px; font-weight: bold; font-size: 16px; display: inline-block;">
-                Login Now
-            </a>
-        </div>
-        <p style="font-size: 14px; color: #666;">
-            Remember to have your authenticator app ready for two-factor authentication.
-        </p>
-        <hr style="border: none; border-top: 1px solid #e0e0e0; margin: 30px 0;">
-        <p style="font-size: 12px; color: #999; text-align: center;">
-            If you have any questions, please contact your system administrator.
-        </p>
-    </div>
-</body>
-</html>
-"""
-
-        text_body = f"""
-Hello {first_name},
-
-Great news! Your account has been approved and activated by an administrator.
-
-You can now log in using your username ({username}) and the password you created during signup.
-
-Login here: {login_link}
-
-Remember to have your authenticator app ready for two-factor authentication.
-
-If you have any questions, please contact your system administrator.
-"""
-
-        try:
-            response = self.client.send_email(
-                Source=self.settings.ses_sender_email,
-                Destination={"ToAddresses": [to_email]},
-                Message={
-                    "Subject": {"Data": subject, "Charset": "UTF-8"},
-                    "Body": {
-                        "Text": {"Data": text_body, "Charset": "UTF-8"},
-                        "Html": {"Data": html_body, "Charset": "UTF-8"},
-                    },
-                },
-            )
-            message_id = response.get("MessageId", "unknown")
-            logger.info("Welcome email sent to %s, MessageId: %s", to_email, message_id)
-            return True, "Welcome email sent successfully"
-
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error("Failed to send welcome email to %s: %s - %s", to_email, error_code, error_message)
-            return False, f"Failed to send email: {error_message}"
-
-        except Exception as e:
-            logger.error("Unexpected error sending welcome email to %s: %s", to_email, e)
-            return False, f"Failed to send email: {str(e)}"
+        success, message, _ = self._send("Welcome", WELCOME, [to_email], {
+            "first_name": first_name,
+            "username": username,
+            "login_link": f"{self.settings.app_url}",
+            "issuer": self.settings.totp_issuer,
+        })
+        return success, message
+
+    @staticmethod
+    def _user_details(user: dict) -> dict:
+        """Get the template fields describing a new user."""
+        return {
+            field: user.get(field) or "N/A"
+            for field in ("username", "full_name", "email", "phone", "signup_time")
+        }
 
     def send_admin_notification_email(
         self,
         admin_emails: list[str],
         new_user: dict,
-    ) -> tuple[bool, str]:
+    ) -> tuple[bool, str, list[str]]:
         """
         Send notification email to admins when a new user signs up.
 
+        With SES templates enabled each admin gets their own copy through
+        bulk sends, and admins that were not reached are reported back so
+        only they need a retry.
+
         Args:
             admin_emails: List of admin email addresses
             new_user: Dictionary with new user details:
@@ -238,117 +263,45 @@ If you have any questions, please contact your system administrator.
                 - signup_time: str (ISO format)
 
         Returns:
-            Tuple of (success: bool, message: str)
+            Tuple of (success: bool, message: str, failed_recipients: list[str])
         """
         if not admin_emails:
             logger.warning("No admin emails to send notification to")
-            return True, "No admin emails configured"
-
-        admin_dashboard_link = f"{self.settings.app_url}/#admin"
-
-        subject = f"New User Signup - {new_user.get('username', 'Unknown')} - {self.settings.totp_issuer}"
-
-        html_body = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-    <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 30px; border-radius: 10px 10px 0 0; text-align: center;">
-        <h1 style="color: white; margin: 0; font-size: 28px;">New User Registration</h1>
-    </div>
-    <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; border: 1px solid #e0e0e0; border-top: none;">
-        <p style="font-size: 16px;">A new user has registered and is awaiting approval.</p>
-
-        <div style="background: #fff; padding: 20px; border-radius: 8px; border: 1px solid #e0e0e0; margin: 20px 0;">
-            <h3 style="margin: 0 0 15px 0; color: #333; font-size: 18px;">User Details</h3>
-            <table style="width: 100%; border-collapse: collapse;">
-                <tr>
-                    <td style="padding: 8px 0; color: #666; width: 120px;">Username:</td>
-                    <td style="padding: 8px 0; font-weight: bold;">{new_user.get('username', 'N/A')}</td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0; color: #666;">Full Name:</td>
-                    <td style="padding: 8px 0; font-weight: bold;">{new_user.get('full_name', 'N/A')}</td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0; color: #666;">Email:</td>
-                    <td style="padding: 8px 0; font-weight: bold;">{new_user.get('email', 'N/A')}</td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0; color: #666;">Phone:</td>
-                    <td style="padding: 8px 0; font-weight: bold;">{new_user.get('phone', 'N/A')}</td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0; color: #666;">Signup Time:</td>
-                    <td style="padding: 8px 0; font-weight: bold;">{new_user.get('signup_time', 'N/A')}</td>
-                </tr>
-            </table>
-        </div>
-
-        <p style="font-size: 14px; color: #666;">
-            Once the user completes email and phone verification, you can approve or reject their account from the admin dashboard.
-        </p>
-
-        <div style="text-align: center; margin: 30px 0;">
-            <a href="{admin_dashboard_link}" style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 15px 40px; text-decoration: none; border-radius: 5px; font-weight: bold; font-size: 16px; display: inline-block;">
-                Review in Admin Dashboard
-            </a>
-        </div>
-
-        <hr style="border: none; border-top: 1px solid #e0e0e0; margin: 30px 0;">
-        <p style="font-size: 12px; color: #999; text-align: center;">
-            This is an automated notification from {self.settings.totp_issuer}.
-        </p>
-    </div>
-</body>
-</html>
-"""
-
-        text_body = f"""
-New User Registration
-
-A new user has registered and is awaiting approval.
-
-User Details:
-- Username: {new_user.get('username', 'N/A')}
-- Full Name: {new_user.get('full_name', 'N/A')}
-- Email: {new_user.get('email', 'N/A')}
-- Phone: {new_user.get('phone', 'N/A')}
-- Signup Time: {new_user.get('signup_time', 'N/A')}
-
-Once the user completes email and phone verification, you can approve or reject their account from the admin dashboard.
-
-Review in Admin Dashboard: {admin_dashboard_link}
-
-This is an automated notification from {self.settings.totp_issuer}.
-"""
+            return True, "No admin emails configured", []
 
-        try:
-            # Send to all admin emails
-            response = self.client.send_email(
-                Source=self.settings.ses_sender_email,
-                Destination={"ToAddresses": admin_emails},
-                Message={
-                    "Subject": {"Data": subject, "Charset": "UTF-8"},
-                    "Body": {
-                        "Text": {"Data": text_body, "Charset": "UTF-8"},
-                        "Html": {"Data": html_body, "Charset": "UTF-8"},
-                    },
-                },
-            )
-            message_id = response.get("MessageId", "unknown")
-            logger.info("Admin notification email sent to %s admins, MessageId: %s", len(admin_emails), message_id)
-            return True, "Admin notification email sent successfully"
+        return self._send("Admin notification", ADMIN_NOTIFICATION, admin_emails, {
+            **self._user_details(new_user),
+            "admin_dashboard_link": f"{self.settings.app_url}/#admin",
+            "issuer": self.settings.totp_issuer,
+        }, bulk=True)
 
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error("Failed to send admin notification email: %s - %s", error_code, error_message)
-            return False, f"Failed to send email: {error_message}"
+    def send_admin_digest_email(
+        self,
+        admin_emails: list[str],
+        new_users: list[dict],
+    ) -> tuple[bool, str, list[str]]:
+        """
+        Send a single notification email to admins listing several new signups.
 
-        except Exception as e:
-            logger.error("Unexpected error sending admin notification email: %s", e)
-            return False, f"Failed to send email: {str(e)}"
+        Args:
+            admin_emails: List of admin email addresses
+            new_users: List of new user dictionaries (same keys as
+                send_admin_notification_email)
+
+        Returns:
+            Tuple of (success: bool, message: str, failed_recipients: list[str])
+            (see send_admin_notification_email)
+        """
+        if not admin_emails:
+            logger.warning("No admin emails to send notification to")
+            return True, "No admin emails configured", []
+
+        if len(new_users) == 1:
+            return self.send_admin_notification_email(admin_emails, new_users[0])
+
+        return self._send("Admin digest", ADMIN_DIGEST, admin_emails, {
+            "count": len(new_users),
+            "users": [self._user_details(user) for user in new_users],
+            "admin_dashboard_link": f"{self.settings.app_url}/#admin",
+            "issuer": self.settings.totp_issuer,
+        }, bulk=True)
@@ -0,0 +1,347 @@
+"""Email templates shared by SES and the local renderer.
+
+Templates use the Handlebars subset understood by SES (``{{name}}`` and
+``{{#each items}}...{{/each}}``). When ``SES_USE_TEMPLATES`` is enabled
+they are registered with SES once and emails are sent with only their
+template data; otherwise (and in tests) :func:`render_template` produces
+the same subject and bodies locally.
+"""
+
+import html
+import logging
+import re
+from typing import Any, Callable, Optional
+
+from botocore.exceptions import ClientError
+
+from app.aws import get_ses_client
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Template keys
+VERIFICATION = "verification"
+WELCOME = "welcome"
+ADMIN_NOTIFICATION = "admin_notification"
+ADMIN_DIGEST = "admin_digest"
+
+
+class EmailTemplate:
+    """Subject, HTML and text parts of an email template."""
+
+    __slots__ = ("subject", "html", "text")
+
+    def __init__(self, subject: str, html: str, text: str) -> None:
+        self.subject = subject
+        self.html = html
+        self.text = text
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+</head>
+"""
+
+TEMPLATES: dict[str, EmailTemplate] = {
+    VERIFICATION: EmailTemplate(
+        subject="Verify your email - {{issuer}}",
+        html=_HTML_HEAD + """<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
+    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px 10px 0 0; text-align: center;">
+        <h1 style="color: white; margin: 0; font-size: 28px;">Email Verification</h1>
+    </div>
+    <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; border: 1px solid #e0e0e0; border-top: none;">
+        <p style="font-size: 16px;">Hello <strong>{{first_name}}</strong>,</p>
+        <p style="font-size: 16px;">Thank you for signing up! Please verify your email address by clicking the button below:</p>
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="{{verification_link}}" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px 40px; text-decoration: none; border-radius: 5px; font-weight: bold; font-size: 16px; display: inline-block;">
+                Verify Email Address
+            </a>
+        </div>
+        <p style="font-size: 14px; color: #666;">Or copy and paste this link into your browser:</p>
+        <p style="font-size: 12px; color: #888; word-break: break-all; background: #fff; padding: 10px; border-radius: 5px; border: 1px solid #e0e0e0;">
+            {{verification_link}}
+        </p>
+        <p style="font-size: 14px; color: #666; margin-top: 30px;">
+            This link will expire in <strong>{{expiry_hours}} hours</strong>.
+        </p>
+        <hr style="border: none; border-top: 1px solid #e0e0e0; margin: 30px 0;">
+        <p style="font-size: 12px; color: #999; text-align: center;">
+            If you didn't create an account, you can safely ignore this email.
+        </p>
+    </div>
+</body>
+</html>
+""",
+        text="""
+Hello {{first_name}},
+
+Thank you for signing up! Please verify your email address by visiting the link below:
+
+{{verification_link}}
+
+This link will expire in {{expiry_hours}} hours.
+
+If you didn't create an account, you can safely ignore this email.
+""",
+    ),
+    WELCOME: EmailTemplate(
+        subject="Your account has been activated - {{issuer}}",
+        html=_HTML_HEAD + """<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
+    <div style="background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 30px; border-radius: 10px 10px 0 0; text-align: center;">
+        <h1 style="color: white; margin: 0; font-size: 28px;">Account Activated!</h1>
+    </div>
+    <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; border: 1px solid #e0e0e0; border-top: none;">
+        <p style="font-size: 16px;">Hello <strong>{{first_name}}</strong>,</p>
+        <p style="font-size: 16px;">Great news! Your account has been approved and activated by an administrator.</p>
+        <p style="font-size: 16px;">You can now log in using your username <strong>{{username}}</strong> and the password you created during signup.</p>
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="{{login_link}}" style="background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); color: white; padding: 15px 40px; text-decoration: none; border-radius: 5px; font-weight: bold; font-size: 16px; display: inline-block;">
+                Login Now
+            </a>
+        </div>
+        <p style="font-size: 14px; color: #666;">
+            Remember to have your authenticator app ready for two-factor authentication.
+        </p>
+        <hr style="border: none; border-top: 1px solid #e0e0e0; margin: 30px 0;">
+        <p style="font-size: 12px; color: #999; text-align: center;">
+            If you have any questions, please contact your system administrator.
+        </p>
+    </div>
+</body>
+</html>
+""",
+        text="""
+Hello {{first_name}},
+
+Great news! Your account has been approved and activated by an administrator.
+
+You can now log in using your username ({{username}}) and the password you created during signup.
+
+Login here: {{login_link}}
+
+Remember to have your authenticator app ready for two-factor authentication.
+
+If you have any questions, please contact your system administrator.
+""",
+    ),
+    ADMIN_NOTIFICATION: EmailTemplate(
+        subject="New User Signup - {{username}} - {{issuer}}",
+        html=_HTML_HEAD + """<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
+    <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 30px; border-radius: 10px 10px 0 0; text-align: center;">
+        <h1 style="color: white; margin: 0; font-size: 28px;">New User Registration</h1>
+    </div>
+    <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; border: 1px solid #e0e0e0; border-top: none;">
+        <p style="font-size: 16px;">A new user has registered and is awaiting approval.</p>
+
+        <div style="background: #fff; padding: 20px; border-radius: 8px; border: 1px solid #e0e0e0; margin: 20px 0;">
+            <h3 style="margin: 0 0 15px 0; color: #333; font-size: 18px;">User Details</h3>
+            <table style="width: 100%; border-collapse: collapse;">
+                <tr>
+                    <td style="padding: 8px 0; color: #666; width: 120px;">Username:</td>
+                    <td style="padding: 8px 0; font-weight: bold;">{{username}}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px 0; color: #666;">Full Name:</td>
+                    <td style="padding: 8px 0; font-weight: bold;">{{full_name}}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px 0; color: #666;">Email:</td>
+                    <td style="padding: 8px 0; font-weight: bold;">{{email}}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px 0; color: #666;">Phone:</td>
+                    <td style="padding: 8px 0; font-weight: bold;">{{phone}}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px 0; color: #666;">Signup Time:</td>
+                    <td style="padding: 8px 0; font-weight: bold;">{{signup_time}}</td>
+                </tr>
+            </table>
+        </div>
+
+        <p style="font-size: 14px; color: #666;">
+            Once the user completes email and phone verification, you can approve or reject their account from the admin dashboard.
+        </p>
+
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="{{admin_dashboard_link}}" style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 15px 40px; text-decoration: none; border-radius: 5px; font-weight: bold; font-size: 16px; display: inline-block;">
+                Review in Admin Dashboard
+            </a>
+        </div>
+
+        <hr style="border: none; border-top: 1px solid #e0e0e0; margin: 30px 0;">
+        <p style="font-size: 12px; color: #999; text-align: center;">
+            This is an automated notification from {{issuer}}.
+        </p>
+    </div>
+</body>
+</html>
+""",
+        text="""
+New User Registration
+
+A new user has registered and is awaiting approval.
+
+User Details:
+- Username: {{username}}
+- Full Name: {{full_name}}
+- Email: {{email}}
+- Phone: {{phone}}
+- Signup Time: {{signup_time}}
+
+Once the user completes email and phone verification, you can approve or reject their account from the admin dashboard.
+
+Review in Admin Dashboard: {{admin_dashboard_link}}
+
+This is an automated notification from {{issuer}}.
+""",
+    ),
+    ADMIN_DIGEST: EmailTemplate(
+        subject="{{count}} New User Signups - {{issuer}}",
+        html=_HTML_HEAD + """<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px;">
+    <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 30px; border-radius: 10px 10px 0 0; text-align: center;">
+        <h1 style="color: white; margin: 0; font-size: 28px;">New User Registrations</h1>
+    </div>
+    <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; border: 1px solid #e0e0e0; border-top: none;">
+        <p style="font-size: 16px;">{{count}} new users have registered and are awaiting approval.</p>
+
+        <div style="background: #fff; padding: 20px; border-radius: 8px; border: 1px solid #e0e0e0; margin: 20px 0;">
+            <table style="width: 100%; border-collapse: collapse; font-size: 14px;">
+                <tr>
+                    <th style="padding: 8px; text-align: left; color: #666; border-bottom: 2px solid #e0e0e0;">Username</th>
+                    <th style="padding: 8px; text-align: left; color: #666; border-bottom: 2px solid #e0e0e0;">Full Name</th>
+                    <th style="padding: 8px; text-align: left; color: #666; border-bottom: 2px solid #e0e0e0;">Email</th>
+                    <th style="padding: 8px; text-align: left; color: #666; border-bottom: 2px solid #e0e0e0;">Signup Time</th>
+                </tr>{{#each users}}
+                <tr>
+                    <td style="padding: 8px; border-bottom: 1px solid #eee; font-weight: bold;">{{username}}</td>
+                    <td style="padding: 8px; border-bottom: 1px solid #eee;">{{full_name}}</td>
+                    <td style="padding: 8px; border-bottom: 1px solid #eee;">{{email}}</td>
+                    <td style="padding: 8px; border-bottom: 1px solid #eee; color: #666;">{{signup_time}}</td>
+                </tr>{{/each}}
+            </table>
+        </div>
+
+        <p style="font-size: 14px; color: #666;">
+            Once users complete email and phone verification, you can approve or reject their accounts from the admin dashboard.
+        </p>
+
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="{{admin_dashboard_link}}" style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 15px 40px; text-decoration: none; border-radius: 5px; font-weight: bold; font-size: 16px; display: inline-block;">
+                Review in Admin Dashboard
+            </a>
+        </div>
+
+        <hr style="border: none; border-top: 1px solid #e0e0e0; margin: 30px 0;">
+        <p style="font-size: 12px; color: #999; text-align: center;">
+            This is an automated notification from {{issuer}}.
+        </p>
+    </div>
+</body>
+</html>
+""",
+        text="""
+New User Registrations
+
+{{count}} new users have registered and are awaiting approval.
+{{#each users}}
+- {{username}} ({{full_name}}, {{email}}) at {{signup_time}}{{/each}}
+
+Once users complete email and phone verification, you can approve or reject their accounts from the admin dashboard.
+
+Review in Admin Dashboard: {{admin_dashboard_link}}
+
+This is an automated notification from {{issuer}}.
+""",
+    ),
+}
+
+# {{#each name}}...{{/each}} blocks and {{name}} variables, matched in one pass
+# so substituted values are never re-scanned
+_TOKEN_RE = re.compile(r"\{\{#each (\w+)\}\}(.*?)\{\{/each\}\}|\{\{(\w+)\}\}", re.DOTALL)
+_VAR_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+def _render_part(part: str, data: dict, escape: Callable[[str], str]) -> str:
+    """Substitute template data into one template part."""
+
+    def _value(context: dict, name: str) -> str:
+        value = context.get(name)
+        return "" if value is None else escape(str(value))
+
+    def _token(match: re.Match) -> str:
+        if match.group(3) is not None:
+            return _value(data, match.group(3))
+        body = match.group(2)
+        return "".join(
+            _VAR_RE.sub(lambda m, item=item: _value(item, m.group(1)), body)
+            for item in data.get(match.group(1)) or []
+        )
+
+    return _TOKEN_RE.sub(_token, part)
+
+
+def render_template(key: str, data: dict[str, Any]) -> tuple[str, str, str]:
+    """
+    Render a template locally, as SES would.
+
+    Values are HTML-escaped in the HTML part only.
+
+    Args:
+        key: Template key (e.g. ``VERIFICATION``)
+        data: Template data
+
+    Returns:
+        Tuple of (subject, html_body, text_body)
+
+    Raises:
+        KeyError: If the template key is unknown
+    """
+    template = TEMPLATES[key]
+    return (
+        _render_part(template.subject, data, str),
+        _render_part(template.html, data, html.escape),
+        _render_part(template.text, data, str),
+    )
+
+
+def get_template_name(key: str) -> str:
+    """Get the SES template name for a template key."""
+    return f"{get_settings().ses_template_prefix}{key}"
+
+
+def ensure_templates(client: Optional[Any] = None) -> int:
+    """
+    Create or update the SES templates from the local definitions.
+
+    Args:
+        client: SES client (defaults to the shared client)
+
+    Returns:
+        Number of templates registered
+
+    Raises:
+        ClientError: If SES rejects a template
+    """
+    client = client or get_ses_client()
+
+    for key, template in TEMPLATES.items():
+        definition = {
+            "TemplateName": get_template_name(key),
+            "SubjectPart": template.subject,
+            "HtmlPart": template.html,
+            "TextPart": template.text,
+        }
+        try:
+            client.update_template(Template=definition)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "TemplateDoesNotExist":
+                raise
+            client.create_template(Template=definition)
+            logger.info("Created SES template %s", definition["TemplateName"])
+
+    logger.info("Registered %s SES email templates", len(TEMPLATES))
+    return len(TEMPLATES)
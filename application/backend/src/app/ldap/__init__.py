@@ -1,5 +1,25 @@
 """LDAP client module for authentication operations."""
 
+from app.ldap.async_client import AsyncLDAPClient, shutdown_ldap_executor
 from app.ldap.client import LDAPClient
+from app.ldap.pool import (
+    LDAPConnectionPool,
+    close_ldap_pools,
+    get_admin_pool,
+    get_bind_pool,
+    get_write_pool,
+)
+from app.ldap.server import get_ldap_server, get_ldap_write_server
 
-__all__ = ["LDAPClient"]
+__all__ = [
+    "AsyncLDAPClient",
+    "LDAPClient",
+    "LDAPConnectionPool",
+    "close_ldap_pools",
+    "get_admin_pool",
+    "get_bind_pool",
+    "get_ldap_server",
+    "get_ldap_write_server",
+    "get_write_pool",
+    "shutdown_ldap_executor",
+]
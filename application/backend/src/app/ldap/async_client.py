@@ -0,0 +1,232 @@
+"""Async facade over LDAPClient for use from async request handlers."""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from app.config import Settings, get_settings
+from app.ldap.client import LDAPClient
+
+logger = logging.getLogger(__name__)
+
+TIMEOUT_MESSAGE = "LDAP operation timed out"
+
+# Dedicated executor so blocking ldap3 sockets never run on the event loop
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_ldap_executor() -> ThreadPoolExecutor:
+    """Get the shared, bounded thread pool used for LDAP operations."""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_settings().ldap_executor_workers,
+                    thread_name_prefix="ldap",
+                )
+    return _executor
+
+
+def shutdown_ldap_executor() -> None:
+    """Shut down the shared LDAP executor."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+class AsyncLDAPClient:
+    """Awaitable wrapper around :class:`LDAPClient`.
+
+    Each call runs the synchronous ldap3 operation on the dedicated LDAP
+    executor. Reads are bounded by a per-operation timeout; on timeout they
+    return the same failure value the synchronous client returns on an LDAP
+    error, so callers handle both cases identically.
+
+    Writes are never abandoned: the executor thread would still complete
+    the change, and reporting it as failed would let the database drift
+    from LDAP. They wait for the real outcome, which each LDAP request's
+    socket receive timeout keeps bounded.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        client: Optional[LDAPClient] = None,
+    ):
+        """Initialize the async LDAP client."""
+        self.settings = settings or get_settings()
+        self.client = client or LDAPClient(self.settings)
+
+    async def _run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        default: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a blocking LDAP call on the executor, bounded by a timeout."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        timeout = timeout if timeout is not None else self.settings.ldap_operation_timeout
+
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(get_ldap_executor(), call),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.error("LDAP operation %s timed out after %ss", func.__name__, timeout)
+            return default
+
+    async def _run_write(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a blocking LDAP write on the executor and wait for its outcome."""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            get_ldap_executor(), functools.partial(func, *args, **kwargs)
+        )
+        timeout = self.settings.ldap_operation_timeout
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "LDAP write %s still running after %ss, waiting for its outcome",
+                func.__name__, timeout,
+            )
+            return await future
+
+    async def authenticate(self, username: str, password: str) -> tuple[bool, str]:
+        """Authenticate a user against LDAP."""
+        return await self._run(
+            self.client.authenticate, username, password,
+            default=(False, TIMEOUT_MESSAGE),
+        )
+
+    async def user_exists(self, username: str) -> bool:
+        """Check if a user exists in LDAP."""
+        return await self._run(self.client.user_exists, username, default=False)
+
+    async def get_user_attribute(self, username: str, attribute: str) -> Optional[str]:
+        """Get a user attribute from LDAP."""
+        return await self._run(
+            self.client.get_user_attribute, username, attribute, default=None,
+        )
+
+    async def create_user(
+        self,
+        username: str,
+        password: str,
+        first_name: str,
+        last_name: str,
+        email: str,
+    ) -> tuple[bool, str]:
+        """Create a new user in LDAP."""
+        return await self._run_write(
+            self.client.create_user,
+            username=username,
+            password=password,
+            first_name=first_name,
+            last_name=last_name,
+            email=email,
+        )
+
+    async def create_users(self, users: list[dict]) -> dict[str, tuple[bool, str, list[str]]]:
+        """Create several users in LDAP over one connection."""
+        return await self._run_write(self.client.create_users, users)
+
+    async def delete_user(self, username: str) -> tuple[bool, str]:
+        """Delete a user from LDAP."""
+        return await self._run_write(self.client.delete_user, username)
+
+    async def is_admin(self, username: str) -> bool:
+        """Check if a user is a member of the admin group."""
+        return await self._run(self.client.is_admin, username, default=False)
+
+    async def add_user_to_group(self, username: str, group_dn: str) -> tuple[bool, str]:
+        """Add a user to an LDAP group."""
+        return await self._run_write(
+            self.client.add_user_to_group, username, group_dn,
+        )
+
+    async def remove_user_from_group(self, username: str, group_dn: str) -> tuple[bool, str]:
+        """Remove a user from an LDAP group."""
+        return await self._run_write(
+            self.client.remove_user_from_group, username, group_dn,
+        )
+
+    async def add_user_to_groups(
+        self,
+        username: str,
+        group_dns: list[str],
+    ) -> dict[str, tuple[bool, str]]:
+        """Add a user to several LDAP groups over one connection."""
+        return await self._run_write(
+            self.client.add_user_to_groups, username, group_dns,
+        )
+
+    async def remove_user_from_groups(
+        self,
+        username: str,
+        group_dns: list[str],
+    ) -> dict[str, tuple[bool, str]]:
+        """Remove a user from several LDAP groups over one connection."""
+        return await self._run_write(
+            self.client.remove_user_from_groups, username, group_dns,
+        )
+
+    async def list_groups(self, include_members: bool = False) -> list[dict]:
+        """List all LDAP groups."""
+        return await self._run(
+            self.client.list_groups, include_members=include_members, default=[],
+        )
+
+    async def create_group(
+        self,
+        name: str,
+        description: str = "",
+    ) -> tuple[bool, str, Optional[str]]:
+        """Create a new LDAP group."""
+        return await self._run_write(
+            self.client.create_group, name=name, description=description,
+        )
+
+    async def delete_group(self, group_dn: str) -> tuple[bool, str]:
+        """Delete an LDAP group."""
+        return await self._run_write(self.client.delete_group, group_dn)
+
+    async def update_group(
+        self,
+        group_dn: str,
+        description: Optional[str] = None,
+    ) -> tuple[bool, str]:
+        """Update an LDAP group's description."""
+        return await self._run_write(
+            self.client.update_group, group_dn=group_dn, description=description,
+        )
+
+    async def get_user_groups(self, username: str) -> list[dict]:
+        """Get all groups a user belongs to."""
+        return await self._run(self.client.get_user_groups, username, default=[])
+
+    async def get_admin_emails(self) -> list[str]:
+        """Get email addresses of all admin group members."""
+        return await self._run(self.client.get_admin_emails, default=[])
+
+    async def get_group_members(self, group_dn: str) -> list[str]:
+        """Get all members of a group."""
+        return await self._run(self.client.get_group_members, group_dn, default=[])
@@ -0,0 +1,127 @@
+"""In-process TTL cache for LDAP group membership lookups."""
+
+import threading
+import time
+from typing import Any, Hashable, Optional
+
+from app.config import get_settings
+
+_MISSING = object()
+
+
+def normalize_dn(dn: str) -> str:
+    """Normalize a DN for case- and whitespace-insensitive comparison."""
+    return ",".join(
+        "=".join(part.strip() for part in rdn.split("=", 1))
+        for rdn in dn.lower().split(",")
+    )
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire after a fixed TTL.
+
+    When ``max_entries`` is reached the oldest entry is evicted. The cache
+    also remembers when each key was last invalidated, so callers can
+    refill a recently changed entry from an authoritative source.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of each entry; 0 disables caching
+            max_entries: Maximum number of entries held
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._invalidated: dict[Hashable, float] = {}
+        self._cleared_at = float("-inf")
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Check if caching is enabled."""
+        return self._ttl > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or ``default`` if missing or expired."""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                self._misses += 1
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value for the configured TTL."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data.pop(key, None)
+            while len(self._data) >= self._max_entries:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self._ttl, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry and record when it was invalidated."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._invalidated.pop(key, None)
+            while len(self._invalidated) >= self._max_entries:
+                del self._invalidated[next(iter(self._invalidated))]
+            self._invalidated[key] = time.monotonic()
+
+    def clear(self) -> None:
+        """Remove all entries (each counts as invalidated now)."""
+        with self._lock:
+            self._data.clear()
+            self._invalidated.clear()
+            self._cleared_at = time.monotonic()
+
+    def invalidated_within(self, key: Hashable, seconds: float) -> bool:
+        """Check if ``key`` was invalidated less than ``seconds`` ago."""
+        with self._lock:
+            invalidated_at = max(
+                self._invalidated.get(key, float("-inf")), self._cleared_at
+            )
+            return time.monotonic() - invalidated_at < seconds
+
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# Process-wide membership cache shared by all LDAPClient instances
+_membership_cache: Optional[TTLCache] = None
+_membership_cache_lock = threading.Lock()
+
+
+def get_membership_cache() -> TTLCache:
+    """Get the shared group membership cache."""
+    global _membership_cache
+
+    if _membership_cache is None:
+        with _membership_cache_lock:
+            if _membership_cache is None:
+                settings = get_settings()
+                _membership_cache = TTLCache(
+                    ttl_seconds=settings.ldap_membership_cache_ttl,
+                    max_entries=settings.ldap_membership_cache_max_entries,
+                )
+    return _membership_cache
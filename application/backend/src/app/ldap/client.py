@@ -1,14 +1,37 @@
 """LDAP client for user authentication and management."""
 
 import logging
-from typing import Optional
+from typing import Iterator, Optional, Union
 
 import ldap3
-from ldap3 import ALL, MODIFY_ADD, MODIFY_DELETE, MODIFY_REPLACE, Connection, Server
-from ldap3.core.exceptions import LDAPException
+from ldap3 import (
+    BASE,
+    MODIFY_ADD,
+    MODIFY_DELETE,
+    MODIFY_REPLACE,
+    Connection,
+    Server,
+    ServerPool,
+)
+from ldap3.core.exceptions import (
+    LDAPEntryAlreadyExistsResult,
+    LDAPException,
+    LDAPNoSuchAttributeResult,
+    LDAPNoSuchObjectResult,
+    LDAPOperationResult,
+)
+from ldap3.utils.conv import escape_filter_chars
 from ldap3.utils.dn import escape_rdn
 
 from app.config import Settings, get_settings
+from app.ldap.cache import TTLCache, get_membership_cache, normalize_dn
+from app.ldap.pool import (
+    LDAPConnectionPool,
+    get_admin_pool,
+    get_bind_pool,
+    get_write_pool,
+)
+from app.ldap.server import get_ldap_server
 
 logger = logging.getLogger(__name__)
 
@@ -16,32 +39,82 @@ logger = logging.getLogger(__name__)
 class LDAPClient:
     """Client for LDAP authentication and user management operations."""
 
-    def __init__(self, settings: Optional[Settings] = None):
+    # Attempts to advance the UID counter before giving up
+    UID_ALLOCATION_RETRIES = 10
+
+    # Maximum number of OR terms per batched member lookup
+    FILTER_CHUNK_SIZE = 100
+
+    ADMIN_EMAILS_CACHE_KEY = ("admin_emails",)
+
+    GROUP_FILTER = (
+        "(|(objectClass=groupOfNames)(objectClass=groupOfUniqueNames)"
+        "(objectClass=posixGroup))"
+    )
+    MEMBER_ATTRIBUTES = ["member", "uniqueMember", "memberUid"]
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        admin_pool: Optional[LDAPConnectionPool] = None,
+        membership_cache: Optional[TTLCache] = None,
+        bind_pool: Optional[LDAPConnectionPool] = None,
+        write_pool: Optional[LDAPConnectionPool] = None,
+    ):
         """Initialize LDAP client with settings."""
         self.settings = settings or get_settings()
-        self._server: Optional[Server] = None
+        self._admin_pool = admin_pool
+        self._bind_pool = bind_pool
+        self._write_pool = write_pool
+        self._membership_cache = membership_cache
 
     @property
-    def server(self) -> Server:
-        """Get or create LDAP server connection."""
-        if self._server is None:
-            self._server = Server(
-                host=self.settings.ldap_host,
-                port=self.settings.ldap_port,
-                use_ssl=self.settings.ldap_use_ssl,
-                get_info=ALL,
-            )
-        return self._server
-
-    def _get_admin_connection(self) -> Connection:
-        """Get an admin connection to LDAP."""
-        return Connection(
-            self.server,
-            user=self.settings.ldap_admin_dn,
-            password=self.settings.ldap_admin_password,
-            auto_bind=True,
-            raise_exceptions=True,
-        )
+    def server(self) -> Union[Server, ServerPool]:
+        """Get the shared LDAP server (or replica pool) used for reads."""
+        return get_ldap_server()
+
+    @property
+    def admin_pool(self) -> LDAPConnectionPool:
+        """Get the pool of admin-bound connections."""
+        if self._admin_pool is None:
+            self._admin_pool = get_admin_pool()
+        return self._admin_pool
+
+    @property
+    def write_pool(self) -> LDAPConnectionPool:
+        """Get the pool of admin-bound connections to the writable master."""
+        if self._write_pool is None:
+            self._write_pool = get_write_pool()
+        return self._write_pool
+
+    @property
+    def bind_pool(self) -> LDAPConnectionPool:
+        """Get the pool of bind-only connections used by authenticate."""
+        if self._bind_pool is None:
+            self._bind_pool = get_bind_pool()
+        return self._bind_pool
+
+    def _admin_connection(self, write: bool = False):
+        """Check out a pooled admin connection (use as a context manager).
+
+        Args:
+            write: Use a connection to the writable master instead of a replica
+        """
+        pool = self.write_pool if write else self.admin_pool
+        return pool.connection()
+
+    @property
+    def membership_cache(self) -> TTLCache:
+        """Get the group membership cache."""
+        if self._membership_cache is None:
+            self._membership_cache = get_membership_cache()
+        return self._membership_cache
+
+    def pool_stats(self) -> list[dict]:
+        """Get connection pool statistics."""
+        pools = [self.admin_pool, self.write_pool, self.bind_pool]
+        unique = list({id(pool): pool for pool in pools}.values())
+        return [pool.stats() for pool in unique]
 
     def _get_user_search_base(self) -> str:
         """Get the full user search base DN."""
@@ -65,26 +138,133 @@ class LDAPClient:
         """Construct the group DN from group name."""
         return f"cn={group_name},{self._get_group_search_base()}"
 
-    def _get_next_uid_number(self, conn: Connection) -> int:
-        """Get the next available UID number."""
-        try:
-            conn.search(
-                search_base=self._get_user_search_base(),
-                search_filter="(objectClass=posixAccount)",
-                attributes=["uidNumber"],
-            )
+    def _get_uid_counter_dn(self) -> str:
+        """Get the DN of the uidNumber counter entry."""
+        return self.settings.ldap_uid_counter_dn or f"cn=uidNext,{self.settings.ldap_base_dn}"
 
-            max_uid = self.settings.ldap_uid_start
-            for entry in conn.entries:
-                if hasattr(entry, "uidNumber") and entry.uidNumber.value:
-                    uid = int(entry.uidNumber.value)
-                    if uid >= max_uid:
-                        max_uid = uid + 1
+    def _scan_next_uid_number(self, conn: Connection) -> int:
+        """
+        Get the next available UID number by scanning all posixAccounts.
 
-            return max_uid
-        except Exception as e:
-            logger.warning("Error getting next UID, using default: %s", e)
-            return self.settings.ldap_uid_start
+        The scan is paged, so the server size limit is never hit. Errors are
+        not swallowed: its result seeds the UID counter, and a wrong value
+        there would make every later allocation collide.
+
+        Raises:
+            LDAPException: If the scan fails
+        """
+        max_uid = self.settings.ldap_uid_start
+        for response in conn.extend.standard.paged_search(
+            search_base=self._get_user_search_base(),
+            search_filter="(objectClass=posixAccount)",
+            attributes=["uidNumber"],
+            paged_size=self.settings.ldap_search_page_size,
+            generator=True,
+        ):
+            if response.get("type") != "searchResEntry":
+                continue
+            for value in self._attribute_values(response["attributes"], "uidNumber"):
+                uid = int(value)
+                if uid >= max_uid:
+                    max_uid = uid + 1
+
+        return max_uid
+
+    def _allocate_uid_numbers(self, conn: Connection, count: int = 1) -> int:
+        """
+        Reserve ``count`` consecutive UID numbers from the counter entry.
+
+        The counter is advanced with a single modify that deletes the old
+        value and adds the new one, which the server applies atomically; if
+        another writer advanced it first the delete fails and we retry. The
+        full posixAccount scan only runs when the counter entry is missing,
+        and UIDs are only handed out once the counter exists.
+
+        Args:
+            conn: A pooled admin connection
+            count: Number of UID numbers to reserve
+
+        Returns:
+            The first reserved UID number
+
+        Raises:
+            LDAPException: If the counter could not be created or advanced
+        """
+        counter_dn = self._get_uid_counter_dn()
+
+        for _ in range(self.UID_ALLOCATION_RETRIES):
+            try:
+                conn.search(
+                    search_base=counter_dn,
+                    search_filter="(objectClass=*)",
+                    search_scope=BASE,
+                    attributes=["uidNumber"],
+                )
+                entry = conn.entries[0] if conn.entries else None
+            except LDAPNoSuchObjectResult:
+                entry = None
+
+            if entry is None or not entry.uidNumber.value:
+                # Counter missing: reconcile from the directory and create it
+                first_uid = self._scan_next_uid_number(conn)
+                try:
+                    conn.add(
+                        counter_dn,
+                        attributes={
+                            "objectClass": ["applicationProcess", "extensibleObject", "top"],
+                            "cn": "uidNext",
+                            "uidNumber": str(first_uid + count),
+                        },
+                    )
+                    logger.info("Created UID counter %s at %s", counter_dn, first_uid + count)
+                    return first_uid
+                except LDAPEntryAlreadyExistsResult:
+                    continue
+                except LDAPOperationResult as e:
+                    raise LDAPException(
+                        f"Could not create UID counter {counter_dn}: {e}"
+                    ) from e
+
+            current = int(entry.uidNumber.value)
+            try:
+                conn.modify(
+                    counter_dn,
+                    {
+                        "uidNumber": [
+                            (MODIFY_DELETE, [str(current)]),
+                            (MODIFY_ADD, [str(current + count)]),
+                        ]
+                    },
+                )
+                return current
+            except LDAPNoSuchAttributeResult:
+                # Another writer advanced the counter first
+                logger.debug("UID counter changed concurrently, retrying")
+
+        raise LDAPException(f"Could not allocate UID number from {counter_dn}")
+
+    def _restore_service_bind(self, conn: Connection) -> None:
+        """
+        Rebind a bind-pool connection as the service account before check-in.
+
+        Pooled connections must never stay bound as (and keep the password
+        of) the last user: health checks and reconnects would run as them.
+
+        Raises:
+            LDAPBindError: If the rebind fails, so the pool discards the connection
+        """
+        try:
+            restored = conn.rebind(
+                user=self.settings.ldap_admin_dn,
+                password=self.settings.ldap_admin_password,
+                read_server_info=False,
+            )
+        except LDAPOperationResult as e:
+            raise ldap3.core.exceptions.LDAPBindError(str(e)) from e
+        if not restored:
+            raise ldap3.core.exceptions.LDAPBindError(
+                conn.last_error or "service rebind not successful"
+            )
 
     def authenticate(self, username: str, password: str) -> tuple[bool, str]:
         """
@@ -104,14 +284,21 @@ class LDAPClient:
         logger.debug("Attempting to authenticate user DN: %s", user_dn)
 
         try:
-            conn = Connection(
-                self.server,
-                user=user_dn,
-                password=password,
-                auto_bind=True,
-                raise_exceptions=True,
-            )
-            conn.unbind()
+            # Rebind a pooled connection instead of opening a new socket
+            with self.bind_pool.connection() as conn:
+                try:
+                    authenticated = conn.rebind(
+                        user=user_dn, password=password, read_server_info=False,
+                    )
+                    error = conn.last_error
+                except LDAPOperationResult as e:
+                    authenticated, error = False, str(e)
+                finally:
+                    self._restore_service_bind(conn)
+
+            if not authenticated:
+                logger.warning("Authentication failed for user %s: %s", username, error)
+                return False, "Invalid username or password"
             logger.info("Successfully authenticated user: %s", username)
             return True, "Authentication successful"
         except ldap3.core.exceptions.LDAPBindError as e:
@@ -135,18 +322,16 @@ class LDAPClient:
             True if user exists, False otherwise
         """
         try:
-            conn = self._get_admin_connection()
-
-            search_filter = self.settings.ldap_user_search_filter.format(username)
-            conn.search(
-                search_base=self._get_user_search_base(),
-                search_filter=search_filter,
-                attributes=["uid"],
-            )
+            with self._admin_connection() as conn:
+                search_filter = self.settings.ldap_user_search_filter.format(username)
+                conn.search(
+                    search_base=self._get_user_search_base(),
+                    search_filter=search_filter,
+                    attributes=["uid"],
+                )
 
-            exists = len(conn.entries) > 0
-            conn.unbind()
-            return exists
+                exists = len(conn.entries) > 0
+                return exists
         except LDAPException as e:
             logger.error("LDAP error checking user existence: %s", e)
             return False
@@ -165,28 +350,55 @@ class LDAPClient:
             The attribute value or None if not found
         """
         try:
-            conn = self._get_admin_connection()
-
-            search_filter = self.settings.ldap_user_search_filter.format(username)
-            conn.search(
-                search_base=self._get_user_search_base(),
-                search_filter=search_filter,
-                attributes=[attribute],
-            )
+            with self._admin_connection() as conn:
+                search_filter = self.settings.ldap_user_search_filter.format(username)
+                conn.search(
+                    search_base=self._get_user_search_base(),
+                    search_filter=search_filter,
+                    attributes=[attribute],
+                )
 
-            if conn.entries:
-                entry = conn.entries[0]
-                if hasattr(entry, attribute):
-                    value = getattr(entry, attribute).value
-                    conn.unbind()
-                    return value
+                if conn.entries:
+                    entry = conn.entries[0]
+                    if hasattr(entry, attribute):
+                        value = getattr(entry, attribute).value
+                        return value
 
-            conn.unbind()
-            return None
+                return None
         except LDAPException as e:
             logger.error("LDAP error getting user attribute: %s", e)
             return None
 
+    def _user_attributes(
+        self,
+        username: str,
+        password: str,
+        first_name: str,
+        last_name: str,
+        email: str,
+        uid_number: int,
+    ) -> dict:
+        """Build the attributes of a new user entry."""
+        # Using inetOrgPerson + posixAccount for compatibility
+        return {
+            "objectClass": [
+                "inetOrgPerson",
+                "posixAccount",
+                "shadowAccount",
+                "top",
+            ],
+            "uid": username,
+            "cn": f"{first_name} {last_name}",
+            "sn": last_name,
+            "givenName": first_name,
+            "mail": email,
+            "userPassword": password,
+            "uidNumber": str(uid_number),
+            "gidNumber": str(self.settings.ldap_users_gid),
+            "homeDirectory": f"/home/{username}",
+            "loginShell": "/bin/bash",
+        }
+
     def create_user(
         self,
         username: str,
@@ -211,49 +423,35 @@ class LDAPClient:
         user_dn = self._get_user_dn(username)
 
         try:
-            conn = self._get_admin_connection()
-
-            # Check if user already exists
-            if self.user_exists(username):
-                conn.unbind()
-                return False, f"User {username} already exists in LDAP"
-
-            # Get next available UID number
-            uid_number = self._get_next_uid_number(conn)
-
-            # Build user attributes
-            # Using inetOrgPerson + posixAccount for compatibility
-            attributes = {
-                "objectClass": [
-                    "inetOrgPerson",
-                    "posixAccount",
-                    "shadowAccount",
-                    "top",
-                ],
-                "uid": username,
-                "cn": f"{first_name} {last_name}",
-                "sn": last_name,
-                "givenName": first_name,
-                "mail": email,
-                "userPassword": password,
-                "uidNumber": str(uid_number),
-                "gidNumber": str(self.settings.ldap_users_gid),
-                "homeDirectory": f"/home/{username}",
-                "loginShell": "/bin/bash",
-            }
-
-            # Create the user
-            success = conn.add(user_dn, attributes=attributes)
+            with self._admin_connection(write=True) as conn:
+                # Check if user already exists (on this connection, so a
+                # nested checkout cannot exhaust the pool)
+                conn.search(
+                    search_base=self._get_user_search_base(),
+                    search_filter=self.settings.ldap_user_search_filter.format(username),
+                    attributes=["uid"],
+                )
+                if conn.entries:
+                    return False, f"User {username} already exists in LDAP"
+
+                # Reserve the next UID number from the counter
+                uid_number = self._allocate_uid_numbers(conn)
+
+                # Create the user
+                success = conn.add(
+                    user_dn,
+                    attributes=self._user_attributes(
+                        username, password, first_name, last_name, email, uid_number
+                    ),
+                )
 
-            if success:
-                logger.info("Created LDAP user: %s (UID: %s)", username, uid_number)
-                conn.unbind()
-                return True, f"User {username} created successfully"
-            else:
-                error_msg = conn.result.get("description", "Unknown error")
-                logger.error("Failed to create LDAP user %s: %s", username, error_msg)
-                conn.unbind()
-                return False, f"Failed to create user: {error_msg}"
+                if success:
+                    logger.info("Created LDAP user: %s (UID: %s)", username, uid_number)
+                    return True, f"User {username} created successfully"
+                else:
+                    error_msg = conn.result.get("description", "Unknown error")
+                    logger.error("Failed to create LDAP user %s: %s", username, error_msg)
+                    return False, f"Failed to create user: {error_msg}"
 
         except LDAPException as e:
             logger.error("LDAP error creating user %s: %s", username, e)
@@ -262,6 +460,108 @@ class LDAPClient:
             logger.error("Unexpected error creating user %s: %s", username, e)
             return False, f"Error creating user: {e!s}"
 
+    def create_users(self, users: list[dict]) -> dict[str, tuple[bool, str, list[str]]]:
+        """
+        Create several users in LDAP and add them to groups.
+
+        Everything runs over one pooled write connection: a single search
+        finds users that already exist, one counter update reserves the UID
+        numbers for the rest, then each entry is added and its group
+        memberships are applied.
+
+        Args:
+            users: User dictionaries with username, password, first_name,
+                last_name, email and optionally group_dns
+
+        Returns:
+            Mapping of username to (success: bool, message: str, DNs of the
+            groups the user was added to)
+        """
+        results: dict[str, tuple[bool, str, list[str]]] = {}
+        if not users:
+            return results
+
+        try:
+            with self._admin_connection(write=True) as conn:
+                # Check which users already exist
+                user_filters = "".join(
+                    self.settings.ldap_user_search_filter.format(
+                        escape_filter_chars(user["username"])
+                    )
+                    for user in users
+                )
+                conn.search(
+                    search_base=self._get_user_search_base(),
+                    search_filter=f"(|{user_filters})",
+                    attributes=["uid"],
+                )
+                existing = {
+                    uid.lower()
+                    for entry in conn.entries
+                    for uid in entry.uid.values
+                }
+
+                new_users = []
+                for user in users:
+                    if user["username"].lower() in existing:
+                        results[user["username"]] = (
+                            False, f"User {user['username']} already exists in LDAP", [],
+                        )
+                    else:
+                        new_users.append(user)
+
+                # Reserve all UID numbers with one counter update
+                first_uid = self._allocate_uid_numbers(conn, len(new_users)) if new_users else 0
+
+                for offset, user in enumerate(new_users):
+                    username = user["username"]
+                    try:
+                        success = conn.add(
+                            self._get_user_dn(username),
+                            attributes=self._user_attributes(
+                                username,
+                                user["password"],
+                                user["first_name"],
+                                user["last_name"],
+                                user["email"],
+                                first_uid + offset,
+                            ),
+                        )
+                        error_msg = "" if success else conn.result.get("description", "Unknown error")
+                    except LDAPOperationResult as e:
+                        success, error_msg = False, e.description or str(e)
+
+                    if not success:
+                        logger.error("Failed to create LDAP user %s: %s", username, error_msg)
+                        results[username] = (False, f"Failed to create user: {error_msg}", [])
+                        continue
+
+                    added_groups = []
+                    for group_dn in user.get("group_dns", []):
+                        added, error_msg = self._modify_membership(
+                            conn, username, group_dn, MODIFY_ADD
+                        )
+                        if added:
+                            added_groups.append(group_dn)
+                        else:
+                            logger.warning(
+                                "Failed to add %s to group %s: %s", username, group_dn, error_msg
+                            )
+
+                    logger.info("Created LDAP user: %s (UID: %s)", username, first_uid + offset)
+                    results[username] = (True, f"User {username} created successfully", added_groups)
+
+        except LDAPException as e:
+            logger.error("LDAP error creating users: %s", e)
+            for user in users:
+                results.setdefault(user["username"], (False, f"LDAP error: {e!s}", []))
+        except Exception as e:
+            logger.error("Unexpected error creating users: %s", e)
+            for user in users:
+                results.setdefault(user["username"], (False, f"Error creating user: {e!s}", []))
+
+        return results
+
     def delete_user(self, username: str) -> tuple[bool, str]:
         """
         Delete a user from LDAP.
@@ -275,19 +575,17 @@ class LDAPClient:
         user_dn = self._get_user_dn(username)
 
         try:
-            conn = self._get_admin_connection()
-
-            success = conn.delete(user_dn)
-
-            if success:
-                logger.info("Deleted LDAP user: %s", username)
-                conn.unbind()
-                return True, f"User {username} deleted successfully"
-            else:
-                error_msg = conn.result.get("description", "Unknown error")
-                logger.error("Failed to delete LDAP user %s: %s", username, error_msg)
-                conn.unbind()
-                return False, f"Failed to delete user: {error_msg}"
+            with self._admin_connection(write=True) as conn:
+                success = conn.delete(user_dn)
+
+                if success:
+                    self._invalidate_membership(username)
+                    logger.info("Deleted LDAP user: %s", username)
+                    return True, f"User {username} deleted successfully"
+                else:
+                    error_msg = conn.result.get("description", "Unknown error")
+                    logger.error("Failed to delete LDAP user %s: %s", username, error_msg)
+                    return False, f"Failed to delete user: {error_msg}"
 
         except LDAPException as e:
             logger.error("LDAP error deleting user %s: %s", username, e)
@@ -296,57 +594,91 @@ class LDAPClient:
             logger.error("Unexpected error deleting user %s: %s", username, e)
             return False, f"Error deleting user: {e!s}"
 
-    def is_admin(self, username: str) -> bool:
+    def _get_group_membership(self, group_dn: str) -> frozenset[str]:
         """
-        Check if a user is a member of the admin group.
+        Get the normalized membership set of a group, using the TTL cache.
+
+        The set holds normalized member/uniqueMember DNs and lowercased
+        memberUid values, so membership checks are O(1).
 
         Args:
-            username: The username to check
+            group_dn: The DN of the group
 
         Returns:
-            True if user is an admin, False otherwise
-        """
-        try:
-            conn = self._get_admin_connection()
+            Frozen set of normalized member DNs and uids (empty if not found)
 
-            admin_group_dn = self.settings.ldap_admin_group_dn
+        Raises:
+            LDAPException: If the group cannot be read
+        """
+        cache_key = ("group", normalize_dn(group_dn))
+        members = self.membership_cache.get(cache_key)
+        if members is not None:
+            return members
 
-            # Search for the admin group and check membership
+        with self._membership_connection(cache_key) as conn:
             # Groups typically use 'member' or 'memberUid' attribute
             conn.search(
-                search_base=admin_group_dn,
+                search_base=group_dn,
                 search_filter="(objectClass=*)",
-                attributes=["member", "memberUid", "uniqueMember"],
+                search_scope=BASE,
+                attributes=self.MEMBER_ATTRIBUTES,
             )
 
-            if not conn.entries:
-                logger.debug("Admin group not found: %s", admin_group_dn)
-                conn.unbind()
-                return False
-
-            entry = conn.entries[0]
-            user_dn = self._get_user_dn(username)
-
-            # Check different membership attribute types
-            # member/uniqueMember uses full DN
-            if hasattr(entry, "member") and entry.member.values:
-                if user_dn.lower() in [m.lower() for m in entry.member.values]:
-                    conn.unbind()
-                    return True
-
-            if hasattr(entry, "uniqueMember") and entry.uniqueMember.values:
-                if user_dn.lower() in [m.lower() for m in entry.uniqueMember.values]:
-                    conn.unbind()
-                    return True
-
-            # memberUid uses just the username
-            if hasattr(entry, "memberUid") and entry.memberUid.values:
-                if username.lower() in [m.lower() for m in entry.memberUid.values]:
-                    conn.unbind()
-                    return True
-
-            conn.unbind()
-            return False
+            collected: set[str] = set()
+            if conn.entries:
+                entry = conn.entries[0]
+                # member/uniqueMember use full DNs
+                if hasattr(entry, "member") and entry.member.values:
+                    collected.update(normalize_dn(m) for m in entry.member.values)
+                if hasattr(entry, "uniqueMember") and entry.uniqueMember.values:
+                    collected.update(normalize_dn(m) for m in entry.uniqueMember.values)
+                # memberUid uses just the username
+                if hasattr(entry, "memberUid") and entry.memberUid.values:
+                    collected.update(m.lower() for m in entry.memberUid.values)
+            else:
+                logger.debug("Group not found: %s", group_dn)
+
+        members = frozenset(collected)
+        self.membership_cache.set(cache_key, members)
+        return members
+
+    def _membership_connection(self, cache_key: tuple):
+        """
+        Check out a connection for (re)loading a membership cache entry.
+
+        Right after a change invalidated the entry, replicas may not have the
+        write yet, and a stale answer would be cached for the full TTL, so
+        the master is read until ``LDAP_REPLICATION_LAG_SECONDS`` have passed.
+        """
+        recently_changed = self.membership_cache.invalidated_within(
+            cache_key, self.settings.ldap_replication_lag_seconds
+        )
+        return self._admin_connection(write=recently_changed)
+
+    def _invalidate_membership(self, username: str, group_dn: Optional[str] = None) -> None:
+        """Drop cached membership data affected by a change for ``username``."""
+        self.membership_cache.invalidate(("user_groups", username.lower()))
+        self.membership_cache.invalidate(self.ADMIN_EMAILS_CACHE_KEY)
+        if group_dn is not None:
+            self.membership_cache.invalidate(("group", normalize_dn(group_dn)))
+
+    def is_admin(self, username: str) -> bool:
+        """
+        Check if a user is a member of the admin group.
+
+        Membership is served from the in-process cache and refreshed from
+        LDAP once the entry expires.
+
+        Args:
+            username: The username to check
+
+        Returns:
+            True if user is an admin, False otherwise
+        """
+        try:
+            members = self._get_group_membership(self.settings.ldap_admin_group_dn)
+            user_dn = normalize_dn(self._get_user_dn(username))
+            return user_dn in members or username.lower() in members
 
         except LDAPException as e:
             logger.error("LDAP error checking admin status for %s: %s", username, e)
@@ -355,52 +687,126 @@ class LDAPClient:
             logger.error("Unexpected error checking admin status for %s: %s", username, e)
             return False
 
-    def add_user_to_group(self, username: str, group_dn: str) -> tuple[bool, str]:
+    # Messages per membership operation: (past tense, infinitive)
+    _MEMBERSHIP_ACTIONS = {
+        MODIFY_ADD: ("added to", "add to"),
+        MODIFY_DELETE: ("removed from", "remove from"),
+    }
+
+    def _modify_membership(
+        self,
+        conn: Connection,
+        username: str,
+        group_dn: str,
+        operation: str,
+    ) -> tuple[bool, str]:
         """
-        Add a user to an LDAP group.
+        Add or remove a user on one group over an open connection.
 
         Args:
-            username: The username to add
+            conn: Bound write connection
+            username: The username to add or remove
             group_dn: The DN of the group
+            operation: MODIFY_ADD or MODIFY_DELETE
 
         Returns:
-            Tuple of (success: bool, message: str)
+            Tuple of (success: bool, error description)
         """
-        user_dn = self._get_user_dn(username)
-
-        try:
-            conn = self._get_admin_connection()
+        changes = (
+            # member (for groupOfNames/groupOfUniqueNames)
+            {"member": [(operation, [self._get_user_dn(username)])]},
+            # memberUid instead (for posixGroup)
+            {"memberUid": [(operation, [username])]},
+        )
+        error_msg = "Unknown error"
+        for change in changes:
+            try:
+                if conn.modify(group_dn, change):
+                    self._invalidate_membership(username, group_dn)
+                    return True, ""
+                error_msg = conn.result.get("description", "Unknown error")
+            except LDAPOperationResult as e:
+                error_msg = e.description or str(e)
+        return False, error_msg
 
-            # Try to add as member (for groupOfNames/groupOfUniqueNames)
-            success = conn.modify(
-                group_dn,
-                {"member": [(MODIFY_ADD, [user_dn])]}
-            )
+    def _modify_group_membership(
+        self,
+        username: str,
+        group_dn: str,
+        operation: str,
+    ) -> tuple[bool, str]:
+        """Add or remove a user on one group."""
+        done, action = self._MEMBERSHIP_ACTIONS[operation]
 
-            if not success:
-                # Try memberUid instead (for posixGroup)
-                success = conn.modify(
-                    group_dn,
-                    {"memberUid": [(MODIFY_ADD, [username])]}
-                )
+        try:
+            with self._admin_connection(write=True) as conn:
+                success, error_msg = self._modify_membership(conn, username, group_dn, operation)
 
             if success:
-                logger.info("Added user %s to group %s", username, group_dn)
-                conn.unbind()
-                return True, f"User added to group successfully"
-            else:
-                error_msg = conn.result.get("description", "Unknown error")
-                logger.error("Failed to add %s to group: %s", username, error_msg)
-                conn.unbind()
-                return False, f"Failed to add to group: {error_msg}"
+                logger.info("User %s %s group %s", username, done, group_dn)
+                return True, f"User {done} group successfully"
+            logger.error("Failed to %s group %s for %s: %s", action, group_dn, username, error_msg)
+            return False, f"Failed to {action} group: {error_msg}"
 
         except LDAPException as e:
-            logger.error("LDAP error adding user to group: %s", e)
+            logger.error("LDAP error trying to %s group: %s", action, e)
             return False, f"LDAP error: {e!s}"
         except Exception as e:
-            logger.error("Unexpected error adding user to group: %s", e)
+            logger.error("Unexpected error trying to %s group: %s", action, e)
             return False, f"Error: {e!s}"
 
+    def _modify_group_memberships(
+        self,
+        username: str,
+        group_dns: list[str],
+        operation: str,
+    ) -> dict[str, tuple[bool, str]]:
+        """Add or remove a user on several groups over one pooled connection."""
+        done, action = self._MEMBERSHIP_ACTIONS[operation]
+        results: dict[str, tuple[bool, str]] = {}
+        if not group_dns:
+            return results
+
+        try:
+            with self._admin_connection(write=True) as conn:
+                for group_dn in group_dns:
+                    success, error_msg = self._modify_membership(
+                        conn, username, group_dn, operation
+                    )
+                    if success:
+                        results[group_dn] = (True, f"User {done} group successfully")
+                    else:
+                        results[group_dn] = (False, f"Failed to {action} group: {error_msg}")
+
+        except LDAPException as e:
+            logger.error("LDAP error trying to %s groups: %s", action, e)
+            for group_dn in group_dns:
+                results.setdefault(group_dn, (False, f"LDAP error: {e!s}"))
+        except Exception as e:
+            logger.error("Unexpected error trying to %s groups: %s", action, e)
+            for group_dn in group_dns:
+                results.setdefault(group_dn, (False, f"Error: {e!s}"))
+
+        failed = sum(1 for success, _ in results.values() if not success)
+        logger.info(
+            "User %s %s %s groups (%s failed)",
+            username, done, len(group_dns) - failed, failed,
+        )
+        return results
+
+    def add_user_to_group(self, username: str, group_dn: str) -> tuple[bool, str]:
+        """
+        Add a user to an LDAP group.
+
+        Args:
+            username: The username to add
+            group_dn: The DN of the group
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        return self._modify_group_membership(username, group_dn, MODIFY_ADD)
+
     def remove_user_from_group(self, username: str, group_dn: str) -> tuple[bool, str]:
         """
         Remove a user from an LDAP group.
@@ -412,78 +818,127 @@ class LDAPClient:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        user_dn = self._get_user_dn(username)
+        return self._modify_group_membership(username, group_dn, MODIFY_DELETE)
 
-        try:
-            conn = self._get_admin_connection()
+    def add_user_to_groups(
+        self,
+        username: str,
+        group_dns: list[str],
+    ) -> dict[str, tuple[bool, str]]:
+        """
+        Add a user to several LDAP groups.
 
-            # Try to remove as member (for groupOfNames/groupOfUniqueNames)
-            success = conn.modify(
-                group_dn,
-                {"member": [(MODIFY_DELETE, [user_dn])]}
-            )
+        All modifies are sent over a single pooled write connection instead
+        of checking out a connection per group.
 
-            if not success:
-                # Try memberUid instead (for posixGroup)
-                success = conn.modify(
-                    group_dn,
-                    {"memberUid": [(MODIFY_DELETE, [username])]}
-                )
-
-            if success:
-                logger.info("Removed user %s from group %s", username, group_dn)
-                conn.unbind()
-                return True, "User removed from group successfully"
-            else:
-                error_msg = conn.result.get("description", "Unknown error")
-                logger.error("Failed to remove %s from group: %s", username, error_msg)
-                conn.unbind()
-                return False, f"Failed to remove from group: {error_msg}"
+        Args:
+            username: The username to add
+            group_dns: The DNs of the groups
 
-        except LDAPException as e:
-            logger.error("LDAP error removing user from group: %s", e)
-            return False, f"LDAP error: {e!s}"
-        except Exception as e:
-            logger.error("Unexpected error removing user from group: %s", e)
-            return False, f"Error: {e!s}"
+        Returns:
+            Mapping of group DN to (success: bool, message: str)
+        """
+        return self._modify_group_memberships(username, group_dns, MODIFY_ADD)
 
-    def list_groups(self) -> list[dict]:
+    def remove_user_from_groups(
+        self,
+        username: str,
+        group_dns: list[str],
+    ) -> dict[str, tuple[bool, str]]:
         """
-        List all LDAP groups.
+        Remove a user from several LDAP groups over one pooled connection.
+
+        Args:
+            username: The username to remove
+            group_dns: The DNs of the groups
 
         Returns:
-            List of group dictionaries with dn, name, description, and members
+            Mapping of group DN to (success: bool, message: str)
         """
-        groups = []
-        try:
-            conn = self._get_admin_connection()
+        return self._modify_group_memberships(username, group_dns, MODIFY_DELETE)
 
-            # Search for all groups
-            conn.search(
-                search_base=self._get_group_search_base(),
-                search_filter="(|(objectClass=groupOfNames)(objectClass=groupOfUniqueNames)(objectClass=posixGroup))",
-                attributes=["cn", "description", "member", "memberUid", "uniqueMember"],
-            )
+    @staticmethod
+    def _attribute_values(attributes: dict, name: str) -> list:
+        """Get an attribute from a search response as a list of values."""
+        value = attributes.get(name)
+        if value is None:
+            return []
+        if isinstance(value, (list, tuple)):
+            return list(value)
+        return [value]
+
+    @staticmethod
+    def _uid_from_dn(member_dn: str) -> Optional[str]:
+        """Extract the uid from a DN like "uid=username,ou=users,...", if any."""
+        first_rdn = member_dn.split(",", 1)[0]
+        attr, _, value = first_rdn.partition("=")
+        if attr.strip().lower() != "uid" or not value.strip():
+            return None
+        return value.strip()
+
+    def iter_groups(self, include_members: bool = False) -> Iterator[dict]:
+        """
+        Stream LDAP groups using the Simple Paged Results control.
+
+        Groups are fetched ``LDAP_SEARCH_PAGE_SIZE`` at a time, so the server
+        size limit is never hit and only one page is held in memory. The
+        pooled connection stays checked out until the generator is exhausted
+        or closed.
 
-            for entry in conn.entries:
+        Args:
+            include_members: Also fetch member, uniqueMember and memberUid
+
+        Yields:
+            Group dictionaries with dn, name, description (and members)
+
+        Raises:
+            LDAPException: If the search fails
+        """
+        attributes = ["cn", "description"]
+        if include_members:
+            attributes.extend(self.MEMBER_ATTRIBUTES)
+
+        with self._admin_connection() as conn:
+            for response in conn.extend.standard.paged_search(
+                search_base=self._get_group_search_base(),
+                search_filter=self.GROUP_FILTER,
+                attributes=attributes,
+                paged_size=self.settings.ldap_search_page_size,
+                generator=True,
+            ):
+                if response.get("type") != "searchResEntry":
+                    continue
+
+                entry = response["attributes"]
+                names = self._attribute_values(entry, "cn")
+                descriptions = self._attribute_values(entry, "description")
                 group_data = {
-                    "dn": str(entry.entry_dn),
-                    "name": entry.cn.value if hasattr(entry, "cn") else "",
-                    "description": entry.description.value if hasattr(entry, "description") and entry.description.value else "",
-                    "members": [],
+                    "dn": response["dn"],
+                    "name": names[0] if names else "",
+                    "description": descriptions[0] if descriptions else "",
                 }
+                if include_members:
+                    # Get members from different attribute types
+                    group_data["members"] = [
+                        member
+                        for attr in ("member", "uniqueMember", "memberUid")
+                        for member in self._attribute_values(entry, attr)
+                    ]
+                yield group_data
+
+    def list_groups(self, include_members: bool = False) -> list[dict]:
+        """
+        List all LDAP groups.
 
-                # Get members from different attribute types
-                if hasattr(entry, "member") and entry.member.values:
-                    group_data["members"].extend(entry.member.values)
-                if hasattr(entry, "uniqueMember") and entry.uniqueMember.values:
-                    group_data["members"].extend(entry.uniqueMember.values)
-                if hasattr(entry, "memberUid") and entry.memberUid.values:
-                    group_data["members"].extend(entry.memberUid.values)
-
-                groups.append(group_data)
+        Args:
+            include_members: Also fetch each group's members (only requested
+                from the server when set)
 
-            conn.unbind()
+        Returns:
+            List of group dictionaries with dn, name, description (and members)
+        """
+        try:
+            groups = list(self.iter_groups(include_members=include_members))
             logger.info("Listed %s LDAP groups", len(groups))
             return groups
 
@@ -514,38 +969,34 @@ class LDAPClient:
         group_dn = self._get_group_dn(safe_name)
 
         try:
-            conn = self._get_admin_connection()
-
-            # Check if group already exists
-            conn.search(
-                search_base=group_dn,
-                search_filter="(objectClass=*)",
-                attributes=["cn"],
-            )
-            if conn.entries:
-                conn.unbind()
-                return False, f"Group {name} already exists", None
-
-            # Create group with groupOfNames objectClass
-            # Note: groupOfNames requires at least one member, using admin as placeholder
-            attributes = {
-                "objectClass": ["groupOfNames", "top"],
-                "cn": safe_name,
-                "description": description or f"Group: {name}",
-                "member": [self.settings.ldap_admin_dn],  # Required initial member
-            }
+            with self._admin_connection(write=True) as conn:
+                # Check if group already exists
+                conn.search(
+                    search_base=group_dn,
+                    search_filter="(objectClass=*)",
+                    attributes=["cn"],
+                )
+                if conn.entries:
+                    return False, f"Group {name} already exists", None
+
+                # Create group with groupOfNames objectClass
+                # Note: groupOfNames requires at least one member, using admin as placeholder
+                attributes = {
+                    "objectClass": ["groupOfNames", "top"],
+                    "cn": safe_name,
+                    "description": description or f"Group: {name}",
+                    "member": [self.settings.ldap_admin_dn],  # Required initial member
+                }
 
-            success = conn.add(group_dn, attributes=attributes)
+                success = conn.add(group_dn, attributes=attributes)
 
-            if success:
-                logger.info("Created LDAP group: %s", name)
-                conn.unbind()
-                return True, f"Group {name} created successfully", group_dn
-            else:
-                error_msg = conn.result.get("description", "Unknown error")
-                logger.error("Failed to create LDAP group %s: %s", name, error_msg)
-                conn.unbind()
-                return False, f"Failed to create group: {error_msg}", None
+                if success:
+                    logger.info("Created LDAP group: %s", name)
+                    return True, f"Group {name} created successfully", group_dn
+                else:
+                    error_msg = conn.result.get("description", "Unknown error")
+                    logger.error("Failed to create LDAP group %s: %s", name, error_msg)
+                    return False, f"Failed to create group: {error_msg}", None
 
         except LDAPException as e:
             logger.error("LDAP error creating group %s: %s", name, e)
@@ -565,19 +1016,17 @@ class LDAPClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            conn = self._get_admin_connection()
-
-            success = conn.delete(group_dn)
-
-            if success:
-                logger.info("Deleted LDAP group: %s", group_dn)
-                conn.unbind()
-                return True, "Group deleted successfully"
-            else:
-                error_msg = conn.result.get("description", "Unknown error")
-                logger.error("Failed to delete LDAP group %s: %s", group_dn, error_msg)
-                conn.unbind()
-                return False, f"Failed to delete group: {error_msg}"
+            with self._admin_connection(write=True) as conn:
+                success = conn.delete(group_dn)
+
+                if success:
+                    self.membership_cache.clear()
+                    logger.info("Deleted LDAP group: %s", group_dn)
+                    return True, "Group deleted successfully"
+                else:
+                    error_msg = conn.result.get("description", "Unknown error")
+                    logger.error("Failed to delete LDAP group %s: %s", group_dn, error_msg)
+                    return False, f"Failed to delete group: {error_msg}"
 
         except LDAPException as e:
             logger.error("LDAP error deleting group %s: %s", group_dn, e)
@@ -602,27 +1051,24 @@ class LDAPClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            conn = self._get_admin_connection()
+            with self._admin_connection(write=True) as conn:
+                modifications = {}
+                if description is not None:
+                    modifications["description"] = [(MODIFY_REPLACE, [description])]
 
-            modifications = {}
-            if description is not None:
-                modifications["description"] = [(MODIFY_REPLACE, [description])]
+                if not modifications:
+                    return True, "No changes to apply"
 
-            if not modifications:
-                conn.unbind()
-                return True, "No changes to apply"
+                success = conn.modify(group_dn, modifications)
 
-            success = conn.modify(group_dn, modifications)
-
-            if success:
-                logger.info("Updated LDAP group: %s", group_dn)
-                conn.unbind()
-                return True, "Group updated successfully"
-            else:
-                error_msg = conn.result.get("description", "Unknown error")
-                logger.error("Failed to update LDAP group %s: %s", group_dn, error_msg)
-                conn.unbind()
-                return False, f"Failed to update group: {error_msg}"
+                if success:
+                    self.membership_cache.clear()
+                    logger.info("Updated LDAP group: %s", group_dn)
+                    return True, "Group updated successfully"
+                else:
+                    error_msg = conn.result.get("description", "Unknown error")
+                    logger.error("Failed to update LDAP group %s: %s", group_dn, error_msg)
+                    return False, f"Failed to update group: {error_msg}"
 
         except LDAPException as e:
             logger.error("LDAP error updating group %s: %s", group_dn, e)
@@ -641,31 +1087,35 @@ class LDAPClient:
         Returns:
             List of group dictionaries with dn and name
         """
+        cache_key = ("user_groups", username.lower())
+        cached = self.membership_cache.get(cache_key)
+        if cached is not None:
+            return [dict(group) for group in cached]
+
         user_dn = self._get_user_dn(username)
         groups = []
 
         try:
-            conn = self._get_admin_connection()
-
-            # Search for groups containing this user
-            # Check both member (DN) and memberUid (username)
-            search_filter = f"(|(member={user_dn})(memberUid={username})(uniqueMember={user_dn}))"
-            conn.search(
-                search_base=self._get_group_search_base(),
-                search_filter=search_filter,
-                attributes=["cn", "description"],
-            )
+            with self._membership_connection(cache_key) as conn:
+                # Search for groups containing this user
+                # Check both member (DN) and memberUid (username)
+                search_filter = f"(|(member={user_dn})(memberUid={username})(uniqueMember={user_dn}))"
+                conn.search(
+                    search_base=self._get_group_search_base(),
+                    search_filter=search_filter,
+                    attributes=["cn", "description"],
+                )
 
-            for entry in conn.entries:
-                groups.append({
-                    "dn": str(entry.entry_dn),
-                    "name": entry.cn.value if hasattr(entry, "cn") else "",
-                    "description": entry.description.value if hasattr(entry, "description") and entry.description.value else "",
-                })
+                for entry in conn.entries:
+                    groups.append({
+                        "dn": str(entry.entry_dn),
+                        "name": entry.cn.value if hasattr(entry, "cn") else "",
+                        "description": entry.description.value if hasattr(entry, "description") and entry.description.value else "",
+                    })
 
-            conn.unbind()
-            logger.debug("User %s belongs to %s groups", username, len(groups))
-            return groups
+                logger.debug("User %s belongs to %s groups", username, len(groups))
+                self.membership_cache.set(cache_key, tuple(dict(group) for group in groups))
+                return groups
 
         except LDAPException as e:
             logger.error("LDAP error getting user groups for %s: %s", username, e)
@@ -678,82 +1128,58 @@ class LDAPClient:
         """
         Get email addresses of all admin group members.
 
+        Members are resolved with one OR-filter search per chunk of
+        ``FILTER_CHUNK_SIZE`` members instead of one search per member, and
+        the resulting list is cached with the membership TTL.
+
         Returns:
             List of email addresses
         """
-        emails = []
-        try:
-            conn = self._get_admin_connection()
+        cached = self.membership_cache.get(self.ADMIN_EMAILS_CACHE_KEY)
+        if cached is not None:
+            return list(cached)
 
-            admin_group_dn = self.settings.ldap_admin_group_dn
-
-            # Get admin group members
-            conn.search(
-                search_base=admin_group_dn,
-                search_filter="(objectClass=*)",
-                attributes=["member", "memberUid", "uniqueMember"],
-            )
-
-            if not conn.entries:
-                logger.warning("Admin group not found: %s", admin_group_dn)
-                conn.unbind()
+        try:
+            members = self._get_group_membership(self.settings.ldap_admin_group_dn)
+            if not members:
+                logger.warning("Admin group not found or empty: %s", self.settings.ldap_admin_group_dn)
                 return []
 
-            entry = conn.entries[0]
-            member_dns = []
-            member_uids = []
+            # memberUid values are bare usernames; member/uniqueMember are DNs
+            member_dns = {m for m in members if "=" in m}
+            member_uids = {m for m in members if "=" not in m}
 
-            # Collect member DNs
-            if hasattr(entry, "member") and entry.member.values:
-                member_dns.extend(entry.member.values)
-            if hasattr(entry, "uniqueMember") and entry.uniqueMember.values:
-                member_dns.extend(entry.uniqueMember.values)
-            if hasattr(entry, "memberUid") and entry.memberUid.values:
-                member_uids.extend(entry.memberUid.values)
+            # Match DNs by their first RDN and uids by uid, then keep only
+            # entries that really are members
+            terms = []
+            for member_dn in sorted(member_dns):
+                attr, _, value = member_dn.split(",", 1)[0].partition("=")
+                terms.append(f"({attr}={escape_filter_chars(value)})")
+            terms.extend(f"(uid={escape_filter_chars(uid)})" for uid in sorted(member_uids))
 
-            # Fetch email for each member DN
-            for member_dn in member_dns:
-                try:
-                    conn.search(
-                        search_base=member_dn,
-                        search_filter="(objectClass=*)",
-                        attributes=["mail"],
-                    )
-                    if conn.entries and hasattr(conn.entries[0], "mail"):
-                        mail = conn.entries[0].mail.value
-                        if mail:
-                            emails.append(mail)
-                except Exception as e:
-                    logger.debug("Could not fetch email for %s: %s", member_dn, e)
-
-            # Fetch email for each memberUid
-            for uid in member_uids:
-                try:
-                    search_filter = self.settings.ldap_user_search_filter.format(uid)
+            emails = []
+            seen = set()
+            with self._membership_connection(self.ADMIN_EMAILS_CACHE_KEY) as conn:
+                for i in range(0, len(terms), self.FILTER_CHUNK_SIZE):
+                    chunk = terms[i:i + self.FILTER_CHUNK_SIZE]
                     conn.search(
-                        search_base=self._get_user_search_base(),
-                        search_filter=search_filter,
-                        attributes=["mail"],
+                        search_base=self.settings.ldap_base_dn,
+                        search_filter=f"(&(mail=*)(|{''.join(chunk)}))",
+                        attributes=["mail", "uid"],
                     )
-                    if conn.entries and hasattr(conn.entries[0], "mail"):
-                        mail = conn.entries[0].mail.value
-                        if mail:
+                    for entry in conn.entries:
+                        uid = entry.uid.value if hasattr(entry, "uid") else None
+                        is_member = normalize_dn(entry.entry_dn) in member_dns or (
+                            isinstance(uid, str) and uid.lower() in member_uids
+                        )
+                        mail = entry.mail.value if hasattr(entry, "mail") else None
+                        if is_member and mail and mail not in seen:
+                            seen.add(mail)
                             emails.append(mail)
-                except Exception as e:
-                    logger.debug("Could not fetch email for uid %s: %s", uid, e)
 
-            conn.unbind()
-
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_emails = []
-            for email in emails:
-                if email not in seen:
-                    seen.add(email)
-                    unique_emails.append(email)
-
-            logger.info("Found %s admin email addresses", len(unique_emails))
-            return unique_emails
+            self.membership_cache.set(self.ADMIN_EMAILS_CACHE_KEY, tuple(emails))
+            logger.info("Found %s admin email addresses", len(emails))
+            return emails
 
         except LDAPException as e:
             logger.error("LDAP error getting admin emails: %s", e)
@@ -762,60 +1188,64 @@ class LDAPClient:
             logger.error("Unexpected error getting admin emails: %s", e)
             return []
 
-    def get_group_members(self, group_dn: str) -> list[str]:
+    def iter_group_members(self, group_dn: str) -> Iterator[str]:
         """
-        Get all members of a group.
+        Stream the usernames of a group's members.
+
+        Only the member attributes of the group entry itself are read.
+        Members of very large groups that the server returns in ranges
+        (``member;range=0-1499``) are fetched range by range by ldap3's
+        auto-range support.
 
         Args:
             group_dn: The DN of the group
 
-        Returns:
-            List of member usernames
-        """
-        members = []
-        try:
-            conn = self._get_admin_connection()
+        Yields:
+            Member usernames, each at most once
 
+        Raises:
+            LDAPException: If the group cannot be read
+        """
+        with self._admin_connection() as conn:
             conn.search(
                 search_base=group_dn,
                 search_filter="(objectClass=*)",
-                attributes=["member", "memberUid", "uniqueMember"],
+                search_scope=BASE,
+                attributes=self.MEMBER_ATTRIBUTES,
+            )
+            entry = next(
+                (r["attributes"] for r in conn.response if r.get("type") == "searchResEntry"),
+                None,
             )
 
-            if not conn.entries:
-                conn.unbind()
-                return []
+        # The connection is back in the pool; stream straight from the entry
+        if entry is None:
+            return
+
+        seen: set[str] = set()
+        # memberUid holds the username; member/uniqueMember hold full DNs
+        for attr in self.MEMBER_ATTRIBUTES:
+            values = entry.get(attr) or ()
+            if isinstance(values, str):
+                values = (values,)
+            for value in values:
+                uid = value if attr == "memberUid" else self._uid_from_dn(value)
+                if uid and uid not in seen:
+                    seen.add(uid)
+                    yield uid
+
+    def get_group_members(self, group_dn: str) -> list[str]:
+        """
+        Get all members of a group.
+
+        Args:
+            group_dn: The DN of the group
 
-            entry = conn.entries[0]
-
-            # Get members from different attribute types
-            if hasattr(entry, "memberUid") and entry.memberUid.values:
-                members.extend(entry.memberUid.values)
-
-            # Extract username from DN for member/uniqueMember
-            if hasattr(entry, "member") and entry.member.values:
-                for member_dn in entry.member.values:
-                    # Extract uid from DN like "uid=username,ou=users,..."
-                    if member_dn.lower().startswith("uid="):
-                        parts = member_dn.split(",")
-                        if parts:
-                            uid = parts[0].split("=")[1] if "=" in parts[0] else ""
-                            if uid:
-                                members.append(uid)
-
-            if hasattr(entry, "uniqueMember") and entry.uniqueMember.values:
-                for member_dn in entry.uniqueMember.values:
-                    if member_dn.lower().startswith("uid="):
-                        parts = member_dn.split(",")
-                        if parts:
-                            uid = parts[0].split("=")[1] if "=" in parts[0] else ""
-                            if uid:
-                                members.append(uid)
-
-            conn.unbind()
-
-            # Remove duplicates
-            return list(set(members))
+        Returns:
+            List of member usernames
+        """
+        try:
+            return list(self.iter_group_members(group_dn))
 
         except LDAPException as e:
             logger.error("LDAP error getting group members for %s: %s", group_dn, e)
@@ -0,0 +1,316 @@
+"""Bounded, thread-safe pool of pre-bound LDAP connections."""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from ldap3 import Connection
+from ldap3.core.exceptions import LDAPException, LDAPOperationResult
+
+from app.config import get_settings
+from app.ldap.server import get_replica_hosts, open_connection, reset_ldap_server
+
+logger = logging.getLogger(__name__)
+
+
+class LDAPPoolTimeoutError(LDAPException):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class _PooledConnection:
+    """A pooled connection together with its bookkeeping timestamps."""
+
+    __slots__ = ("connection", "created_at", "last_used")
+
+    def __init__(self, connection: Connection) -> None:
+        now = time.monotonic()
+        self.connection = connection
+        self.created_at = now
+        self.last_used = now
+
+
+class LDAPConnectionPool:
+    """Pool of already-bound LDAP connections shared across threads.
+
+    Connections are created lazily up to ``max_size``. On checkout a
+    connection is validated locally (closed/unbound) and, if it has been
+    idle for longer than ``health_check_interval``, probed with a WhoAmI
+    request. Connections that fail validation, exceed ``max_lifetime`` or
+    raise a non-result error while checked out are discarded and replaced.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Connection],
+        max_size: int = 10,
+        checkout_timeout: float = 5.0,
+        health_check_interval: float = 30.0,
+        max_lifetime: float = 3600.0,
+        name: str = "ldap",
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            factory: Callable returning a new, bound connection
+            max_size: Maximum number of open connections
+            checkout_timeout: Seconds to wait for a free connection
+            health_check_interval: Idle seconds after which a connection is probed
+            max_lifetime: Seconds after which a connection is recycled
+            name: Pool name used in logs and stats
+        """
+        self._factory = factory
+        self._max_size = max(1, max_size)
+        self._checkout_timeout = checkout_timeout
+        self._health_check_interval = health_check_interval
+        self._max_lifetime = max_lifetime
+        self._name = name
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self._max_size)
+        self._idle: deque[_PooledConnection] = deque()
+        self._open = 0
+        self._closed = False
+
+        self._stats = {
+            "checkouts": 0,
+            "created": 0,
+            "discarded": 0,
+            "health_check_failures": 0,
+            "timeouts": 0,
+        }
+
+    @property
+    def name(self) -> str:
+        """Get the pool name."""
+        return self._name
+
+    def _create(self) -> _PooledConnection:
+        """Open and bind a new connection."""
+        pooled = _PooledConnection(self._factory())
+        with self._lock:
+            self._open += 1
+            self._stats["created"] += 1
+        logger.debug("Opened new connection in LDAP pool '%s'", self._name)
+        return pooled
+
+    def _discard(self, pooled: _PooledConnection) -> None:
+        """Close a connection and drop it from the pool."""
+        with self._lock:
+            self._open -= 1
+            self._stats["discarded"] += 1
+        try:
+            pooled.connection.unbind()
+        except Exception as e:
+            logger.debug("Error closing pooled LDAP connection: %s", e)
+
+    def _is_healthy(self, pooled: _PooledConnection) -> bool:
+        """Validate an idle connection before handing it out."""
+        conn = pooled.connection
+        now = time.monotonic()
+
+        if conn.closed or not conn.bound:
+            return False
+
+        if self._max_lifetime and now - pooled.created_at > self._max_lifetime:
+            return False
+
+        if now - pooled.last_used > self._health_check_interval:
+            try:
+                conn.extend.standard.who_am_i()
+            except LDAPException as e:
+                logger.info("Pooled LDAP connection failed health check: %s", e)
+                with self._lock:
+                    self._stats["health_check_failures"] += 1
+                return False
+
+        return True
+
+    def _checkout(self) -> _PooledConnection:
+        """Take a healthy connection from the pool, opening one if needed."""
+        if self._closed:
+            raise LDAPPoolTimeoutError(f"LDAP pool '{self._name}' is closed")
+
+        if not self._slots.acquire(timeout=self._checkout_timeout):
+            with self._lock:
+                self._stats["timeouts"] += 1
+            raise LDAPPoolTimeoutError(
+                f"Timed out waiting for a connection from LDAP pool '{self._name}'"
+            )
+
+        try:
+            while True:
+                with self._lock:
+                    pooled = self._idle.pop() if self._idle else None
+
+                if pooled is None:
+                    pooled = self._create()
+                    break
+
+                if self._is_healthy(pooled):
+                    break
+
+                self._discard(pooled)
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._stats["checkouts"] += 1
+        return pooled
+
+    def _checkin(self, pooled: _PooledConnection) -> None:
+        """Return a connection to the idle list."""
+        pooled.last_used = time.monotonic()
+        with self._lock:
+            if not self._closed:
+                self._idle.append(pooled)
+                pooled = None
+        if pooled is not None:
+            self._discard(pooled)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        """Check out a bound connection for the duration of the block.
+
+        LDAP result errors (e.g. noSuchObject) leave the connection usable and
+        it is returned to the pool; any other error discards it.
+        """
+        pooled = self._checkout()
+        try:
+            yield pooled.connection
+        except LDAPOperationResult:
+            self._checkin(pooled)
+            raise
+        except BaseException:
+            self._discard(pooled)
+            self._slots.release()
+            raise
+        else:
+            self._checkin(pooled)
+
+    def close(self) -> None:
+        """Close all idle connections and refuse further checkouts."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for pooled in idle:
+            self._discard(pooled)
+        logger.info("LDAP pool '%s' closed", self._name)
+
+    def stats(self) -> dict:
+        """Get pool statistics for monitoring.
+
+        Returns:
+            Dictionary with pool size, usage and lifetime counters
+        """
+        with self._lock:
+            idle = len(self._idle)
+            return {
+                "name": self._name,
+                "max_size": self._max_size,
+                "open": self._open,
+                "idle": idle,
+                "in_use": self._open - idle,
+                **self._stats,
+            }
+
+
+# Process-wide pools: admin reads, admin writes (master only), and bind-only
+# user authentication
+_admin_pool: Optional[LDAPConnectionPool] = None
+_write_pool: Optional[LDAPConnectionPool] = None
+_bind_pool: Optional[LDAPConnectionPool] = None
+_pools_lock = threading.Lock()
+
+
+def _create_pool(name: str, max_size: int, write: bool = False) -> LDAPConnectionPool:
+    """Create a pool whose connections are opened and bound as the LDAP admin."""
+    settings = get_settings()
+
+    def _factory() -> Connection:
+        return open_connection(
+            settings.ldap_admin_dn,
+            settings.ldap_admin_password,
+            write=write,
+        )
+
+    return LDAPConnectionPool(
+        _factory,
+        max_size=max_size,
+        checkout_timeout=settings.ldap_pool_timeout,
+        health_check_interval=settings.ldap_pool_health_check_interval,
+        max_lifetime=settings.ldap_pool_max_lifetime,
+        name=name,
+    )
+
+
+def get_admin_pool() -> LDAPConnectionPool:
+    """Get the shared pool of admin connections used for searches.
+
+    With ``LDAP_HOSTS`` configured these connections are spread across the
+    read replicas.
+    """
+    global _admin_pool
+
+    if _admin_pool is None:
+        with _pools_lock:
+            if _admin_pool is None:
+                _admin_pool = _create_pool("admin", get_settings().ldap_pool_size)
+    return _admin_pool
+
+
+def get_write_pool() -> LDAPConnectionPool:
+    """Get the shared pool of admin connections to the writable master.
+
+    Without read replicas the master serves everything and this is the
+    admin pool itself.
+    """
+    global _write_pool
+
+    if not get_replica_hosts():
+        return get_admin_pool()
+
+    if _write_pool is None:
+        with _pools_lock:
+            if _write_pool is None:
+                _write_pool = _create_pool(
+                    "write", get_settings().ldap_pool_size, write=True
+                )
+    return _write_pool
+
+
+def get_bind_pool() -> LDAPConnectionPool:
+    """Get the shared pool of bind-only connections used to verify passwords.
+
+    Connections are rebound with each user's credentials, reusing the TCP
+    (and TLS) session instead of opening a new socket per login, and bound
+    back as the service account before check-in. They are never used for
+    searches or writes.
+    """
+    global _bind_pool
+
+    if _bind_pool is None:
+        with _pools_lock:
+            if _bind_pool is None:
+                _bind_pool = _create_pool("bind", get_settings().ldap_bind_pool_size)
+    return _bind_pool
+
+
+def close_ldap_pools() -> None:
+    """Close the shared LDAP connection pools."""
+    global _admin_pool, _write_pool, _bind_pool
+
+    with _pools_lock:
+        for pool in (_admin_pool, _write_pool, _bind_pool):
+            if pool is not None:
+                pool.close()
+        _admin_pool = None
+        _write_pool = None
+        _bind_pool = None
+
+    reset_ldap_server()
@@ -0,0 +1,209 @@
+"""Process-wide LDAP server definitions (master and replicas) and server info (rootDSE/schema) cache."""
+
+import logging
+import threading
+import time
+from typing import Optional, Union
+
+from ldap3 import (
+    ALL,
+    DSA,
+    FIRST,
+    NONE,
+    RANDOM,
+    ROUND_ROBIN,
+    SCHEMA,
+    Connection,
+    Server,
+    ServerPool,
+    set_config_parameter,
+)
+from ldap3.core.exceptions import LDAPBindError, LDAPException, LDAPOperationResult
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_GET_INFO_MODES = {
+    "NONE": NONE,
+    "DSA": DSA,
+    "SCHEMA": SCHEMA,
+    "ALL": ALL,
+}
+
+_POOL_STRATEGIES = {
+    "ROUND_ROBIN": ROUND_ROBIN,
+    "FIRST": FIRST,
+    "RANDOM": RANDOM,
+}
+
+# Shared server objects and the time server info was last read
+_server: Optional[Union[Server, ServerPool]] = None
+_write_server: Optional[Server] = None
+_server_lock = threading.Lock()
+_info_loaded_at: Optional[float] = None
+
+
+def _get_info_mode() -> str:
+    """Get the ldap3 get_info mode from settings."""
+    return _GET_INFO_MODES.get(get_settings().ldap_server_get_info.upper(), NONE)
+
+
+def _build_server(host: str) -> Server:
+    """Create a server definition for ``host`` (``host[:port]``)."""
+    settings = get_settings()
+    return Server(
+        host=host,
+        port=settings.ldap_port,
+        use_ssl=settings.ldap_use_ssl,
+        get_info=_get_info_mode(),
+        connect_timeout=settings.ldap_connect_timeout,
+    )
+
+
+def get_replica_hosts() -> list[str]:
+    """Get the configured read replicas, or an empty list if none are set."""
+    return [h.strip() for h in get_settings().ldap_hosts.split(",") if h.strip()]
+
+
+def get_ldap_write_server() -> Server:
+    """Get the shared definition of the writable LDAP master.
+
+    The server is created once per process. Its rootDSE/schema are not read on
+    bind; see :func:`refresh_server_info`.
+    """
+    global _write_server
+
+    if _write_server is None:
+        with _server_lock:
+            if _write_server is None:
+                settings = get_settings()
+                _write_server = _build_server(
+                    settings.ldap_write_host or settings.ldap_host
+                )
+    return _write_server
+
+
+def get_ldap_server() -> Union[Server, ServerPool]:
+    """Get the shared LDAP server used for binds and searches.
+
+    When ``LDAP_HOSTS`` is set this is a :class:`ServerPool` over the
+    replicas. Each new connection is opened against the next available
+    replica according to ``LDAP_POOL_STRATEGY``; a replica that cannot be
+    reached is skipped for ``LDAP_SERVER_COOLDOWN_SECONDS``. When no replica
+    is reachable after ``LDAP_SERVER_POOL_CYCLES`` passes, opening a
+    connection raises ``LDAPServerPoolExhaustedError``. Otherwise the write
+    server is used for everything.
+    """
+    global _server
+
+    if _server is None:
+        hosts = get_replica_hosts()
+        if not hosts:
+            return get_ldap_write_server()
+
+        with _server_lock:
+            if _server is None:
+                settings = get_settings()
+                strategy = _POOL_STRATEGIES.get(
+                    settings.ldap_pool_strategy.upper(), ROUND_ROBIN
+                )
+                # ldap3 sleeps this long after every pass over the pool
+                set_config_parameter(
+                    "POOLING_LOOP_TIMEOUT", settings.ldap_server_pool_retry_seconds
+                )
+                _server = ServerPool(
+                    [_build_server(host) for host in hosts],
+                    pool_strategy=strategy,
+                    # A finite number of passes (active=True retries forever)
+                    active=max(1, settings.ldap_server_pool_cycles),
+                    exhaust=settings.ldap_server_cooldown_seconds,
+                )
+                logger.info(
+                    "Using LDAP replicas %s (%s)", ", ".join(hosts), strategy
+                )
+    return _server
+
+
+def refresh_server_info(conn: Connection, force: bool = False) -> None:
+    """Read rootDSE/schema through ``conn`` if the cached copy is stale.
+
+    Does nothing when ``LDAP_SERVER_GET_INFO`` is ``NONE``. Otherwise the info
+    is fetched at most once per ``LDAP_SERVER_INFO_REFRESH_SECONDS``.
+
+    Args:
+        conn: A bound connection to one of the shared servers
+        force: Refresh even if the cached info is still fresh
+    """
+    global _info_loaded_at
+
+    if _get_info_mode() == NONE:
+        return
+
+    interval = get_settings().ldap_server_info_refresh_seconds
+    now = time.monotonic()
+    if not force and _info_loaded_at is not None and now - _info_loaded_at < interval:
+        return
+
+    with _server_lock:
+        if not force and _info_loaded_at is not None and now - _info_loaded_at < interval:
+            return
+        try:
+            conn.refresh_server_info()
+            _info_loaded_at = time.monotonic()
+            logger.info("Refreshed LDAP server info from %s", conn.server.host)
+        except LDAPException as e:
+            logger.warning("Failed to refresh LDAP server info: %s", e)
+
+
+def open_connection(
+    user: Optional[str],
+    password: Optional[str],
+    write: bool = False,
+) -> Connection:
+    """Open and bind a connection without re-reading the server info.
+
+    Args:
+        user: Bind DN
+        password: Bind password
+        write: Connect to the writable master instead of a read replica
+
+    Returns:
+        A bound connection
+
+    Raises:
+        LDAPBindError: If the bind is rejected
+    """
+    conn = Connection(
+        get_ldap_write_server() if write else get_ldap_server(),
+        user=user,
+        password=password,
+        raise_exceptions=True,
+        # ldap3 packs this into SO_RCVTIMEO, which needs whole seconds
+        receive_timeout=max(1, int(get_settings().ldap_operation_timeout)),
+        # Transparently fetch ranged (member;range=...) attribute values
+        auto_range=True,
+    )
+    try:
+        conn.open(read_server_info=False)
+        if not conn.bind(read_server_info=False):
+            raise LDAPBindError(conn.last_error or "bind not successful")
+    except LDAPOperationResult as e:
+        conn.unbind()
+        raise LDAPBindError(str(e)) from e
+    except LDAPException:
+        conn.unbind()
+        raise
+
+    refresh_server_info(conn)
+    return conn
+
+
+def reset_ldap_server() -> None:
+    """Drop the shared server definitions and their cached info."""
+    global _server, _write_server, _info_loaded_at
+
+    with _server_lock:
+        _server = None
+        _write_server = None
+        _info_loaded_at = None
@@ -1,5 +1,6 @@
 """Main entry point for the 2FA Backend API."""
 
+import asyncio
 import logging
 import sys
 
@@ -7,8 +8,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import router
+from app.aws import init_aws_clients
 from app.config import get_settings
 from app.database import init_db, close_db
+from app.email import ensure_templates
+from app.ldap import close_ldap_pools, shutdown_ldap_executor
+from app.outbox import get_outbox_dispatcher, stop_outbox_dispatcher
+from app.redis import close_async_otp_client, get_async_otp_client
+from app.security import shutdown_hashing_executor
 
 # Configure logging
 settings = get_settings()
@@ -58,6 +65,27 @@ async def startup_event():
         logger.error("Failed to initialize database: %s", e)
         raise
 
+    # Start delivering queued emails and SMS
+    get_outbox_dispatcher().start()
+
+    # Create shared AWS clients before the first request needs them
+    try:
+        init_aws_clients()
+    except Exception as e:
+        logger.error("Failed to create AWS clients: %s", e)
+
+    # Register SES email templates (sends fall back to rendered emails if missing)
+    if settings.enable_email_verification and settings.ses_use_templates:
+        try:
+            await asyncio.to_thread(ensure_templates)
+        except Exception as e:
+            logger.error("Failed to register SES email templates: %s", e)
+
+    # Open the shared Redis connection pool (falls back to in-memory OTP storage)
+    otp_client = get_async_otp_client()
+    if otp_client.is_enabled:
+        await otp_client.connect()
+
     logger.info("LDAP Host: %s:%s", settings.ldap_host, settings.ldap_port)
     logger.info("TOTP Issuer: %s", settings.totp_issuer)
     logger.info("Email verification: %s", 'enabled' if settings.enable_email_verification else 'disabled')
@@ -70,10 +98,24 @@ async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down %s", settings.app_name)
 
+    # Stop the outbox dispatcher before its database pool goes away
+    await stop_outbox_dispatcher()
+
     # Close database connection
     await close_db()
     logger.info("Database connection closed")
 
+    # Stop LDAP worker threads and close pooled LDAP connections
+    shutdown_ldap_executor()
+    close_ldap_pools()
+    logger.info("LDAP connection pools closed")
+
+    # Close the shared Redis connection pool
+    await close_async_otp_client()
+
+    # Stop password hashing worker threads
+    shutdown_hashing_executor()
+
 
 if __name__ == "__main__":
     import uvicorn
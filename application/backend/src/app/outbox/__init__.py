@@ -0,0 +1,25 @@
+"""Transactional outbox for emails and SMS sent outside the request path."""
+
+from app.outbox.dispatcher import (
+    OutboxDispatcher,
+    get_outbox_dispatcher,
+    stop_outbox_dispatcher,
+)
+from app.outbox.messages import (
+    enqueue,
+    enqueue_admin_notification,
+    enqueue_verification_email,
+    enqueue_verification_sms,
+    enqueue_welcome_email,
+)
+
+__all__ = [
+    "OutboxDispatcher",
+    "enqueue",
+    "enqueue_admin_notification",
+    "enqueue_verification_email",
+    "enqueue_verification_sms",
+    "enqueue_welcome_email",
+    "get_outbox_dispatcher",
+    "stop_outbox_dispatcher",
+]
@@ -0,0 +1,328 @@
+"""Background dispatcher that delivers queued outbox messages."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from sqlalchemy import delete, select
+
+from app.config import get_settings
+from app.database.connection import get_db
+from app.database.models import OutboxMessage, OutboxStatus
+from app.email import EmailClient
+from app.ldap import LDAPClient
+from app.outbox.messages import (
+    ADMIN_DIGEST_RESEND,
+    ADMIN_NOTIFICATION,
+    VERIFICATION_EMAIL,
+    VERIFICATION_SMS,
+    WELCOME_EMAIL,
+    enqueue,
+)
+from app.sms import SMSClient
+
+logger = logging.getLogger(__name__)
+
+# Seconds between purges of delivered messages
+_PURGE_INTERVAL = 3600
+
+# Maximum messages folded into one digest delivery
+_DIGEST_MAX_MESSAGES = 500
+
+
+def _send_verification_email(payload: dict) -> tuple[bool, str]:
+    """Deliver a verification email."""
+    return EmailClient().send_verification_email(**payload)
+
+
+def _send_welcome_email(payload: dict) -> tuple[bool, str]:
+    """Deliver an account activation email."""
+    return EmailClient().send_welcome_email(**payload)
+
+
+def _send_verification_sms(payload: dict) -> tuple[bool, str]:
+    """Deliver a verification SMS."""
+    success, message, _ = SMSClient().send_verification_code(
+        payload["phone_number"], payload["code"]
+    )
+    return success, message
+
+
+def _resend_admin_digest(payload: dict) -> tuple[bool, str]:
+    """Deliver a digest to one admin a bulk send did not reach."""
+    success, message, _ = EmailClient().send_admin_digest_email(
+        [payload["admin_email"]], payload["new_users"]
+    )
+    return success, message
+
+
+def _send_admin_digest(payloads: list[dict]) -> tuple[bool, str, list[str]]:
+    """Deliver one notification email listing all pending signups.
+
+    Returns the admins a partially failed bulk send did not reach.
+    """
+    admin_emails = LDAPClient().get_admin_emails()
+    if not admin_emails:
+        logger.warning("No admin emails found for notification")
+        return True, "No admin emails found", []
+    return EmailClient().send_admin_digest_email(admin_emails, payloads)
+
+
+# Blocking delivery functions per message kind (run on worker threads)
+HANDLERS: dict[str, Callable[[dict], tuple[bool, str]]] = {
+    VERIFICATION_EMAIL: _send_verification_email,
+    VERIFICATION_SMS: _send_verification_sms,
+    WELCOME_EMAIL: _send_welcome_email,
+    ADMIN_DIGEST_RESEND: _resend_admin_digest,
+}
+
+# Kinds whose pending messages are coalesced and delivered by a single call.
+# Handlers also return the recipients a partially failed delivery missed.
+DIGEST_HANDLERS: dict[str, Callable[[list[dict]], tuple[bool, str, list[str]]]] = {
+    ADMIN_NOTIFICATION: _send_admin_digest,
+}
+
+# Kind queued once per recipient a digest missed, so only they get it again
+DIGEST_RESEND_KINDS: dict[str, str] = {
+    ADMIN_NOTIFICATION: ADMIN_DIGEST_RESEND,
+}
+
+
+class OutboxDispatcher:
+    """Drains the outbox table in batches and delivers each message.
+
+    Pending messages are claimed with ``SELECT ... FOR UPDATE SKIP LOCKED``,
+    so several replicas can run a dispatcher without delivering a message
+    twice. Failed deliveries are retried with exponential backoff until
+    ``OUTBOX_MAX_ATTEMPTS`` is reached. When a digest kind (admin
+    notifications) comes due, every pending message of that kind is
+    delivered with it in one call. If that call reaches only some
+    recipients, the digest is recorded as sent and a resend message is
+    queued for each recipient it missed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the dispatcher."""
+        self.settings = get_settings()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._last_purge = 0.0
+
+    def start(self) -> None:
+        """Start the dispatch loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Outbox dispatcher started")
+
+    async def stop(self) -> None:
+        """Stop the dispatch loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Outbox dispatcher stopped")
+
+    def wake(self) -> None:
+        """Dispatch immediately instead of waiting for the next poll."""
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Dispatch batches until cancelled."""
+        while True:
+            try:
+                delivered = await self.dispatch_batch()
+                await self._maybe_purge()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Outbox dispatch failed: %s", e)
+                delivered = 0
+
+            # Keep draining while batches are full
+            if delivered >= self.settings.outbox_batch_size:
+                continue
+
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self.settings.outbox_poll_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _deliver(self, message: OutboxMessage) -> tuple[bool, str]:
+        """Run the handler for a message on a worker thread."""
+        handler = HANDLERS.get(message.kind)
+        if handler is None:
+            return False, f"Unknown outbox message kind: {message.kind}"
+        try:
+            return await asyncio.to_thread(handler, message.payload)
+        except Exception as e:
+            return False, str(e)
+
+    async def _deliver_digest(
+        self,
+        kind: str,
+        messages: list[OutboxMessage],
+    ) -> tuple[bool, str, list[str]]:
+        """Run the digest handler for a group of messages on a worker thread."""
+        handler = DIGEST_HANDLERS[kind]
+        try:
+            return await asyncio.to_thread(
+                handler, [message.payload for message in messages]
+            )
+        except Exception as e:
+            return False, str(e), []
+
+    def _record(self, message: OutboxMessage, success: bool, detail: str) -> None:
+        """Record the outcome of a delivery attempt on a message."""
+        message.attempts += 1
+        if success:
+            message.status = OutboxStatus.SENT.value
+            message.sent_at = datetime.now(timezone.utc)
+            message.last_error = None
+        elif message.attempts >= self.settings.outbox_max_attempts:
+            message.status = OutboxStatus.FAILED.value
+            message.last_error = detail
+            logger.error(
+                "Giving up on %s message %s after %s attempts: %s",
+                message.kind, message.id, message.attempts, detail,
+            )
+        else:
+            message.last_error = detail
+            message.next_attempt_at = datetime.now(timezone.utc) + timedelta(
+                seconds=self._retry_delay(message.attempts)
+            )
+            logger.warning(
+                "Delivery of %s message %s failed (attempt %s): %s",
+                message.kind, message.id, message.attempts, detail,
+            )
+
+    def _retry_delay(self, attempts: int) -> float:
+        """Get the exponential backoff delay after a failed attempt."""
+        delay = self.settings.outbox_retry_base_seconds * (2 ** (attempts - 1))
+        return min(delay, self.settings.outbox_retry_max_seconds)
+
+    async def dispatch_batch(self) -> int:
+        """
+        Claim and deliver one batch of due messages.
+
+        Returns:
+            Number of messages processed
+        """
+        now = datetime.now(timezone.utc)
+
+        async with get_db() as session:
+            result = await session.execute(
+                select(OutboxMessage)
+                .where(
+                    OutboxMessage.status == OutboxStatus.PENDING.value,
+                    OutboxMessage.next_attempt_at <= now,
+                )
+                .order_by(OutboxMessage.next_attempt_at)
+                .limit(self.settings.outbox_batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            messages = list(result.scalars().all())
+            if not messages:
+                return 0
+
+            single: list[OutboxMessage] = []
+            digests: dict[str, list[OutboxMessage]] = {}
+            for message in messages:
+                if message.kind in DIGEST_HANDLERS:
+                    digests.setdefault(message.kind, []).append(message)
+                else:
+                    single.append(message)
+
+            # Fold the rest of each due digest (even if not yet due) into it
+            for kind, group in digests.items():
+                extra = await session.execute(
+                    select(OutboxMessage)
+                    .where(
+                        OutboxMessage.status == OutboxStatus.PENDING.value,
+                        OutboxMessage.kind == kind,
+                        OutboxMessage.id.not_in([m.id for m in group]),
+                    )
+                    .order_by(OutboxMessage.created_at)
+                    .limit(max(0, _DIGEST_MAX_MESSAGES - len(group)))
+                    .with_for_update(skip_locked=True)
+                )
+                group.extend(extra.scalars().all())
+
+            outcomes = await asyncio.gather(
+                *(self._deliver(message) for message in single),
+                *(self._deliver_digest(kind, group) for kind, group in digests.items()),
+            )
+
+            for message, (success, detail) in zip(single, outcomes):
+                self._record(message, success, detail)
+            for (kind, group), (success, detail, missed) in zip(
+                digests.items(), outcomes[len(single):]
+            ):
+                if not success and missed:
+                    # Others already have it: retry only the missed recipients
+                    payloads = [message.payload for message in group]
+                    for recipient in missed:
+                        enqueue(session, DIGEST_RESEND_KINDS[kind], {
+                            "admin_email": recipient,
+                            "new_users": payloads,
+                        })
+                    logger.warning(
+                        "%s digest missed %s recipients, queued resends: %s",
+                        kind, len(missed), detail,
+                    )
+                    success, detail = True, f"Resend queued for {len(missed)} recipients"
+                for message in group:
+                    self._record(message, success, detail)
+
+        logger.debug(
+            "Dispatched %s outbox messages (%s digests)", len(messages), len(digests)
+        )
+        return len(messages)
+
+    async def _maybe_purge(self) -> None:
+        """Delete delivered messages older than the retention period."""
+        if time.monotonic() - self._last_purge < _PURGE_INTERVAL:
+            return
+        self._last_purge = time.monotonic()
+
+        cutoff = datetime.now(timezone.utc) - timedelta(
+            hours=self.settings.outbox_retention_hours
+        )
+        async with get_db() as session:
+            result = await session.execute(
+                delete(OutboxMessage).where(
+                    OutboxMessage.status == OutboxStatus.SENT.value,
+                    OutboxMessage.sent_at < cutoff,
+                )
+            )
+        if result.rowcount:
+            logger.info("Purged %s delivered outbox messages", result.rowcount)
+
+
+# Process-wide dispatcher
+_dispatcher: Optional[OutboxDispatcher] = None
+
+
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    """Get the shared outbox dispatcher."""
+    global _dispatcher
+
+    if _dispatcher is None:
+        _dispatcher = OutboxDispatcher()
+    return _dispatcher
+
+
+async def stop_outbox_dispatcher() -> None:
+    """Stop the shared outbox dispatcher."""
+    global _dispatcher
+
+    if _dispatcher is not None:
+        await _dispatcher.stop()
+        _dispatcher = None
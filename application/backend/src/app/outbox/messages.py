@@ -0,0 +1,103 @@
+"""Enqueue outgoing messages in the caller's database transaction."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database.models import OutboxMessage, User
+
+logger = logging.getLogger(__name__)
+
+# Message kinds understood by the dispatcher
+VERIFICATION_EMAIL = "verification_email"
+VERIFICATION_SMS = "verification_sms"
+ADMIN_NOTIFICATION = "admin_notification"
+# A delivered digest resent to one admin it did not reach
+ADMIN_DIGEST_RESEND = "admin_digest_resend"
+WELCOME_EMAIL = "welcome_email"
+
+
+def enqueue(
+    session: AsyncSession,
+    kind: str,
+    payload: dict,
+    delay_seconds: Optional[float] = None,
+) -> OutboxMessage:
+    """
+    Add a message to the outbox.
+
+    The message is only persisted (and becomes visible to the dispatcher)
+    when the caller's transaction commits.
+
+    Args:
+        session: Database session of the triggering change
+        kind: Message kind
+        payload: JSON-serializable handler arguments
+        delay_seconds: Hold the message back for this long before delivery
+
+    Returns:
+        The pending outbox message
+    """
+    message = OutboxMessage(kind=kind, payload=payload)
+    if delay_seconds:
+        message.next_attempt_at = datetime.now(timezone.utc) + timedelta(
+            seconds=delay_seconds
+        )
+    session.add(message)
+    logger.debug("Queued %s message", kind)
+    return message
+
+
+def enqueue_verification_email(
+    session: AsyncSession,
+    user: User,
+    token: str,
+) -> OutboxMessage:
+    """Queue an email verification link for a user."""
+    return enqueue(session, VERIFICATION_EMAIL, {
+        "to_email": user.email,
+        "token": token,
+        "username": user.username,
+        "first_name": user.first_name,
+    })
+
+
+def enqueue_verification_sms(
+    session: AsyncSession,
+    user: User,
+    code: str,
+) -> OutboxMessage:
+    """Queue a phone verification code for a user."""
+    return enqueue(session, VERIFICATION_SMS, {
+        "phone_number": user.full_phone_number,
+        "code": code,
+    })
+
+
+def enqueue_welcome_email(session: AsyncSession, user: User) -> OutboxMessage:
+    """Queue the account activation email for a user."""
+    return enqueue(session, WELCOME_EMAIL, {
+        "to_email": user.email,
+        "username": user.username,
+        "first_name": user.first_name,
+    })
+
+
+def enqueue_admin_notification(session: AsyncSession, user: User) -> OutboxMessage:
+    """
+    Queue a new-signup notification for the admins.
+
+    Notifications are held back for ``ADMIN_NOTIFICATION_DIGEST_SECONDS``;
+    the dispatcher then sends every pending notification in one digest
+    email, so a burst of signups costs one admin lookup and one send.
+    """
+    return enqueue(session, ADMIN_NOTIFICATION, {
+        "username": user.username,
+        "full_name": user.full_name,
+        "email": user.email,
+        "phone": user.full_phone_number,
+        "signup_time": datetime.now(timezone.utc).isoformat(),
+    }, delay_seconds=get_settings().admin_notification_digest_seconds)
@@ -1,5 +1,19 @@
 """Redis module for SMS OTP storage."""
 
-from app.redis.client import RedisOTPClient, get_otp_client
+from app.redis.async_client import (
+    AsyncRedisOTPClient,
+    RedisPoolExhaustedError,
+    close_async_otp_client,
+    get_async_otp_client,
+)
+from app.redis.client import OTPVerifyResult, RedisOTPClient, get_otp_client
 
-__all__ = ["RedisOTPClient", "get_otp_client"]
+__all__ = [
+    "AsyncRedisOTPClient",
+    "OTPVerifyResult",
+    "RedisOTPClient",
+    "RedisPoolExhaustedError",
+    "close_async_otp_client",
+    "get_async_otp_client",
+    "get_otp_client",
+]
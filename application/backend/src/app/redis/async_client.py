@@ -0,0 +1,416 @@
+"""Asyncio Redis client for SMS OTP operations.
+
+Uses ``redis.asyncio`` with a single connection pool shared by the whole
+process, so OTP reads and writes never block the event loop.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app.config import get_settings
+from app.redis.client import (
+    VERIFY_AND_CONSUME_SCRIPT,
+    _VERIFY_RESULTS,
+    ConnectionState,
+    OTPVerifyResult,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RedisPoolExhaustedError(redis.RedisError):
+    """No pooled connection became free within ``REDIS_POOL_TIMEOUT``."""
+
+
+class _BlockingConnectionPool(aioredis.BlockingConnectionPool):
+    """Blocking pool that tells a full pool apart from an unreachable server.
+
+    redis-py raises ``ConnectionError`` for both. A checkout timeout only
+    means every connection is busy, so it is raised as
+    :class:`RedisPoolExhaustedError` and must not mark Redis down.
+    """
+
+    async def get_connection(self, command_name, *keys, **options):
+        """Get a connection from the pool, blocking until one is available."""
+        try:
+            return await super().get_connection(command_name, *keys, **options)
+        except redis.ConnectionError as e:
+            if isinstance(e.__cause__, asyncio.TimeoutError):
+                raise RedisPoolExhaustedError(
+                    f"No Redis connection free after {self.timeout}s"
+                ) from e
+            raise
+
+
+class AsyncRedisOTPClient:
+    """Async Redis client for SMS OTP operations.
+
+    Provides the same storage semantics as :class:`RedisOTPClient` (JSON
+    values with TTL-based expiration) for use from async request handlers.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the async Redis OTP client."""
+        self._settings = get_settings()
+        self._pool: Optional[_BlockingConnectionPool] = None
+        self._client: Optional[aioredis.Redis] = None
+        self._verify_script = None
+        self._state = ConnectionState(self._settings.redis_health_check_interval)
+        self._probe_task: Optional[asyncio.Task] = None
+
+        if self._settings.redis_enabled:
+            self._initialize_client()
+
+    def _initialize_client(self) -> None:
+        """Create the shared connection pool and client (no I/O)."""
+        connection_class = (
+            aioredis.SSLConnection if self._settings.redis_ssl else aioredis.Connection
+        )
+        # Waits up to REDIS_POOL_TIMEOUT for a free connection instead of
+        # opening more than REDIS_MAX_CONNECTIONS
+        self._pool = _BlockingConnectionPool(
+            max_connections=self._settings.redis_max_connections,
+            timeout=self._settings.redis_pool_timeout,
+            connection_class=connection_class,
+            host=self._settings.redis_host,
+            port=self._settings.redis_port,
+            password=self._settings.redis_password or None,
+            db=self._settings.redis_db,
+            decode_responses=True,
+            socket_connect_timeout=self._settings.redis_socket_connect_timeout,
+            socket_timeout=self._settings.redis_socket_timeout,
+            retry_on_timeout=True,
+        )
+        self._client = aioredis.Redis(connection_pool=self._pool)
+        # Sent with EVALSHA; the script is loaded on first use and its SHA cached
+        self._verify_script = self._client.register_script(VERIFY_AND_CONSUME_SCRIPT)
+
+    async def _execute(self, command: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Run a Redis command and record its outcome in the connection state.
+
+        Pool exhaustion propagates without changing the state: Redis is
+        reachable, just busy.
+        """
+        try:
+            result = await command(*args)
+        except RedisPoolExhaustedError:
+            logger.warning("Redis connection pool exhausted")
+            raise
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            self._state.mark_down(e)
+            raise
+        self._state.mark_up()
+        return result
+
+    async def _probe_loop(self) -> None:
+        """Periodically PING Redis to keep the connection state current."""
+        interval = self._settings.redis_health_check_interval
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._execute(self._client.ping)
+            except redis.RedisError as e:
+                logger.debug("Redis health probe failed: %s", e)
+
+    async def connect(self) -> bool:
+        """Verify the connection to Redis and start the background health probe.
+
+        Returns:
+            True if Redis answered, False otherwise
+        """
+        if not self._client:
+            return False
+
+        try:
+            await self._execute(self._client.ping)
+            logger.info(
+                "Redis connected successfully to %s:%s",
+                self._settings.redis_host,
+                self._settings.redis_port,
+            )
+        except redis.AuthenticationError as e:
+            logger.error("Redis authentication failed: %s", e)
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            logger.error("Failed to connect to Redis: %s", e)
+
+        if self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._probe_loop())
+        return self._state.is_up
+
+    async def close(self) -> None:
+        """Stop the health probe and disconnect all pooled connections."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+        if self._client:
+            await self._client.aclose()
+        if self._pool:
+            await self._pool.disconnect()
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if Redis is enabled in settings."""
+        return self._settings.redis_enabled
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if Redis client is connected.
+
+        Reflects the outcome of the last command or health probe; no
+        round-trip is made.
+        """
+        return self._client is not None and self._state.is_up
+
+    def _get_key(self, username: str) -> str:
+        """Generate the Redis key for a username."""
+        return f"{self._settings.redis_key_prefix}{username}"
+
+    def _get_attempts_key(self, username: str) -> str:
+        """Generate the Redis key holding a username's failed attempt count."""
+        return f"{self._get_key(username)}:attempts"
+
+    async def store_code(
+        self,
+        username: str,
+        code: str,
+        phone_number: str,
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        """Store OTP code with automatic TTL expiration.
+
+        Args:
+            username: The username to store the code for
+            code: The verification code
+            phone_number: The phone number (for reference)
+            ttl_seconds: Time-to-live in seconds (defaults to settings value)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.is_enabled:
+            logger.debug("Redis not enabled, skipping store_code")
+            return False
+
+        if not self.is_connected:
+            logger.error("Redis not connected, cannot store code")
+            return False
+
+        try:
+            key = self._get_key(username)
+            value = json.dumps({
+                "code": code,
+                "phone_number": phone_number,
+            })
+            ttl = ttl_seconds or self._settings.sms_code_expiry_seconds
+
+            # A new code resets the attempt counter
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.setex(key, ttl, value)
+                pipe.delete(self._get_attempts_key(username))
+                await self._execute(pipe.execute)
+            logger.debug("Stored OTP code for %s with TTL %ss", username, ttl)
+            return True
+        except redis.RedisError as e:
+            logger.error("Failed to store OTP code: %s", e)
+            return False
+
+    async def get_code(self, username: str) -> Optional[dict]:
+        """Retrieve OTP code data if not expired.
+
+        Args:
+            username: The username to retrieve the code for
+
+        Returns:
+            Dictionary with 'code' and 'phone_number' keys, or None if not found
+        """
+        if not self.is_enabled:
+            logger.debug("Redis not enabled, skipping get_code")
+            return None
+
+        if not self.is_connected:
+            logger.error("Redis not connected, cannot get code")
+            return None
+
+        try:
+            key = self._get_key(username)
+            value = await self._execute(self._client.get, key)
+
+            if value is None:
+                logger.debug("No OTP code found for %s", username)
+                return None
+
+            data = json.loads(value)
+            logger.debug("Retrieved OTP code for %s", username)
+            return data
+        except redis.RedisError as e:
+            logger.error("Failed to retrieve OTP code: %s", e)
+            return None
+        except json.JSONDecodeError as e:
+            logger.error("Failed to decode OTP data: %s", e)
+            return None
+
+    async def verify_and_consume(self, username: str, code: str) -> OTPVerifyResult:
+        """Atomically verify an OTP code and delete it on success.
+
+        See :meth:`RedisOTPClient.verify_and_consume`.
+
+        Args:
+            username: The username the code was sent to
+            code: The code submitted by the user
+
+        Returns:
+            The verification outcome
+        """
+        if not self.is_enabled or not self.is_connected:
+            logger.error("Redis not connected, cannot verify code")
+            return OTPVerifyResult.ERROR
+
+        try:
+            outcome = await self._execute(
+                self._verify_script,
+                [self._get_key(username), self._get_attempts_key(username)],
+                [code, self._settings.sms_code_max_attempts],
+            )
+        except redis.RedisError as e:
+            logger.error("Failed to verify OTP code: %s", e)
+            return OTPVerifyResult.ERROR
+
+        result = _VERIFY_RESULTS.get(int(outcome), OTPVerifyResult.ERROR)
+        logger.debug("OTP verification for %s: %s", username, result.value)
+        return result
+
+    async def delete_code(self, username: str) -> bool:
+        """Delete OTP code after successful verification.
+
+        Args:
+            username: The username to delete the code for
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.is_enabled:
+            logger.debug("Redis not enabled, skipping delete_code")
+            return False
+
+        if not self.is_connected:
+            logger.error("Redis not connected, cannot delete code")
+            return False
+
+        try:
+            key = self._get_key(username)
+            deleted = await self._execute(self._client.delete, key)
+            logger.debug("Deleted OTP code for %s: %s", username, deleted > 0)
+            return deleted > 0
+        except redis.RedisError as e:
+            logger.error("Failed to delete OTP code: %s", e)
+            return False
+
+    async def code_exists(self, username: str) -> bool:
+        """Check if valid OTP code exists for user.
+
+        Args:
+            username: The username to check
+
+        Returns:
+            True if code exists, False otherwise
+        """
+        if not self.is_enabled:
+            return False
+
+        if not self.is_connected:
+            return False
+
+        try:
+            key = self._get_key(username)
+            return await self._execute(self._client.exists, key) > 0
+        except redis.RedisError as e:
+            logger.error("Failed to check OTP code existence: %s", e)
+            return False
+
+    async def get_ttl(self, username: str) -> int:
+        """Get remaining TTL for a user's OTP code.
+
+        Args:
+            username: The username to check
+
+        Returns:
+            TTL in seconds, -1 if no expiry, -2 if key doesn't exist
+        """
+        if not self.is_enabled or not self.is_connected:
+            return -2
+
+        try:
+            key = self._get_key(username)
+            return await self._execute(self._client.ttl, key)
+        except redis.RedisError as e:
+            logger.error("Failed to get TTL: %s", e)
+            return -2
+
+    async def health_check(self) -> dict:
+        """Perform health check on Redis connection.
+
+        Returns:
+            Dictionary with health status information
+        """
+        if not self.is_enabled:
+            return {
+                "enabled": False,
+                "connected": False,
+                "status": "disabled",
+            }
+
+        try:
+            if self._client and await self._execute(self._client.ping):
+                info = await self._execute(self._client.info, "server")
+                return {
+                    "enabled": True,
+                    "connected": True,
+                    "status": "healthy",
+                    "redis_version": info.get("redis_version", "unknown"),
+                    "state": self._state.snapshot(),
+                }
+        except redis.RedisError as e:
+            return {
+                "enabled": True,
+                "connected": False,
+                "status": "unhealthy",
+                "error": str(e),
+                "state": self._state.snapshot(),
+            }
+
+        return {
+            "enabled": True,
+            "connected": False,
+            "status": "disconnected",
+        }
+
+
+# Process-wide client; its connection pool is shared by all requests
+_async_otp_client: Optional[AsyncRedisOTPClient] = None
+
+
+def get_async_otp_client() -> AsyncRedisOTPClient:
+    """Get the shared async Redis OTP client."""
+    global _async_otp_client
+
+    if _async_otp_client is None:
+        _async_otp_client = AsyncRedisOTPClient()
+    return _async_otp_client
+
+
+async def close_async_otp_client() -> None:
+    """Close the shared async Redis OTP client and its connection pool."""
+    global _async_otp_client
+
+    if _async_otp_client is not None:
+        await _async_otp_client.close()
+        _async_otp_client = None
@@ -4,10 +4,15 @@ Provides a centralized, TTL-aware storage for SMS verification codes,
 replacing the in-memory dictionary approach.
 """
 
+import heapq
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import redis
 
@@ -16,6 +21,111 @@ from app.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+class OTPVerifyResult(str, Enum):
+    """Outcome of an atomic OTP verification."""
+
+    VALID = "valid"  # Code matched and was consumed
+    INVALID = "invalid"  # Code did not match
+    NOT_FOUND = "not_found"  # No code stored, or it expired
+    TOO_MANY_ATTEMPTS = "too_many_attempts"  # Code discarded after max attempts
+    ERROR = "error"  # Redis unavailable or command failed
+
+
+# Verifies and consumes an OTP in a single round-trip.
+# KEYS[1] = code key, KEYS[2] = attempts key
+# ARGV[1] = submitted code, ARGV[2] = max attempts
+VERIFY_AND_CONSUME_SCRIPT = """
+local raw = redis.call('GET', KEYS[1])
+if not raw then
+    return 0
+end
+local attempts = redis.call('INCR', KEYS[2])
+if attempts == 1 then
+    local ttl = redis.call('TTL', KEYS[1])
+    if ttl > 0 then
+        redis.call('EXPIRE', KEYS[2], ttl)
+    end
+end
+if attempts > tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return -1
+end
+local ok, data = pcall(cjson.decode, raw)
+if ok and type(data) == 'table' and data['code'] == ARGV[1] then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 1
+end
+return 2
+"""
+
+_VERIFY_RESULTS = {
+    1: OTPVerifyResult.VALID,
+    2: OTPVerifyResult.INVALID,
+    0: OTPVerifyResult.NOT_FOUND,
+    -1: OTPVerifyResult.TOO_MANY_ATTEMPTS,
+}
+
+
+class ConnectionState:
+    """Tracks Redis reachability from the outcome of real commands.
+
+    Commands that succeed mark the connection up; connection or timeout
+    errors mark it down. Callers read the state instead of sending a PING
+    before every operation, and a periodic probe brings it back up.
+    """
+
+    __slots__ = ("_up", "_last_error", "_last_change", "_last_probe", "_probe_interval")
+
+    def __init__(self, probe_interval: float) -> None:
+        """Initialize the tracker in the disconnected state.
+
+        Args:
+            probe_interval: Minimum seconds between health probes
+        """
+        self._up = False
+        self._last_error: Optional[str] = None
+        self._last_change = time.monotonic()
+        self._last_probe = 0.0
+        self._probe_interval = probe_interval
+
+    @property
+    def is_up(self) -> bool:
+        """Check if the last command reached Redis."""
+        return self._up
+
+    def mark_up(self) -> None:
+        """Record a successful command."""
+        if not self._up:
+            self._up = True
+            self._last_error = None
+            self._last_change = time.monotonic()
+            logger.info("Redis connection is up")
+
+    def mark_down(self, error: Exception) -> None:
+        """Record a connection-level failure."""
+        self._last_error = str(error)
+        if self._up:
+            self._up = False
+            self._last_change = time.monotonic()
+            logger.warning("Redis connection is down: %s", error)
+
+    def probe_due(self) -> bool:
+        """Check (and claim) whether a health probe should run now."""
+        now = time.monotonic()
+        if now - self._last_probe < self._probe_interval:
+            return False
+        self._last_probe = now
+        return True
+
+    def snapshot(self) -> dict:
+        """Get the tracked state for health reporting."""
+        return {
+            "connected": self._up,
+            "last_error": self._last_error,
+            "seconds_in_state": round(time.monotonic() - self._last_change, 1),
+        }
+
+
 class RedisOTPClient:
     """Redis client for SMS OTP operations.
 
@@ -27,7 +137,8 @@ class RedisOTPClient:
         """Initialize the Redis OTP client."""
         self._settings = get_settings()
         self._client: Optional[redis.Redis] = None
-        self._connected = False
+        self._verify_script = None
+        self._state = ConnectionState(self._settings.redis_health_check_interval)
 
         if self._settings.redis_enabled:
             self._initialize_client()
@@ -46,22 +157,30 @@ class RedisOTPClient:
                 socket_timeout=5,
                 retry_on_timeout=True,
             )
+            # Sent with EVALSHA; the script is loaded on first use and its SHA cached
+            self._verify_script = self._client.register_script(VERIFY_AND_CONSUME_SCRIPT)
             # Test connection
-            self._client.ping()
-            self._connected = True
+            self._state.probe_due()
+            self._execute(self._client.ping)
             logger.info(
                 "Redis connected successfully to %s:%s",
                 self._settings.redis_host,
                 self._settings.redis_port,
             )
-        except redis.ConnectionError as e:
-            logger.error("Failed to connect to Redis: %s", e)
-            self._connected = False
-            self._client = None
         except redis.AuthenticationError as e:
             logger.error("Redis authentication failed: %s", e)
-            self._connected = False
-            self._client = None
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            logger.error("Failed to connect to Redis: %s", e)
+
+    def _execute(self, command: Callable[..., Any], *args: Any) -> Any:
+        """Run a Redis command and record its outcome in the connection state."""
+        try:
+            result = command(*args)
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            self._state.mark_down(e)
+            raise
+        self._state.mark_up()
+        return result
 
     @property
     def is_enabled(self) -> bool:
@@ -70,20 +189,29 @@ class RedisOTPClient:
 
     @property
     def is_connected(self) -> bool:
-        """Check if Redis client is connected."""
-        if not self._connected or not self._client:
-            return False
-        try:
-            self._client.ping()
-            return True
-        except (redis.ConnectionError, redis.TimeoutError):
-            self._connected = False
+        """Check if Redis client is connected.
+
+        Reflects the outcome of the last command. While disconnected, a PING
+        is sent at most once per ``REDIS_HEALTH_CHECK_INTERVAL`` to detect
+        recovery; while connected no extra round-trip is made.
+        """
+        if not self._client:
             return False
+        if not self._state.is_up and self._state.probe_due():
+            try:
+                self._execute(self._client.ping)
+            except redis.RedisError:
+                pass
+        return self._state.is_up
 
     def _get_key(self, username: str) -> str:
         """Generate the Redis key for a username."""
         return f"{self._settings.redis_key_prefix}{username}"
 
+    def _get_attempts_key(self, username: str) -> str:
+        """Generate the Redis key holding a username's failed attempt count."""
+        return f"{self._get_key(username)}:attempts"
+
     def store_code(
         self,
         username: str,
@@ -118,7 +246,11 @@ class RedisOTPClient:
             })
             ttl = ttl_seconds or self._settings.sms_code_expiry_seconds
 
-            self._client.setex(key, ttl, value)
+            # A new code resets the attempt counter
+            pipe = self._client.pipeline(transaction=True)
+            pipe.setex(key, ttl, value)
+            pipe.delete(self._get_attempts_key(username))
+            self._execute(pipe.execute)
             logger.debug("Stored OTP code for %s with TTL %ss", username, ttl)
             return True
         except redis.RedisError as e:
@@ -144,7 +276,7 @@ class RedisOTPClient:
 
         try:
             key = self._get_key(username)
-            value = self._client.get(key)
+            value = self._execute(self._client.get, key)
 
             if value is None:
                 logger.debug("No OTP code found for %s", username)
@@ -160,6 +292,39 @@ class RedisOTPClient:
             logger.error("Failed to decode OTP data: %s", e)
             return None
 
+    def verify_and_consume(self, username: str, code: str) -> OTPVerifyResult:
+        """Atomically verify an OTP code and delete it on success.
+
+        Runs server-side in one round-trip: compares the code, counts the
+        attempt and deletes the code when it matches, so the same code can
+        never be accepted twice. Once ``SMS_CODE_MAX_ATTEMPTS`` attempts have
+        been made the code is discarded.
+
+        Args:
+            username: The username the code was sent to
+            code: The code submitted by the user
+
+        Returns:
+            The verification outcome
+        """
+        if not self.is_enabled or not self.is_connected:
+            logger.error("Redis not connected, cannot verify code")
+            return OTPVerifyResult.ERROR
+
+        try:
+            outcome = self._execute(
+                self._verify_script,
+                [self._get_key(username), self._get_attempts_key(username)],
+                [code, self._settings.sms_code_max_attempts],
+            )
+        except redis.RedisError as e:
+            logger.error("Failed to verify OTP code: %s", e)
+            return OTPVerifyResult.ERROR
+
+        result = _VERIFY_RESULTS.get(int(outcome), OTPVerifyResult.ERROR)
+        logger.debug("OTP verification for %s: %s", username, result.value)
+        return result
+
     def delete_code(self, username: str) -> bool:
         """Delete OTP code after successful verification.
 
@@ -179,7 +344,7 @@ class RedisOTPClient:
 
         try:
             key = self._get_key(username)
-            deleted = self._client.delete(key)
+            deleted = self._execute(self._client.delete, key)
             logger.debug("Deleted OTP code for %s: %s", username, deleted > 0)
             return deleted > 0
         except redis.RedisError as e:
@@ -203,7 +368,7 @@ class RedisOTPClient:
 
         try:
             key = self._get_key(username)
-            return self._client.exists(key) > 0
+            return self._execute(self._client.exists, key) > 0
         except redis.RedisError as e:
             logger.error("Failed to check OTP code existence: %s", e)
             return False
@@ -222,7 +387,7 @@ class RedisOTPClient:
 
         try:
             key = self._get_key(username)
-            return self._client.ttl(key)
+            return self._execute(self._client.ttl, key)
         except redis.RedisError as e:
             logger.error("Failed to get TTL: %s", e)
             return -2
@@ -241,8 +406,8 @@ class RedisOTPClient:
             }
 
         try:
-            if self._client and self._client.ping():
-                info = self._client.info("server")
+            if self._client and self._execute(self._client.ping):
+                info = self._execute(self._client.info, "server")
                 return {
                     "enabled": True,
                     "connected": True,
@@ -264,8 +429,137 @@ class RedisOTPClient:
         }
 
 
+class _OTPEntry:
+    """A stored code; slots keep per-entry overhead small."""
+
+    __slots__ = ("code", "phone_number", "expires_at")
+
+    def __init__(self, code: str, phone_number: str, expires_at: float) -> None:
+        self.code = code
+        self.phone_number = phone_number
+        self.expires_at = expires_at
+
+
+class BoundedOTPStore:
+    """Thread-safe, bounded in-memory OTP store with self-expiring entries.
+
+    Expiry times are kept in a min-heap and expired entries are swept at most
+    once per ``sweep_interval`` during normal operations, so abandoned codes
+    do not accumulate. When ``max_entries`` is reached the least recently
+    used entry is evicted.
+    """
+
+    def __init__(self, max_entries: int = 10000, sweep_interval: float = 30.0) -> None:
+        """Initialize the store.
+
+        Args:
+            max_entries: Maximum number of codes held
+            sweep_interval: Minimum seconds between expiry sweeps
+        """
+        self._max_entries = max(1, max_entries)
+        self._sweep_interval = sweep_interval
+        self._entries: OrderedDict[str, _OTPEntry] = OrderedDict()
+        # (expires_at, username); may hold stale items for overwritten codes
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _sweep(self, now: float) -> None:
+        """Drop expired entries (lock must be held)."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, username = heapq.heappop(heap)
+            entry = self._entries.get(username)
+            # Skip heap items left behind by a newer code for the same user
+            if entry is not None and entry.expires_at == expires_at:
+                del self._entries[username]
+                self._expirations += 1
+
+        # Rebuild the heap if stale items dominate it
+        if len(heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, username) for username, entry in self._entries.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+        self._last_sweep = time.monotonic()
+
+    def _maybe_sweep(self) -> None:
+        """Sweep if the sweep interval has elapsed (lock must be held)."""
+        if time.monotonic() - self._last_sweep >= self._sweep_interval:
+            self._sweep(time.time())
+
+    def set(self, username: str, code: str, phone_number: str, expires_at: float) -> None:
+        """Store a code, replacing any previous code for the user."""
+        with self._lock:
+            self._maybe_sweep()
+            self._entries.pop(username, None)
+            while len(self._entries) >= self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            self._entries[username] = _OTPEntry(code, phone_number, expires_at)
+            heapq.heappush(self._expiry_heap, (expires_at, username))
+
+    def get(self, username: str) -> Optional[dict]:
+        """Get a user's code as a dict, or None if missing or swept."""
+        with self._lock:
+            self._maybe_sweep()
+            entry = self._entries.get(username)
+            if entry is None:
+                return None
+            self._entries.move_to_end(username)
+            return {
+                "code": entry.code,
+                "phone_number": entry.phone_number,
+                "expires_at": entry.expires_at,
+            }
+
+    def delete(self, username: str) -> bool:
+        """Delete a user's code."""
+        with self._lock:
+            return self._entries.pop(username, None) is not None
+
+    def __contains__(self, username: str) -> bool:
+        with self._lock:
+            return username in self._entries
+
+    def sweep(self) -> None:
+        """Drop all expired entries now."""
+        with self._lock:
+            self._sweep(time.time())
+
+    def stats(self) -> dict:
+        """Get store statistics."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "heap_size": len(self._expiry_heap),
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+
 # In-memory fallback storage when Redis is disabled
-_inmemory_sms_codes: dict[str, dict] = {}
+_inmemory_store: Optional[BoundedOTPStore] = None
+_inmemory_store_lock = threading.Lock()
+
+
+def get_inmemory_store() -> BoundedOTPStore:
+    """Get the process-wide in-memory OTP store."""
+    global _inmemory_store
+
+    if _inmemory_store is None:
+        with _inmemory_store_lock:
+            if _inmemory_store is None:
+                settings = get_settings()
+                _inmemory_store = BoundedOTPStore(
+                    max_entries=settings.inmemory_otp_max_entries,
+                    sweep_interval=settings.inmemory_otp_sweep_seconds,
+                )
+    return _inmemory_store
 
 
 class InMemoryOTPStorage:
@@ -282,30 +576,28 @@ class InMemoryOTPStorage:
         expires_at: float,
     ) -> bool:
         """Store code in memory with expiration timestamp."""
-        _inmemory_sms_codes[username] = {
-            "code": code,
-            "phone_number": phone_number,
-            "expires_at": expires_at,
-        }
+        get_inmemory_store().set(username, code, phone_number, expires_at)
         return True
 
     @staticmethod
     def get_code(username: str) -> Optional[dict]:
         """Get code from memory."""
-        return _inmemory_sms_codes.get(username)
+        return get_inmemory_store().get(username)
 
     @staticmethod
     def delete_code(username: str) -> bool:
         """Delete code from memory."""
-        if username in _inmemory_sms_codes:
-            del _inmemory_sms_codes[username]
-            return True
-        return False
+        return get_inmemory_store().delete(username)
 
     @staticmethod
     def code_exists(username: str) -> bool:
         """Check if code exists in memory."""
-        return username in _inmemory_sms_codes
+        return username in get_inmemory_store()
+
+    @staticmethod
+    def stats() -> dict:
+        """Get in-memory storage statistics."""
+        return get_inmemory_store().stats()
 
 
 @lru_cache
@@ -0,0 +1,15 @@
+"""Security module for password hashing."""
+
+from app.security.hashing import (
+    PasswordHashingOverloadedError,
+    hash_password,
+    shutdown_hashing_executor,
+    verify_password,
+)
+
+__all__ = [
+    "PasswordHashingOverloadedError",
+    "hash_password",
+    "shutdown_hashing_executor",
+    "verify_password",
+]
@@ -0,0 +1,130 @@
+"""Password hashing on a dedicated, bounded thread pool."""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import bcrypt
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHashingOverloadedError(Exception):
+    """Raised when too many hashing operations are already running or queued."""
+
+
+# bcrypt releases the GIL, so a thread pool sized to the cores runs hashes in
+# parallel without blocking the event loop
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+_pending = 0
+
+
+def get_hashing_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool used for password hashing."""
+    global _executor, _executor_workers
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor_workers = (
+                    get_settings().password_hash_workers or os.cpu_count() or 1
+                )
+                _executor = ThreadPoolExecutor(
+                    max_workers=_executor_workers,
+                    thread_name_prefix="bcrypt",
+                )
+    return _executor
+
+
+def shutdown_hashing_executor() -> None:
+    """Shut down the shared hashing executor."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+async def _run(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a hashing call on the executor, shedding load when it is saturated.
+
+    At most ``workers + PASSWORD_HASH_MAX_QUEUE`` calls may be running or
+    waiting at once; beyond that the call fails immediately instead of
+    queueing without bound.
+
+    Raises:
+        PasswordHashingOverloadedError: If the queue is full
+    """
+    global _pending
+
+    executor = get_hashing_executor()
+    limit = _executor_workers + get_settings().password_hash_max_queue
+
+    with _executor_lock:
+        if _pending >= limit:
+            logger.warning("Password hashing queue full (%s pending)", _pending)
+            raise PasswordHashingOverloadedError("Password hashing is overloaded")
+        _pending += 1
+
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args))
+    finally:
+        with _executor_lock:
+            _pending -= 1
+
+
+def _hash(password: str, rounds: int) -> str:
+    """Hash a password with bcrypt (blocking)."""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=rounds)).decode()
+
+
+def _verify(password: str, hashed: str) -> bool:
+    """Verify a password against a bcrypt hash (blocking)."""
+    try:
+        return bcrypt.checkpw(password.encode(), hashed.encode())
+    except ValueError:
+        logger.warning("Stored password hash is not a valid bcrypt hash")
+        return False
+
+
+async def hash_password(password: str) -> str:
+    """
+    Hash a password with bcrypt using the configured cost factor.
+
+    Args:
+        password: Plain-text password
+
+    Returns:
+        bcrypt hash
+
+    Raises:
+        PasswordHashingOverloadedError: If the hashing queue is full
+    """
+    return await _run(_hash, password, get_settings().bcrypt_rounds)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    """
+    Verify a password against a bcrypt hash.
+
+    Args:
+        password: Plain-text password
+        hashed: Stored bcrypt hash
+
+    Returns:
+        True if the password matches
+
+    Raises:
+        PasswordHashingOverloadedError: If the hashing queue is full
+    """
+    return await _run(_verify, password, hashed)
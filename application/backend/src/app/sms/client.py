@@ -7,9 +7,9 @@ import string
 from typing import Optional
 import hashlib
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 
+from app.aws import get_sns_client
 from app.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
@@ -28,12 +28,9 @@ class SMSClient:
 
     @property
     def sns_client(self):
-        """Get or create SNS client."""
+        """Get the shared SNS client."""
         if self._sns_client is None:
-            self._sns_client = boto3.client(
-                "sns",
-                region_name=self.settings.aws_region,
-            )
+            self._sns_client = get_sns_client()
         return self._sns_client
 
     def validate_phone_number(self, phone_number: str) -> tuple[bool, str]:
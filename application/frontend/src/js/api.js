@@ -292,13 +292,17 @@ const API = {
      * @param {string} adminUsername - Admin username
      * @param {string} adminPassword - Admin password
      * @param {string} statusFilter - Optional status filter
-     * @returns {Promise<Object>} User list response
+     * @param {string} cursor - Optional cursor of the page to fetch (next_cursor of the previous page)
+     * @returns {Promise<Object>} User list response (one page)
      */
-    async adminListUsers(adminUsername, adminPassword, statusFilter = null) {
+    async adminListUsers(adminUsername, adminPassword, statusFilter = null, cursor = null) {
         let url = `/admin/users?admin_username=${encodeURIComponent(adminUsername)}&admin_password=${encodeURIComponent(adminPassword)}`;
         if (statusFilter) {
             url += `&status_filter=${encodeURIComponent(statusFilter)}`;
         }
+        if (cursor) {
+            url += `&cursor=${encodeURIComponent(cursor)}`;
+        }
         return this.request(url);
     },
 
@@ -481,9 +485,9 @@ const API = {
     // =========================================================================
 
     /**
-     * List users with enhanced filtering/sorting/search
-     * @param {Object} params - Query parameters
-     * @returns {Promise<Object>} Users list response
+     * List one page of users with enhanced filtering/sorting/search
+     * @param {Object} params - Query parameters (pass the previous page's next_cursor as cursor)
+     * @returns {Promise<Object>} Users list response ({ users, total, next_cursor })
      */
     async adminListUsersEnhanced(params = {}) {
         const query = new URLSearchParams();
@@ -492,11 +496,28 @@ const API = {
         if (params.search) query.set('search', params.search);
         if (params.sort_by) query.set('sort_by', params.sort_by);
         if (params.sort_order) query.set('sort_order', params.sort_order);
+        if (params.cursor) query.set('cursor', params.cursor);
+        if (params.limit) query.set('limit', params.limit);
 
         const queryStr = query.toString();
         return this.authRequest(`/admin/users/enhanced${queryStr ? '?' + queryStr : ''}`);
     },
 
+    /**
+     * Count users matching the list filters
+     * @param {Object} params - Query parameters (status_filter, group_filter, search)
+     * @returns {Promise<Object>} Count response ({ total })
+     */
+    async adminCountUsers(params = {}) {
+        const query = new URLSearchParams();
+        if (params.status_filter) query.set('status_filter', params.status_filter);
+        if (params.group_filter) query.set('group_filter', params.group_filter);
+        if (params.search) query.set('search', params.search);
+
+        const queryStr = query.toString();
+        return this.authRequest(`/admin/users/count${queryStr ? '?' + queryStr : ''}`);
+    },
+
     /**
      * Revoke an active user
      * @param {string} userId - User ID
@@ -30,7 +30,10 @@ const App = {
     currentUser: null, // Store current signup user for verification
     session: null, // Store logged in session { username, isAdmin, token }
     groups: [], // Cache of groups for admin
-    users: [], // Cache of users for admin
+    users: [], // Cache of users for admin (pages loaded so far)
+    usersCursor: null, // Cursor of the next users page (null on the last page)
+    usersTotal: 0, // Number of users matching the current filters
+    usersRequestId: 0, // Ignores responses of superseded user list requests
     sortState: { field: 'created_at', order: 'desc' },
 
     /**
@@ -918,6 +921,9 @@ const App = {
         // Refresh
         refreshBtn.addEventListener('click', () => this.loadAdminUsers());
 
+        // Next page
+        document.getElementById('users-load-more-btn').addEventListener('click', () => this.loadAdminUsers(true));
+
         // Sortable headers
         document.querySelectorAll('#users-table th.sortable').forEach(th => {
             th.addEventListener('click', () => {
@@ -936,37 +942,65 @@ const App = {
 
     /**
      * Load admin users list
+     * @param {boolean} loadMore - Append the next page instead of reloading from the first
      */
-    async loadAdminUsers() {
+    async loadAdminUsers(loadMore = false) {
         if (!this.session || !this.session.isAdmin) return;
+        if (loadMore && !this.usersCursor) return;
 
         const tableBody = document.getElementById('users-table-body');
         const loading = document.getElementById('users-loading');
         const empty = document.getElementById('users-empty');
+        const pagination = document.getElementById('users-pagination');
+        const loadMoreBtn = document.getElementById('users-load-more-btn');
+        const requestId = ++this.usersRequestId;
 
         loading.classList.remove('hidden');
         empty.classList.add('hidden');
-        tableBody.innerHTML = '';
+        loadMoreBtn.disabled = true;
+        if (!loadMore) {
+            tableBody.innerHTML = '';
+            pagination.classList.add('hidden');
+        }
 
         try {
-            const params = {
+            const filters = {
                 status_filter: document.getElementById('users-status-filter').value || undefined,
                 group_filter: document.getElementById('users-group-filter').value || undefined,
                 search: document.getElementById('users-search').value || undefined,
+            };
+            const params = {
+                ...filters,
                 sort_by: this.sortState.field,
                 sort_order: this.sortState.order,
+                cursor: loadMore ? this.usersCursor : undefined,
             };
 
-            const response = await API.adminListUsersEnhanced(params);
-            this.users = response.users;
+            let response;
+            if (loadMore) {
+                response = await API.adminListUsersEnhanced(params);
+            } else {
+                // The list returns one page; the total comes from the count endpoint
+                const [page, count] = await Promise.all([
+                    API.adminListUsersEnhanced(params),
+                    API.adminCountUsers(filters),
+                    // Also load groups for filter dropdown
+                    this.loadGroupsForFilter(),
+                ]);
+                response = page;
+                this.usersTotal = count.total;
+            }
+
+            // Filters or sorting changed while this page was loading
+            if (requestId !== this.usersRequestId) return;
 
-            // Also load groups for filter dropdown
-            await this.loadGroupsForFilter();
+            this.users = loadMore ? this.users.concat(response.users) : response.users;
+            this.usersCursor = response.next_cursor || null;
 
-            if (response.users.length === 0) {
+            if (this.users.length === 0) {
                 empty.classList.remove('hidden');
             } else {
-                tableBody.innerHTML = response.users.map(user => `
+                tableBody.insertAdjacentHTML('beforeend', response.users.map(user => `
                     <tr>
                         <td>${user.first_name} ${user.last_name}</td>
                         <td>${user.username}</td>
@@ -984,13 +1018,21 @@ const App = {
                             ` : ''}
                         </td>
                     </tr>
-                `).join('');
+                `).join(''));
             }
 
+            document.getElementById('users-count').textContent =
+                `Showing ${this.users.length} of ${Math.max(this.usersTotal, this.users.length)} users`;
+            pagination.classList.toggle('hidden', this.users.length === 0);
+            loadMoreBtn.classList.toggle('hidden', !this.usersCursor);
+
         } catch (error) {
             this.showStatus(error.message, 'error');
         } finally {
-            loading.classList.add('hidden');
+            if (requestId === this.usersRequestId) {
+                loading.classList.add('hidden');
+                loadMoreBtn.disabled = false;
+            }
         }
     },
 